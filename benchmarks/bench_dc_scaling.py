@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+"""
+Benchmark the scaling of the DC-resistivity methods.
+
+:class:`watex.methods.ResistivityProfiling` and
+:class:`watex.methods.VerticalSounding` are fitted object by object whereas
+:class:`watex.methods.DCProfiling` and :class:`watex.methods.DCSounding`
+fit the whole collection. The synthetic lines and soundings are streamed by
+:func:`watex.datasets.gdata.make_erp_lines` and
+:func:`watex.datasets.gdata.make_ves_soundings` outside the timings. The
+number of stations counts the |ERP| stations and the |VES| AB/2
+measurements; they are split in lines of `line_size` stations and soundings
+of `samples` measurements. The time and the peak memory traced by
+:mod:`tracemalloc` are recorded for each method and size; the peak memory is
+traced in a second run so that the tracing does not slow down the timing.
+The lines that cannot be fitted by the per-object path are counted and
+skipped.
+
+Usage::
+
+    python benchmarks/bench_dc_scaling.py [sizes] [line_size] [samples]
+
+e.g. ``python benchmarks/bench_dc_scaling.py 100,10000,1000000 100 31``
+"""
+import sys
+import time
+import tracemalloc
+import warnings
+
+from watex.datasets.gdata import make_erp_lines, make_ves_soundings
+from watex.methods import (
+    ResistivityProfiling,
+    VerticalSounding,
+    DCProfiling,
+    DCSounding,
+)
+
+
+def measure(func, *args):
+    """ Return the time in seconds, the traced peak memory in MB and the
+    result of `func`. The time is measured without tracing."""
+    t0 = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20, result
+
+
+def per_line(lines):
+    """ Per-object path: one ResistivityProfiling fit per line. Return the
+    number of lines that failed."""
+    failed = 0
+    for d in lines:
+        try:
+            ResistivityProfiling(auto=True).fit(d)
+        except Exception:
+            failed += 1
+    return failed
+
+
+def per_sounding(soundings):
+    """ Per-object path: one VerticalSounding fit per sounding."""
+    for d in soundings:
+        VerticalSounding().fit(d)
+
+
+def collection(method, frames):
+    """ Collection path: fit all the lines or soundings together."""
+    method(verbose=0).fit(*frames)
+
+
+def run(sizes=(100, 10_000, 1_000_000), line_size=100, samples=31, seed=42):
+    print(f"{'method':<22}{'stations':>10}{'objects':>9}"
+          f"{'time (s)':>11}{'peak (MB)':>11}{'failed':>8}")
+    for n in sizes:
+        n_lines = max(n // line_size, 1)
+        n_soundings = max(n // samples, 1)
+        lines = list(make_erp_lines(
+            n_lines, n_stations=min(n, line_size), noise=.05, seed=seed,
+            full_coordinates=False))
+        soundings = list(make_ves_soundings(
+            n_soundings, samples=min(n, samples), noise=.05, seed=seed))
+        cases = [
+            ('ResistivityProfiling', per_line, (lines,), n_lines),
+            ('DCProfiling', collection, (DCProfiling, lines), n_lines),
+            ('VerticalSounding', per_sounding, (soundings,), n_soundings),
+            ('DCSounding', collection, (DCSounding, soundings), n_soundings),
+        ]
+        for name, func, args, n_objects in cases:
+            elapsed, peak, failed = measure(func, *args)
+            print(f"{name:<22}{n:>10}{n_objects:>9}"
+                  f"{elapsed:>11.2f}{peak:>11.1f}{failed or 0:>8}")
+
+
+if __name__ == '__main__':
+    warnings.filterwarnings('ignore')
+    run(*[tuple(map(int, a.split(','))) if k == 0 else int(a)
+          for k, a in enumerate(sys.argv[1:4])])
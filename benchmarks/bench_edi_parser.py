@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+"""
+Benchmark the EDI data-section parser of :class:`watex.edi.Edi`.
+
+The block tokenizer used by :meth:`watex.edi.Edi._get_specific_comp` is
+compared to the former value-by-value parser on the bundled EDI files
+``data/edis``. Arrays of both parsers are asserted identical before timing.
+
+Usage::
+
+    python benchmarks/bench_edi_parser.py [edipath] [n_repeats]
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+from watex.edi import Edi
+
+
+def legacy_parse(edi):
+    """ Former parser: convert each token with ``float`` and extend lists."""
+    with open(edi.edifile, 'r', encoding='utf8') as fedi:
+        edilines = fedi.readlines()
+    comp_dict, _flag = {}, 0
+    for datalines in edilines[edi.edi_data_sectionline_:]:
+        keylines = datalines.strip()
+        if '>!' not in keylines and '>' in keylines:
+            edi_lines = keylines[1:].strip().split()
+            if edi_lines == [] or edi_lines[0] == '':
+                continue
+            compkey = edi_lines[0].lower()
+            if (compkey in edi._z_comps or compkey in edi._t_comps
+                    or compkey == 'freq' or compkey in edi._res_comps
+                    or compkey in edi._phs_comps):
+                _flag = 1
+                comp_dict[compkey] = []
+            else:
+                _flag = 0
+        elif _flag == 1 and '>' not in keylines:
+            data_lines = keylines.split()
+            for jj, data in enumerate(data_lines):
+                try:
+                    data_lines[jj] = float(data)
+                    if data_lines[jj] == 1.0e32:
+                        data_lines[jj] = .0
+                except:
+                    data_lines[jj] = 0.0
+            comp_dict[compkey].extend(data_lines)
+    return comp_dict
+
+
+def run(edipath='data/edis', n_repeats=20):
+    edifiles = sorted(os.path.join(edipath, f) for f in os.listdir(edipath)
+                      if f.endswith('.edi'))
+    edis = [Edi().fit(f) for f in edifiles]
+
+    # check the outputs before timing
+    for e in edis:
+        ref = Edi()
+        ref.edi_data_sectionline_ = e.edi_data_sectionline_
+        ref._fill_data_array(data_dict=legacy_parse(e))
+        assert np.array_equal(ref.Z._z, e.Z._z)
+        assert np.array_equal(ref.Z._z_err, e.Z._z_err)
+        assert np.array_equal(ref.Z._freq, e.Z._freq)
+
+    t0 = time.perf_counter()
+    for _ in range(n_repeats):
+        for e in edis:
+            legacy_parse(e)
+    t_legacy = time.perf_counter() - t0
+
+    # time the parsing only; the tensor filling is shared by both parsers.
+    for e in edis:
+        e._fill_data_array = lambda data_dict=None: None
+    t0 = time.perf_counter()
+    for _ in range(n_repeats):
+        for e in edis:
+            e._get_specific_comp()
+    t_fast = time.perf_counter() - t0
+
+    n = n_repeats * len(edis)
+    print(f"EDI files        : {len(edis)} x {n_repeats} repeats")
+    print(f"legacy parser    : {1e3 * t_legacy / n:.3f} ms/file")
+    print(f"block tokenizer  : {1e3 * t_fast / n:.3f} ms/file")
+
+
+if __name__ == '__main__':
+    run(*sys.argv[1:2], *map(int, sys.argv[2:3]))
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+"""
+Benchmark the survey-level impedance tensor functions.
+
+The per-object path (one :class:`watex.externals.z.Z` call per station) is
+compared to the functions of :mod:`watex.utils.exmath` working on the
+stacked tensors of shape (n_stations, n_freq, 2, 2). The EDI files of
+``data/edis`` are replicated to reach `n_stations`. Outputs of both paths
+are asserted identical before timing.
+
+Usage::
+
+    python benchmarks/bench_zcube.py [edipath] [n_stations]
+"""
+import copy
+import os
+import sys
+import time
+
+import numpy as np
+
+from watex.edi import Edi
+from watex.utils.exmath import (
+    zcube_resphase,
+    zcube_rotate,
+    zcube_det,
+    zcube_skew,
+)
+
+
+def per_object(zobjs, angle):
+    """ Former path: loop over the Z objects of the stations."""
+    res, phase, det, skw = [], [], [], []
+    for zobj in zobjs:
+        zobj.compute_resistivity_phase()
+        res.append(zobj.resistivity)
+        phase.append(zobj.phase)
+        det.append(zobj.det)
+        z = zobj.z
+        S1 = z[:, 0, 0] + z[:, 1, 1]
+        D2 = z[:, 0, 1] - z[:, 1, 0]
+        skw.append(np.abs(S1 / D2))
+    z_err = []
+    for zobj in zobjs:
+        zobj = copy.deepcopy(zobj)
+        zobj.rotate(angle)
+        z_err.append(zobj.z_err)
+    return [np.array(a) for a in (res, phase, det, skw, z_err)]
+
+
+def survey_level(z, z_err, freq, angle):
+    """ Survey-level path: one broadcast call for all the stations."""
+    res, phase, *_ = zcube_resphase(z, freq, z_err)
+    det = zcube_det(z)
+    skw, _ = zcube_skew(z)
+    _, z_err_rot = zcube_rotate(z, angle, z_err)
+    return res, phase, det, skw, z_err_rot
+
+
+def run(edipath='data/edis', n_stations=1000, angle=30.):
+    edifiles = sorted(os.path.join(edipath, f) for f in os.listdir(edipath)
+                      if f.endswith('.edi'))
+    # keep the stations sharing the same frequencies
+    zref = [Edi().fit(f).Z for f in edifiles]
+    zref = [zo for zo in zref if np.array_equal(zo.freq, zref[0].freq)]
+    zobjs = [copy.deepcopy(zref[k % len(zref)]) for k in range(n_stations)]
+    freq = zobjs[0].freq
+    z = np.array([zo.z for zo in zobjs])
+    z_err = np.array([zo.z_err for zo in zobjs])
+
+    for a, b in zip(per_object(zobjs[:50], angle),
+                    survey_level(z[:50], z_err[:50], freq, angle)):
+        np.testing.assert_array_equal(a, b)
+
+    t0 = time.perf_counter()
+    per_object(zobjs, angle)
+    t_object = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    survey_level(z, z_err, freq, angle)
+    t_survey = time.perf_counter() - t0
+
+    print(f"stations x freq  : {n_stations} x {len(freq)}")
+    print(f"per-object path  : {1e3 * t_object:.1f} ms")
+    print(f"survey-level     : {1e3 * t_survey:.1f} ms")
+    print(f"speedup          : {t_object / t_survey:.1f}x")
+
+
+if __name__ == '__main__':
+    run(*sys.argv[1:2], *map(int, sys.argv[2:3]))
@@ -63,6 +63,45 @@ class TestDatasets (unittest.TestCase) :
         self.assertEqual(set (results ), {True} )
         self.assertEqual("edi" in edi_data.columns, True )
 
+    def test_make_lines (self ): 
+        """ Test the streaming of the synthetic ERP lines and VES. """
+        import os 
+        import tempfile 
+        from watex.methods import DCProfiling 
+        lines = list (wx.datasets.make_erp_lines (
+            4, n_stations =(40, 90), shape ='W', type ='EC', seed =42 ))
+        # reproducible lines 
+        lines2 = wx.datasets.make_erp_lines (
+            4, n_stations =(40, 90), shape ='W', type ='EC', seed =42 )
+        for d, d2 in zip (lines, lines2 ): 
+            pd.testing.assert_frame_equal (d, d2 )
+        table = DCProfiling ().fit (*lines ).summary ()
+        self.assertEqual (set (table ['shape']), {'W'})
+        self.assertEqual (set (table ['type']), {'EC'})
+        
+        with tempfile.TemporaryDirectory () as tmp : 
+            files = list (wx.datasets.make_ves_soundings (
+                5, samples =(31, 60), savepath =tmp, chunksize =2, 
+                noise =.05, seed =42 ))
+            self.assertEqual (len(files), 5 )
+            self.assertEqual (sorted (os.listdir (tmp )), sorted (
+                map (os.path.basename, files )))
+    
+    def test_make_lines_types (self ): 
+        """ Test that the lines read back the requested type. """
+        from watex.utils.exmath import type_ 
+        for t in ('EC', 'CB2P', 'NC', 'PC'): 
+            for d in wx.datasets.make_erp_lines (
+                    30, n_stations =(21, 120), type =t, seed =42 ): 
+                self.assertEqual (type_ (d.resistivity.values ), t )
+        # the background cannot hold the conductive zone 
+        with self.assertRaises (ValueError ): 
+            list (wx.datasets.make_erp_lines (1, shape ='V', type ='EC'))
+        # 'PC' needs three sections of seven stations 
+        with self.assertRaises (ValueError ): 
+            list (wx.datasets.make_erp_lines (2, n_stations =(14, 40), 
+                                              type ='PC'))
+
         
        
 if __name__=='__main__':
@@ -14,6 +14,7 @@ Description:
 """
 import os
 import copy 
+import numpy as np 
 import pandas as pd 
 import  unittest 
 from watex.utils import naive_imputer
@@ -30,6 +31,7 @@ from watex.methods import (
     Logging , EM , Processing, 
    )
 from tests import  ( 
+    TEST_ROOT, 
     TEST_TEMP_DIR,  
     make_temp_dir 
     ) 
@@ -89,6 +91,82 @@ class TestElectrical (unittest.TestCase):
                                    getattr (dc_res.line1, f"{param}_")
                                    ) 
 
+    def test_DCProfiling_n_jobs (self): 
+        """ Fit the survey lines concurrently in the data order """
+        erp_data = [ make_erp( n_stations =50 , seed =s , as_frame =True) 
+                    for s in range (4) ] 
+        erp_data [1] = erp_data[1].iloc [:, :1] # invalid line 
+        dc_res = DCProfiling().fit(*erp_data )
+        for backend in ('process', 'thread'): 
+            dc_res_p = DCProfiling(n_jobs =2, backend = backend ).fit(*erp_data)
+            self.assertListEqual(list(dc_res.sves_), list(dc_res_p.sves_ ))
+            np.testing.assert_array_equal(dc_res.sfis_, dc_res_p.sfis_ )
+            self.assertEqual(len(dc_res_p.isnotvalid_), 1 )
+            
+    def test_DCProfiling_store (self): 
+        """ Read the lines lazily from a columnar store """
+        from watex.methods import ERPCollection, ERPStore 
+        erp_data = [ make_erp( n_stations =50 , seed =s , as_frame =True) 
+                    for s in range (4) ] 
+        store = ERPStore.create (make_temp_dir ('erpstore'), erp_data, 
+                                 chunksize =3 )
+        self.assertEqual (len(store ), 4 )
+        np.testing.assert_array_equal (store [2].resistivity, 
+                                       erp_data [2].resistivity )
+        dc_res = DCProfiling().fit(*erp_data )
+        dc_store = DCProfiling().fit(store.path )
+        self.assertListEqual(list(dc_res.sves_), list(dc_store.sves_ ))
+        np.testing.assert_allclose (dc_res.sfis_, dc_store.sfis_ )
+        # lines are fitted on access only 
+        self.assertNotIn ('line3', dc_store.__dict__ )
+        self.assertAlmostEqual(dc_store.line3.sfi_, dc_res.line3.sfi_ )
+        self.assertEqual (dc_store.summary ().shape, dc_res.summary().shape)
+        erpc = ERPCollection(listOferpfn= store )
+        np.testing.assert_allclose (erpc.powers, dc_res.powers_ )
+        # a failed overwrite leaves the store unchanged. 
+        from watex.exceptions import StationError 
+        with self.assertRaises (StationError ): 
+            ERPStore.create (store.path, erp_data, stations =['S10'])
+        self.assertListEqual (sorted (os.listdir (store.path )), sorted (
+            [ f'{c}.bin' for c in ERPStore.columns ] + [ERPStore.indexfile]))
+        np.testing.assert_array_equal (ERPStore (store.path )[3].resistivity, 
+                                       erp_data [3].resistivity )
+        
+    def test_DCProfiling_cache (self): 
+        """ Read the excel sheets once and the next fits from the cache """
+        tdir = make_temp_dir ('xlsxcache')
+        xlsx = os.path.join (tdir, 'lines.xlsx')
+        with pd.ExcelWriter (xlsx ) as writer: 
+            for s in range (3): 
+                make_erp( n_stations =50 , seed =s , as_frame =True 
+                         ).to_excel (writer, sheet_name =f'l{s}', index =False)
+        cachedir = os.path.join (tdir, 'cache')
+        dc_res = DCProfiling(read_sheets =True ).fit(xlsx )
+        for hits in (0, 1): 
+            dc_cache = DCProfiling(read_sheets =True, cache = cachedir 
+                                   ).fit(xlsx )
+            self.assertEqual ((dc_cache.cache_hits_, dc_cache.cache_misses_), 
+                              (hits, 1 - hits ))
+            self.assertListEqual(list(dc_res.sves_), list(dc_cache.sves_ ))
+            np.testing.assert_allclose (dc_res.sfis_, dc_cache.sfis_ )
+        self.assertEqual (len(os.listdir (cachedir )), 1 )
+        
+    def test_DCProfiling_cache_n_jobs (self): 
+        """ Count the excel cache reads of the process workers """
+        from watex.utils.coreutils import excel_cache_info 
+        tdir = make_temp_dir ('xlsxcache_jobs')
+        files = [ os.path.join (tdir, f'l{s}.xlsx') for s in range (3)]
+        for s, f in enumerate (files ): 
+            make_erp( n_stations =50 , seed =s , as_frame =True 
+                     ).to_excel (f, index =False)
+        cachedir = os.path.join (tdir, 'cache')
+        info = excel_cache_info (cachedir )
+        for _ in range (2): 
+            DCProfiling(cache = cachedir, n_jobs =2 ).fit(*files )
+        new = excel_cache_info (cachedir )
+        self.assertEqual ((new ['hits'] - info ['hits'], 
+                           new ['misses'] - info ['misses']), (3, 3 ))
+        
     def test_VerticalSounding (self): 
         """ Make test for |VES| , Compute Parameters with simple run """
         
@@ -100,6 +178,17 @@ class TestElectrical (unittest.TestCase):
         vesobj.summary(return_table= True ) 
         
         self.assertAlmostEqual(dcobj.nareas_, vesobj.nareas_ )
+        
+    def test_DCSounding_batch (self): 
+        """ Soundings on the same grid are fitted at once """
+        ves_data = [ make_ves (samples =50 , max_depth= 200 , order ='+',
+                              max_rho=1e5, seed = s).frame for s in (1, 3, 6)] 
+        dcobj = DCSounding(search = 45 ).fit(*ves_data )
+        for vesdata, site in zip (ves_data, dcobj.sites_): 
+            vesobj = VerticalSounding(search = 45 ).fit(vesdata ) 
+            self.assertAlmostEqual(vesobj.ohmic_area_ , site.ohmic_area_ , 
+                                   delta = 1e-8 * vesobj.ohmic_area_ )
+            np.testing.assert_allclose(vesobj.XYarea_, site.XYarea_ )
    
 class TestHydro (unittest.TestCase ): 
     """ Test Hydrogeological module"""
@@ -189,6 +278,57 @@ class TestEM (unittest.TestCase):
         # :func:`watex.utils.exmath.scalePosition` since the latter does not 
         # longer convert data to D:MM:SS. 
         
+    def test_parallel_read (self): 
+        """ read the EDIs concurrently and keep the lon/lat order"""
+        emobj = EM(n_jobs =2 ).fit(self.edi_data )
+        self.assertListEqual(list(emobj.edinames), list(self.emobj.edinames))
+        self.assertEqual(len(emobj.isnotvalid_), 0 )
+        
+    def test_cache (self): 
+        """ restore the EDIs from the binary cache """
+        edipath = os.path.join(TEST_ROOT, 'data/edis')
+        cachedir = make_temp_dir('edicache') 
+        emobj = EM(cache = cachedir).fit(edipath) 
+        self.assertEqual(emobj.cache_misses_, 3)
+        emobj_c = EM(cache = cachedir).fit(edipath)
+        self.assertEqual(emobj_c.cache_hits_, 3)
+        for eo, ec in zip (emobj.ediObjs_, emobj_c.ediObjs_): 
+            self.assertTrue((eo.Z.z == ec.Z.z).all())
+        
+    def test_edi_data_blocks (self): 
+        """ check the EDI data blocks conversion """
+        from watex.edi import _parse_data_blocks 
+        d = _parse_data_blocks({'freq': [' 1.5E+02  1.0E+32\n', '**\n'], 
+                                'zxxr': ['1.0E+00 -2.0E+00']})
+        self.assertListEqual(list (d['freq']), [150., 0., 0.])
+        self.assertListEqual(list (d['zxxr']), [1., -2.])
+        
+    def test_station_stack (self): 
+        """ fetch the 2D blocks from the dense tensor container """
+        from watex.methods.em import StationStack 
+        from watex.utils.exmath import get2dtensor
+        stack = StationStack.from_edis (self.emobj.ediObjs_)
+        self.assertEqual(stack.shape, (len(self.emobj.ediObjs_), 
+                                       len(self.emobj.freqs_), 2, 2))
+        for tensor, comp in (('res', 'xy'), ('phase', 'yx'), ('z_err', 'xy')): 
+            np.testing.assert_array_equal(
+                get2dtensor(self.emobj.ediObjs_, tensor=tensor, 
+                            component=comp, kind='complex'), 
+                stack.get2d(tensor + comp))
+        np.testing.assert_array_equal(self.emobj.make2d('zyx'), 
+                                      stack.get2d('zyx'))
+        self.assertEqual(len(stack[:3]), 3 )
+        
+    def test_zrotate (self): 
+        """ rotate all the tensors at once """
+        from watex.externals.zutils import rotatematrix_incl_errors
+        zobj = copy.deepcopy(self.emobj.ediObjs_[0].Z)
+        z_err = zobj.z_err.copy() 
+        zobj.rotate (30.)
+        for k in range (len(z_err)): 
+            _, err = rotatematrix_incl_errors(zobj.z[k], 30., z_err[k])
+            np.testing.assert_array_equal(zobj.z_err[k], err)
+        
     def test_getreference_frequency (self): 
         """ check the reference frequency"""
         # this is a naive approach since our EDI data used for the test 
@@ -198,6 +338,63 @@ class TestEM (unittest.TestCase):
         self.assertAlmostEqual(self.emobj.getreferencefrequency(), 
                                self.emobj.freq_array.max ()) 
         
+    def test_derived_cache (self): 
+        """ reuse the frequencies until the EDI objects change """
+        emobj = EM().fit(self.edi_data[:5])
+        f = emobj.getfullfrequency () 
+        self.assertIs(emobj.getfullfrequency (), f )
+        self.assertIs(emobj.freq_index_, emobj.freq_index_ )
+        self.assertEqual(emobj.freq_index_[f[3]], 3 )
+        np.testing.assert_array_equal(emobj.missing_mask_, 
+                                      np.isnan (emobj.make2d ('freq')))
+        emobj.fit(self.edi_data[5:7])
+        self.assertEqual(emobj.missing_mask_.shape [1], 2 )
+        self.assertIsNot(emobj.getfullfrequency (), f )
+        
+    def test_stack_invalidation (self): 
+        """ rebuild the stack when the tensors errors are reassigned """
+        emobj = EM().fit(copy.deepcopy (list(self.edi_data[:3])))
+        zobj = emobj.ediObjs_[0].Z 
+        err = emobj.make2d ('zxy_err')[0, 0]
+        stack = emobj.stack_ 
+        self.assertIs(emobj.stack_, stack )
+        zobj.z_err = zobj.z_err * 10 
+        self.assertAlmostEqual(emobj.make2d ('zxy_err')[0, 0], err * 10 )
+        # in-place edits need an explicit invalidation 
+        zobj.z_err[:] /= 10 
+        self.assertAlmostEqual(emobj.make2d ('zxy_err')[0, 0], err * 10 )
+        self.assertAlmostEqual(
+            emobj.clear_cache ().make2d ('zxy_err')[0, 0], err )
+        
+    def test_exportedis (self): 
+        """ bulk export is byte-identical to the station by station one """
+        edipath = os.path.join(TEST_ROOT, 'data/edis')
+        emobj = EM(n_jobs =2 ).fit(edipath) 
+        new_Z = [copy.deepcopy (e.Z) for e in emobj.ediObjs_]
+        new_Z[0].z[0, 0, 0] = 0. # written as the empty value 
+        single_dir = make_temp_dir('edisingle') 
+        for e, z in zip (emobj.ediObjs_, new_Z ): 
+            e.write_new_edifile(new_Z =z, savepath = single_dir ) 
+        bulk_dir = make_temp_dir('edibulk') 
+        emobj.exportedis(emobj.ediObjs_, new_Z, savepath = bulk_dir )
+        self.assertEqual(len(os.listdir (bulk_dir)), 3 )
+        for f in os.listdir (single_dir): 
+            with open (os.path.join (single_dir, f), 'rb') as fs, open (
+                    os.path.join (bulk_dir, f), 'rb') as fb: 
+                self.assertEqual(fs.read (), fb.read ())
+        # without new tensors, the edits in memory are written. 
+        from watex.edi import write_edis 
+        emobj.ediObjs_[1].Z.z[0, 0, 1] *= 2 
+        single_dir = make_temp_dir('edisingle') 
+        for e in emobj.ediObjs_: 
+            e.write_new_edifile(savepath = single_dir ) 
+        bulk_dir = make_temp_dir('edibulk') 
+        write_edis (emobj.ediObjs_, savepath = bulk_dir, n_jobs =2 )
+        for f in os.listdir (single_dir): 
+            with open (os.path.join (single_dir, f), 'rb') as fs, open (
+                    os.path.join (bulk_dir, f), 'rb') as fb: 
+                self.assertEqual(fs.read (), fb.read ())
+        
 
 class TestProcessing (unittest.TestCase): 
     # output the edis data as array_like 1d 
@@ -208,21 +405,154 @@ class TestProcessing (unittest.TestCase):
         
         self.pobj.ama () ; self.pobj.flma () ; self.pobj.ama () 
         
+    def test_tma (self): 
+        """ Trimmed-moving-average along stations and frequencies """
+        from watex.utils.exmath import trimmed_moving_average
+        pobj = Processing().fit(self.edi_data)
+        rc = pobj.tma () 
+        self.assertEqual(rc.shape, pobj.res2d_.shape ) 
+        self.assertEqual(pobj.tma (axis =0 ).shape, rc.shape )
+        ar = np.array ([[1., 5., 2., 8., 3.], [2., 2., 6., 1., 7.]])
+        # the second window is not trimmed identically on both rows 
+        np.testing.assert_allclose(
+            trimmed_moving_average (ar, window_size =3), 
+            [[1., 8/3, 5., 3., 3.], [2., 10/3, 2., 6., 7.]])
+        
+    def test_chunked_filters (self): 
+        """ Filter overlapping blocks of stations as the whole line """
+        pobj = Processing(window_size =3, c =2 ).fit(self.edi_data)
+        # skew overwrites the interpolation method 
+        sobj = Processing().fit(self.edi_data)
+        expected = [ pobj.tma (), pobj.ama (), pobj.flma (), sobj.skew ()[0] ]
+        zobjs = sobj.zrestore (method ='logf')
+        memmap_dir = make_temp_dir ('chunked')
+        for chunksize, mdir in [(1, None), (40, None ), (4, memmap_dir), 
+                                (4, memmap_dir)]: 
+            pobj.chunksize, pobj.memmap_dir = chunksize, mdir 
+            sobj.chunksize, sobj.memmap_dir = chunksize, mdir 
+            rcs = [ pobj.tma (), pobj.ama (), pobj.flma (), sobj.skew ()[0] ]
+            for rc, erc in zip (rcs, expected ): 
+                np.testing.assert_array_equal(rc, erc )
+            # the staged files are reused by the next calls. 
+            if mdir is not None: 
+                self.assertListEqual(sorted (os.listdir (memmap_dir )), 
+                                     ['phasexy.npy', 'resxy.npy', 'z.npy'])
+        for zobj, ezobj in zip (sobj.zrestore (method ='logf'), zobjs ): 
+            np.testing.assert_array_equal(zobj.z, ezobj.z )
+        # the whole line is never held in memory 
+        cobj = Processing(window_size =3, c =2, chunksize =4, 
+                          memmap_dir = memmap_dir ).fit(self.edi_data)
+        np.testing.assert_array_equal(cobj.ama (), expected [1] )
+        self.assertNotIn('_stack', cobj.__dict__ )
+        self.assertNotIn('res2d_', cobj.__dict__ )
+        
+    def test_stream_filter (self): 
+        """ Filter stations one at a time as the batch filters """
+        from watex.methods.em import StreamFilter 
+        for kind in ('tma', 'ama', 'flma'): 
+            pobj = Processing(mode ='valid').fit(self.edi_data)
+            rc = getattr (pobj, kind )() 
+            res, phs = pobj.make2d ('resxy'), pobj.make2d ('phasexy')
+            sf = StreamFilter(pobj.freqs_, kind = kind, mode ='valid', 
+                              refreq = pobj.refreq_ ) 
+            emitted = [ sf.partial_fit (res[:, ii], phs[:, ii]).emitted_ 
+                       for ii in range (res.shape [1])]
+            emitted.append (sf.close ().emitted_ ) 
+            np.testing.assert_array_equal(np.hstack (emitted ), rc )
+            
+    def test_emap_convolve (self): 
+        """ filter the whole impedance matrix as row by row convolutions """
+        from watex.methods.em import _emap_convolve, _emap_weights 
+        weights = {}
+        pobj = Processing(c =3, out ='z', weights = weights ).fit(
+            self.edi_data)
+        zjc = pobj.ama () 
+        self.assertListEqual(sorted (weights), [5, 10, 15]) 
+        zj = np.random.RandomState(0).randn(4, 20) * (1 + 2j)
+        w = [ weights [k] for k in (5, 10, 15)]
+        expected = np.array ([ np.mean ([ np.convolve (row, wk[::-1], 'same') 
+                                         for wk in w ], axis =0) 
+                              for row in zj ])
+        np.testing.assert_allclose(_emap_convolve (zj, w ), expected, 
+                                   rtol =1e-12 )
+        self.assertIs(_emap_weights (5, weights ), weights [5])
+        # only the stations near the line ends see the padding 
+        pobj.pad_mode ='edge'
+        zje = pobj.ama () 
+        np.testing.assert_array_equal(zje [:, 8:-7], zjc [:, 8:-7])
+        
     def test_qc (self): 
         """ Compute the quality control """ 
         
         c, _ = self.pobj.qc ( tol = .6 )
         print(f"QC= {c * 100}%"  ) 
         
+    def test_qc_report (self): 
+        """ Compute the quality control report by chunks of stations """
+        from watex.utils.exmath import qc_report 
+        report = self.pobj.qc_report (tol =.6 ) 
+        self.assertEqual(round (report.rate_, 2), self.pobj.qc (
+            tol =.6, return_ratio =True ))
+        chunked = self.pobj.qc_report (tol =.6, chunksize =2 ) 
+        for attr in ('station_completeness_', 'freq_completeness_', 
+                     'station_error_', 'outliers_'): 
+            np.testing.assert_array_equal(getattr (report, attr ), 
+                                          getattr (chunked, attr ))
+        res = np.full ((4, 10), 100. ) ; res [:, 4:6] = np.nan 
+        res [0, :2] = np.nan ; res [1, 8] = 1e4 
+        r = qc_report (res, freq = np.logspace (3, 0, 10 ), chunksize =3 ) 
+        np.testing.assert_allclose(r.deadband_, np.logspace (3, 0, 10)[[4, 5]])
+        self.assertListEqual(np.argwhere (r.outliers_).tolist (), [[1, 8]])
+        
     def test_zrestore (self): 
         """ Restore Impedance data """
         self.pobj.zrestore () 
         
+    def test_zcube_interpolate (self): 
+        """ Resample the tensors of all stations in log-frequency """
+        from watex.utils.exmath import zcube_interpolate 
+        stack = self.pobj.stack_ 
+        nfreq = np.logspace (4.5, 0.5, 30 )
+        z, z_err = zcube_interpolate(stack.z, stack.freq, nfreq, stack.z_err)
+        for zs, m in zip (stack.z, stack.mask ): 
+            x = np.log10 (stack.freq [m])[::-1]
+            np.testing.assert_allclose(
+                zcube_interpolate(zs[None], stack.freq, nfreq)[0][0, :, 0, 1],
+                np.interp (np.log10 (nfreq), x, zs [m, 0, 1][::-1].real, 
+                           left =np.nan, right = np.nan) + 1j * np.interp (
+                    np.log10 (nfreq), x, zs [m, 0, 1][::-1].imag, 
+                    left =np.nan, right = np.nan)
+                )
+        zb, _ = zcube_interpolate(stack.z, stack.freq, nfreq, 
+                                  period_buffer =1.01 ) 
+        self.assertGreater(np.isnan (zb).sum (), np.isnan (z).sum ())
+        zobjs = self.pobj.zrestore (method ='logf') 
+        self.assertEqual(zobjs[0].z.shape, self.pobj.zrestore ()[0].z.shape)
+        self.assertFalse(np.isnan (zobjs [0].z ).any ())
+        
     def test_skew (self ): 
         
         for meth in ("swift", 'bahr'): 
             self.pobj.skew (method =meth) 
             
+    def test_zcube (self): 
+        """ compute tensors of all stations at once """
+        from watex.utils.exmath import zcube_resphase, zcube_det
+        stack = self.pobj.stack_ 
+        res, *_ , phase_err = zcube_resphase(stack.z, stack.freq, stack.z_err)
+        zobj = copy.deepcopy(self.pobj.ediObjs_[0].Z)
+        zobj.compute_resistivity_phase()
+        np.testing.assert_array_equal(res[0][stack.mask[0]], zobj.resistivity)
+        np.testing.assert_array_equal(phase_err[0][stack.mask[0]], 
+                                      zobj.phase_err)
+        np.testing.assert_array_equal(
+            zcube_det(stack.z)[0][stack.mask[0]], zobj.det)
+        np.testing.assert_array_equal(
+            self.pobj.make2d('zyx', zcube = stack.z), 
+            self.pobj.make2d('zyx'))
+        skw, mu = self.pobj.skew (zcube = stack.z )
+        np.testing.assert_array_equal(skw, self.pobj.skew()[0])
+            
             
 def compare_diff_files(refout, refexp):
     """
@@ -56,5 +56,17 @@ class TestLocation (unittest.TestCase ):
         self.assertEqual (len(xx), len(x)) 
         self.assertEqual (len(yy), len(xx ))
         
+    def test_to_latlon_in (self ) : 
+        """ project the arrays at once and go back to latlon """ 
+        import numpy as np 
+        from watex.utils.gistools import ll_to_utm 
+        xx , yy = self.loc.to_utm_in(y, x,  )
+        for k, (la, lo) in enumerate (zip (y, x)): 
+            _, e, n = ll_to_utm (23, la, lo )
+            self.assertEqual ((xx[k], yy[k]), (e, n ))
+        lats, lons = self.loc.to_latlon_in(xx, yy, utm_zone ='49R')
+        np.testing.assert_allclose (lats, y ) 
+        np.testing.assert_allclose (lons, x ) 
+        
 # if __name__=='__main__': 
 #     TestProfile ().test_make_coordinates() 
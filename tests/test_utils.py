@@ -39,6 +39,13 @@ from watex.utils.mlutils import (
 from watex.utils.funcutils import ( 
     shrunkformat )
 
+_PARENT_PID = os.getpid () 
+
+def _double_or_exit (x ): 
+    """ Kill the process worker at the item 30 to break the pool. """
+    if x ==30 and os.getpid () != _PARENT_PID: 
+        os._exit (1 )
+    return 2 * x 
 
 class TestTools(unittest.TestCase):
     """
@@ -126,6 +133,151 @@ class TestTools(unittest.TestCase):
                     self.assertEqual(len(col), len(PREFIX),
                         f'The length of data columns={col}  is '
                         f' different from the expected length ={len(PREFIX)}.')
+                    
+    def test_interpolate2d (self): 
+        """ Fill the missing values of the whole array at once """
+        from watex.utils.exmath import interpolate2d 
+        arr = np.random.randn (37, 7) 
+        arr [[0, 3, 3, 4, 12, 36], [1, 1, 2, 2, 5, 6]] = np.nan 
+        for method in ('slinear', 'linear', 'nearest', 'cubic'): 
+            # 'limit' keyword interpolates column by column with pandas. 
+            np.testing.assert_array_equal(
+                interpolate2d(arr, method), 
+                interpolate2d(arr, method, limit =None ))
+        arr3d = np.stack ([arr.T, arr.T ], axis = 2 ) 
+        arr3d = interpolate2d(arr3d, axis =1 ) 
+        self.assertEqual(arr3d.shape, (7, 37, 2) )
+        np.testing.assert_array_equal(arr3d [..., 1].T, interpolate2d(arr))
+        
+    def test_type_ (self): 
+        """ Read the type from the status of the sections of 7 stations """
+        from watex.utils.exmath import type_ 
+        from watex.utils.coreutils import _batch_type 
+        # wide ('yes') and narrow ('no') sections of seven stations 
+        y = [1., .8, .6, .45, .6, .8, 1.]
+        n = [.6, .8, 1., .45, 1., .8, .6]
+        for sections, expected in [ 
+                ([y, y, y], 'EC'), ([n, n], 'NC'), 
+                ([y, y, n, n], 'CB2P'), ([n, y, y], 'CB2P'), ([y, n], 'CB2P'), 
+                ([y, n, y], 'PC'), ([n, y, n, n], 'PC'), ([y, n, n, y], 'PC')
+                ]: 
+            erp = np.hstack (sections ) 
+            self.assertEqual (type_ (erp ), expected )
+            self.assertEqual (_batch_type (erp [None], [len(erp)])[0], 
+                              expected )
+        
+    def test_ohmicArea (self): 
+        """ Exact polynomial integration gives the quadrature area """
+        from watex.datasets import make_ves 
+        from watex.utils.exmath import ohmicArea 
+        data = make_ves (samples =50 , max_depth= 200 , order ='+',
+                         max_rho=1e5, seed = 1).frame 
+        (ohms, err, roots), *_ = ohmicArea(data, search =45 ) 
+        (ohmsq, errq, rootsq), *_ = ohmicArea(data, search =45 , 
+                                           integration ='quad') 
+        np.testing.assert_array_equal(roots, rootsq )
+        np.testing.assert_allclose(ohms, ohmsq , rtol =1e-10 )
+        self.assertEqual(len(roots), 4 ) # two fractured zones 
+        self.assertTrue ((err < 1e-12 * ohms ).all())
+        
+    def test_ohmicAreaBatch (self): 
+        """ Pseudo-areas of many soundings at once as one by one """
+        from watex.datasets import make_ves 
+        from watex.utils.exmath import ohmicArea, ohmicAreaBatch 
+        frames = [ make_ves (samples =50 , max_depth= 200 , order ='+',
+                             max_rho=1e5, seed = s).frame for s in (1, 3, 6)]
+        ohms, err, roots = ohmicAreaBatch(frames[0].AB, np.vstack ([
+            f.resistivity for f in frames]), search = [45, 45, 60])
+        for k, (f, search) in enumerate (zip (frames, [45, 45, 60])): 
+            (ohmsk, errk, rootsk), *_ = ohmicArea(f, search = search ) 
+            np.testing.assert_allclose(ohms [k, :len(ohmsk)], ohmsk, 
+                                       rtol =1e-10 )
+            np.testing.assert_array_equal(roots [k, :len(rootsk)], rootsk )
+        # soundings on different grids 
+        ohms = ohmicAreaBatch([ f.AB [k:] for k, f in enumerate (frames)], 
+                              [ f.resistivity [k:] for k, f in enumerate (
+                                  frames)], sum =True )[0]
+        self.assertEqual(ohms.shape, (3, ))
+        
+    def test_sfiBatch (self): 
+        """ Score many conductive zones at once """
+        from watex.utils.exmath import sfi, sfiBatch 
+        rang = np.random.RandomState (42)
+        czs = np.abs (rang.randn (50, 7)) * 1e2 
+        sfis = sfiBatch (czs, dipolelength =5. )
+        for cz, v in zip (czs, sfis ): 
+            vs = sfi (cz, dipolelength =5. ) 
+            if np.size (vs) ==0 : 
+                self.assertTrue (np.isnan (v))
+            else: 
+                self.assertAlmostEqual(float (np.ravel (vs)[0]), v )
+        
+    def test_erpBatchFit (self): 
+        """ Fit several lines at once as line by line """
+        import warnings 
+        from watex.methods import ResistivityProfiling 
+        from watex.utils.coreutils import erpBatchFit 
+        rang = np.random.RandomState (42)
+        erps = [ np.abs (rang.randn (n)) * 1e2 for n in (13, 36, 21, 7)] 
+        stations = ['S5', None, 'S18', 'S40']
+        with warnings.catch_warnings(): 
+            warnings.simplefilter('ignore')
+            table = erpBatchFit (erps, stations = stations )
+            for k, (erp, st) in enumerate (zip (erps[:3], stations )): 
+                d = pd.DataFrame (dict (station = np.arange (len(erp)) * 10., 
+                                        resistivity = erp ))
+                erpo = ResistivityProfiling(station = st, auto = st is None 
+                                            ).fit(d)
+                self.assertEqual (table['station'][k], erpo.sves_ )
+                self.assertEqual (table['shape'][k], erpo.shape_ )
+                self.assertEqual (table['type'][k], erpo.type_ )
+                np.testing.assert_allclose(
+                    table.loc [table.index [k], ['power', 'magnitude', 'sfi']
+                               ].astype (float), np.ravel([
+                        erpo.power_, erpo.magnitude_, erpo.sfi_]))
+        # station 'S40' is out of the last line. 
+        self.assertTrue (table.iloc [-1].isna().all())
+        # the workers options are kept as no-ops. 
+        with self.assertWarns (FutureWarning ): 
+            pd.testing.assert_frame_equal (erpBatchFit (
+                erps, stations = stations, n_jobs =2 ), table )
+        
+    def test_rankConductiveZones (self): 
+        """ Rank the conductive zones of a line as the scalar functions """
+        from watex.utils.coreutils import rankConductiveZones 
+        from watex.utils.exmath import shape, type_ 
+        erp = np.abs (np.random.RandomState (7).randn (300)) * 1e2 
+        ranks = rankConductiveZones (erp, top_k = None )
+        self.assertTrue ((np.diff (ranks.score ) <= 0 ).all())
+        for _, row in ranks.iterrows (): 
+            p = int (row.station [1:])
+            cz = erp [max (p - 3, 0): p + 4 ]
+            self.assertEqual (erp [p], cz.min ())
+            self.assertAlmostEqual (row.magnitude, cz.max () - cz.min ())
+            self.assertEqual (row.power, (len(cz) - 1) * 10. )
+            if len(cz) ==7: 
+                self.assertEqual (row['shape'], shape (cz ))
+                self.assertEqual (row['type'], type_ (cz ))
+        # the zones covering a restricted station are discarded. 
+        best = ranks.station.iloc [0] 
+        franks = rankConductiveZones (erp, top_k = 5, constr = [best ])
+        self.assertEqual (len(franks ), 5 )
+        pos = franks.station.str [1:].astype (int )
+        self.assertTrue ((np.abs (pos - int (best [1:])) > 3 ).all())
+        # opt-in ranking of the smart detector 
+        from watex.utils.coreutils import erpSmartDetector 
+        self.assertListEqual (erpSmartDetector ([best], erp, top_k =5 ), 
+                              list (franks.station ))
+        
+    def test_run_parallel (self): 
+        """ Rerun only the missing items when the process pool breaks """
+        from watex.utils.funcutils import run_parallel 
+        calls = [] 
+        with self.assertWarns (UserWarning ): 
+            results = run_parallel (_double_or_exit, range (40), n_jobs =2, 
+                                    callback = lambda : calls.append (1 ))
+        self.assertListEqual (results, [ 2 * x for x in range (40)])
+        self.assertEqual (len(calls ), 40 )
 
 # if __name__=='__main__': 
 
@@ -17,6 +17,8 @@ from .sets import (
     load_edis,
     make_erp , 
     make_ves, 
+    make_erp_lines, 
+    make_ves_soundings, 
     DATASET
     )
 
@@ -33,5 +35,7 @@ __all__=[
          "load_edis",
          "make_erp" , 
          "make_ves", 
+         "make_erp_lines", 
+         "make_ves_soundings", 
          "DATASET"
          ]
\ No newline at end of file
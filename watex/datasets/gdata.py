@@ -3,14 +3,16 @@
 #   Author: LKouadio 
 
 from __future__ import annotations 
+import os 
 import numpy as np 
 import pandas as pd 
 from ..utils.coreutils import  makeCoords 
 from ..utils.gistools import ll_to_utm
-from ..utils.exmath import fitfunc
+from ..utils.exmath import fitfunc, _type_mechanism
 from ..utils.box import Boxspace 
+from .._typing import List, Tuple 
 
-__all__ =["make_erp", "make_ves"] 
+__all__ =["make_erp", "make_ves", "make_erp_lines", "make_ves_soundings"] 
 
 def make_erp (
     *, 
@@ -121,10 +123,7 @@ def make_erp (
     easting = np.zeros_like(rlons) ; northing = np.zeros_like(rlats) 
     
     if full_coordinates: 
-        en = [ll_to_utm (23 , lat , lon ) 
-         for lat, lon in zip (rlats, rlons)]
-        
-        _, easting , northing = zip (*en) 
+        _, easting , northing = ll_to_utm (23 , rlats , rlons ) 
  
     d = {
         "station": stations, 
@@ -263,10 +262,347 @@ def _generate_ABMN_samples (
         else: 
             s = [v* threshold_multiplicator / 10 for i in range (
                 indexes[ii -1], indexes[ii])] if kind=="MN" else  list( 
-                    np.arange (0, nsam[ii-1] * v, v ) + s[-1] + fixed_values[ii-1]) 
+                    np.arange (nsam[ii-1]) * v  + s[-1] + fixed_values[ii-1]) 
         
         MN.extend (s)
         
     return np.around (MN, 1 )   
+
+def make_erp_lines (
+    n_lines:int= 10, 
+    *, 
+    n_stations:int|Tuple[int, int]= 42, 
+    max_rho:float= 1e3 , 
+    min_rho:float= 1e0, 
+    step:float=20., 
+    shape:str|List[str]=None, 
+    type:str|List[str]=None, 
+    noise:float=0., 
+    reflong:float|str='110:29:09.00', 
+    reflat:float|str='26:03:05.00' , 
+    utm_zone:str='29N', 
+    full_coordinates:bool=True, 
+    raise_warning:bool=False,
+    savepath:str=None, 
+    chunksize:int=100, 
+    prefix:str='erp', 
+    seed:int=None, 
+    **coord_kws
+    ): 
+    r""" Stream many synthetic Electrical Resistivity Profiling (ERP) lines. 
+    
+    Unlike :func:`make_erp`, the lines are generated one after another so 
+    that arbitrarily many lines can be produced with a bounded memory. Each 
+    line is composed of a background built block of seven stations following 
+    the anomaly `type` definition of :func:`~watex.utils.exmath.type_` 
+    where a conductive zone of the given `shape` is inserted. The anomaly 
+    holds the lowest resistivity of the line, so it is the drilling point 
+    found by the naive auto-detection. 
+    
+    Parameters 
+    -----------
+    n_lines: int, default=10 
+        number of lines to generate. 
+    n_stations: int or tuple of (low, high), default=42 
+        number of measurements stations per line. If a tuple is given, the 
+        number of stations of each line is drawn within [low, high]. 
+    max_rho: float, default=1e3 
+        maximum resistivity value on the survey area in :math:`\Omega.m`
+    min_rho: float, default=1e0 
+        minimum resistivity value on the survey area  in :math:`\Omega.m`
+    step: float, default=20 
+        Offset or the distance of seperation between different sites in meters. 
+    shape: str or list of str, Optional  
+        shape of the conductive zone among ``V``, ``W``, ``K``, ``U``, ``H``, 
+        ``C`` and ``M``. If a list is given, the shape of each line is drawn 
+        within. ``None`` draws within all the shapes. 
+    type: str or list of str, Optional 
+        type of the background among ``EC``, ``CB2P``, ``NC`` and ``PC``. 
+        The background blocks are either wide (``EC``), narrow (``NC``), 
+        wide then narrow (``CB2P``) or mixed at random (``PC``). ``None`` 
+        draws within all the types. The type read on the line also counts 
+        the conductive zone: ``W``, ``U`` and ``H`` zones are wide whereas 
+        ``V``, ``K``, ``C`` and ``M`` are narrow. So ``EC`` is only drawn 
+        with a wide zone and ``NC`` with a narrow one. ``CB2P`` needs 
+        at least 14 stations and ``PC`` 21; requesting them on shorter lines 
+        raises an error whereas ``None`` draws within the types the line 
+        can hold. 
+    noise: float, default=0. 
+        Relative level of the gaussian noise applied to the resistivity. Note 
+        that a strong noise can alter the `shape` and `type` of the line. 
+    reflong, reflat, utm_zone, full_coordinates, raise_warning: 
+        coordinates arguments of each line. Refer to :func:`make_erp`. 
+    savepath: str, Optional 
+        Directory where the lines are written as CSV files. If given, the 
+        lines are written by chunks of `chunksize` lines and the generator 
+        yields the paths of the written files instead of the frames. 
+    chunksize: int, default=100 
+        number of lines held in memory before being written to `savepath`. 
+    prefix: str, default='erp' 
+        prefix of the line names and files written to `savepath`. 
+    seed: int, Optional,
+        It allows reproducing the same lines. Each line gets its own seed 
+        drawn from `seed`. 
+    coord_kws: dict, 
+        Additional keywords passed to :func:`~watex.utils.coreutils.makeCoords`. 
+        
+    Yields 
+    -------- 
+    (pd.Dataframe | str ) 
+        Frame of each line or the path of the written file if `savepath` is 
+        given. 
+    
+    Examples 
+    ----------
+    >>> from watex.datasets.gdata import make_erp_lines 
+    >>> from watex.methods import DCProfiling 
+    >>> lines = make_erp_lines (3, n_stations =70, shape ='W', type ='EC', 
+    ...                         seed =42 ) 
+    >>> dcc = DCProfiling().fit (*lines ) 
+    >>> dcc.line1.shape_ , dcc.line1.type_ 
+    ('W', 'EC')
+    
+    The lines can be streamed straight into a columnar store: 
+        
+    >>> from watex.methods import ERPStore 
+    >>> store = ERPStore.create ('erpstore', make_erp_lines (
+    ...     1000, n_stations =(50, 200), seed =42 ))
+    """
+    shapes = _check_choices(shape, _ANOMALY_SHAPES, 'shape')
+    types = _check_choices(type, _BACKGROUND_TYPES, 'type')
+    if not any (_type_choices (s, types ) for s in shapes ): 
+        raise ValueError (f"Type {'/'.join (types)} cannot hold the shape"
+                          f" {'/'.join (shapes)}. 'EC' needs a wide"
+                          " conductive zone (W, U, H) and 'NC' a narrow one"
+                          " (V, K, C, M).")
+    shapes = [s for s in shapes if _type_choices (s, types )]
+    if type is not None: 
+        n_min = min (n_stations ) if isinstance (
+            n_stations, (tuple, list)) else int (n_stations )
+        short = [t for t in types if n_min < _TYPE_MIN_STATIONS.get (t, 0)]
+        if short: 
+            raise ValueError (f"Type {'/'.join (short)} needs at least"
+                              f" {max (_TYPE_MIN_STATIONS [t] for t in short)}"
+                              f" stations. Got lines of {n_min} stations.")
+    rng = np.random.RandomState(seed )
+    width = len(str(n_lines)) 
+    chunk =[]
+    
+    for k in range (n_lines ): 
+        r = np.random.RandomState (rng.randint(np.iinfo(np.int32).max))
+        n = ( r.randint (n_stations[0], n_stations[1] +1 ) if isinstance (
+            n_stations, (tuple, list)) else int (n_stations) )
+        d = make_erp (n_stations = n, step = step, reflong = reflong, 
+                      reflat= reflat, utm_zone = utm_zone, 
+                      full_coordinates= full_coordinates, 
+                      raise_warning= raise_warning, as_frame =True, 
+                      **coord_kws ) 
+        shape_ = r.choice (shapes )
+        rho = _make_erp_anomaly (n, shape_, r.choice (_type_choices (
+            shape_, types, n )), r )
+        if noise: 
+            rho = np.abs (rho * (1 + noise * r.standard_normal (n)))
+        d['resistivity'] = min_rho + rho * ( max_rho - min_rho ) 
+        if savepath is None: 
+            yield d 
+            continue 
+        chunk.append ((f'{prefix}_line{k+1:0{width}}', d))
+        if len(chunk) >= chunksize or k == n_lines -1: 
+            yield from _write_chunk (chunk, savepath )
+            
+def make_ves_soundings (
+    n_soundings:int= 10, 
+    *, 
+    samples:int|Tuple[int, int]= 31, 
+    min_rho:float=1e1, 
+    max_rho:float= 1e3, 
+    max_depth:float= 100., 
+    order:str=None, 
+    noise:float=0., 
+    iorder:float=3, 
+    savepath:str=None, 
+    chunksize:int=100, 
+    prefix:str='ves', 
+    seed:int=None, 
+    ): 
+    r""" Stream many synthetic Vertical Electrical Sounding (VES) data. 
+    
+    The soundings are generated one after another with :func:`make_ves` so 
+    that arbitrarily many soundings can be produced with a bounded memory. 
+    
+    Parameters 
+    -----------
+    n_soundings: int, default=10 
+        number of soundings to generate. 
+    samples: int or tuple of (low, high), default=31 
+        number of measurements depth AB/2 per sounding. If a tuple is given, 
+        the number of measurements of each sounding is drawn within 
+        [low, high]. 
+    min_rho, max_rho, max_depth, iorder: 
+        arguments of each sounding. Refer to :func:`make_ves`. 
+    order: str, Optional  
+        ``+`` or ``-`` for resistivity increasing or decreasing in deeper. 
+        ``None`` draws the order of each sounding. 
+    noise: float, default=0. 
+        Relative level of the gaussian noise applied to the resistivity. 
+    savepath: str, Optional 
+        Directory where the soundings are written as CSV files. If given, the 
+        soundings are written by chunks of `chunksize` soundings and the 
+        generator yields the paths of the written files instead of the frames. 
+    chunksize: int, default=100 
+        number of soundings held in memory before being written to `savepath`. 
+    prefix: str, default='ves' 
+        prefix of the sounding names and files written to `savepath`. 
+    seed: int, Optional,
+        It allows reproducing the same soundings. Each sounding gets its own 
+        seed drawn from `seed`. 
+        
+    Yields 
+    -------- 
+    (pd.Dataframe | str ) 
+        Frame of each sounding or the path of the written file if `savepath` 
+        is given. 
+    
+    Examples 
+    ----------
+    >>> from watex.datasets.gdata import make_ves_soundings 
+    >>> from watex.methods import DCSounding 
+    >>> files = list (make_ves_soundings (20, samples = (31, 50), 
+    ...                                   savepath ='vesdata', seed =42 ))
+    >>> dcs = DCSounding().fit ('vesdata')
+    >>> dcs.nsites_
+    20
+    """
+    if order is not None and str(order) not in ('+', '-'): 
+        raise ValueError (f"order expects '+' or '-'. Got {order!r}.")
+    rng = np.random.RandomState(seed )
+    width = len(str(n_soundings)) 
+    chunk =[]
+    
+    for k in range (n_soundings ): 
+        r = np.random.RandomState (rng.randint(np.iinfo(np.int32).max))
+        n = ( r.randint (samples[0], samples[1] +1 ) if isinstance (
+            samples, (tuple, list)) else int (samples) )
+        d = make_ves (samples = n, min_rho = min_rho, max_rho = max_rho, 
+                      max_depth = max_depth, 
+                      order = order or r.choice (['+', '-']), as_frame =True, 
+                      seed = r.randint(np.iinfo(np.int32).max), 
+                      iorder = iorder ) 
+        if noise: 
+            d['resistivity'] = np.abs (d.resistivity * (
+                1 + noise * r.standard_normal (n)))
+        if savepath is None: 
+            yield d 
+            continue 
+        chunk.append ((f'{prefix}_sounding{k+1:0{width}}', d))
+        if len(chunk) >= chunksize or k == n_soundings -1: 
+            yield from _write_chunk (chunk, savepath )
+            
+# Conductive zones of seven stations. The lowest value at the middle is the 
+# drilling point; each template is read with its name by `exmath.shape`. 
+_ANOMALY_SHAPES = {
+    'V': [1., .3, .6, .05, .4, .2, .25],
+    'W': [1., .3, .6, .05, .6, .3, 1.],
+    'K': [1., .3, .6, .05, .3, .2, .1],
+    'U': [1., .9, .2, .05, .2, .9, 1.],
+    'H': [1., .3, .6, .05, .5, .8, 1.],
+    'C': [1., .9, .8, .05, .3, .2, .1],
+    'M': [.2, .8, .5, .05, .6, .9, .15],
+    }
+# Background blocks of seven stations: the wide block is read as 'yes' and 
+# the narrow one as 'no' by `exmath._type_mechanism`. 
+_BACKGROUND_BLOCKS = {
+    'yes': [1., .8, .6, .45, .6, .8, 1.], 
+    'no': [.6, .8, 1., .45, 1., .8, .6], 
+    }
+_BACKGROUND_TYPES = ('EC', 'CB2P', 'NC', 'PC')
+# Status of the conductive zones: 'W', 'U' and 'H' are wide ('yes'). 
+_SHAPE_STATUS = {k: _type_mechanism (np.array (v))[0] 
+                 for k, v in _ANOMALY_SHAPES.items ()}
+
+# Lines shorter than 14 stations hold a single section of 7 to 13 stations 
+# so 'CB2P' needs two sections and 'PC' three. 
+_TYPE_MIN_STATIONS = {'CB2P': 14, 'PC': 21 }
+
+def _type_choices (shape, types, n =None ): 
+    """ Types of the background that can hold the conductive zone `shape` 
+    on a line of `n` stations. 
+    
+    The section of the conductive zone is read with the status of the shape 
+    so 'EC' needs a wide zone and 'NC' a narrow one. 
+    """
+    status = _SHAPE_STATUS [shape ]
+    return [t for t in types if not (
+        ( t =='EC' and status =='no') or (t =='NC' and status =='yes') or (
+            n is not None and n < _TYPE_MIN_STATIONS.get (t, 0 )))]
+
+def _check_choices (value, choices, name ): 
+    """ Isolated part to assert the shapes and types of the lines. """
+    if value is None: 
+        return list (choices )
+    value = [value] if isinstance (value, str) else list (value )
+    value = [str(v).upper() for v in value ]
+    for v in value: 
+        if v not in choices: 
+            raise ValueError (f"Unknown {name} {v!r}. Expect"
+                              f" {', '.join (choices)}.")
+    return value 
+
+def _make_erp_anomaly (n, shape, type, rs ): 
+    """ Isolated part for 'ERP' lines generating. 
+    
+    Build the background of the `type` on the sections read by 
+    :func:`~watex.utils.exmath.type_` and insert the conductive zone of the 
+    `shape` in a section drawn at random among the sections with the same 
+    status as the shape. Beyond seven stations, a section is extended by a 
+    slowly decreasing tail so that its status is kept. Values are in [0, 1]. 
+    The line must be long enough for the `type`. Refer to 
+    :func:`_type_choices`. 
+    """
+    k = n // 7 
+    if k ==0 : 
+        lengths = np.array ([n ])
+    elif n % k ==0: 
+        lengths = np.full (k, n // k )
+    else : 
+        lengths = np.array ([7] * (k -1) + [n - 7 * (k -1)])
+    ns = len(lengths )
+    wide = _SHAPE_STATUS [shape] =='yes' 
+    if type =='EC': 
+        status = np.ones (ns, dtype = bool )
+    elif type =='NC': 
+        status = np.zeros (ns, dtype = bool )
+    elif type =='CB2P': 
+        # wide then narrow or the reverse, split at random. 
+        status = np.arange (ns) < rs.randint (1, ns )
+        if rs.rand () < .5 : status = ~status 
+    else: 
+        # a wide-narrow-wide or narrow-wide-narrow run keeps the sections 
+        # mixed whatever the other statuses drawn at random. 
+        status = rs.rand (ns) < .5 
+        i = rs.randint (ns - 2 )
+        status [i: i +3] = [True, False, True] if rs.rand () < .5 else [
+            False, True, False]
+    blocks = np.where (status [:, None], _BACKGROUND_BLOCKS['yes'], 
+                       _BACKGROUND_BLOCKS['no'])
+    # scale the blocks so the background stays over the conductive zone. 
+    blocks = .3 + .7 * blocks * rs.uniform (.7, 1., (ns, 1 ))
+    if n >= 7 : 
+        blocks[rs.choice (np.where (status == wide )[0])] = _ANOMALY_SHAPES [
+            shape] 
+        
+    sec = np.repeat (np.arange (ns ), lengths )
+    j = np.arange (n ) - np.repeat (np.cumsum (lengths ) - lengths, lengths ) 
+    return np.where (j < 7, blocks [sec, np.minimum (j, 6 )], 
+                     blocks [sec, 6] * .99 ** np.maximum (j - 6, 0 ))
+
+def _write_chunk (chunk, savepath ): 
+    """ Write the named frames of the chunk to CSV files and release them. """
+    os.makedirs (savepath, exist_ok =True )
+    for name, d in chunk: 
+        f = os.path.join (savepath, f'{name}.csv')
+        d.to_csv (f, index =False )
+        yield f 
+    chunk.clear () 
     
     
@@ -34,7 +34,9 @@ from .dload import (
     ) 
 from .gdata import ( 
     make_erp , 
-    make_ves 
+    make_ves, 
+    make_erp_lines, 
+    make_ves_soundings 
     )
 try : 
     from ._config import _fetch_data
@@ -57,6 +59,8 @@ __all__=[
          "load_edis",
          "make_erp" , 
          "make_ves", 
+         "make_erp_lines", 
+         "make_ves_soundings", 
          "DATASET"
          ]
 
@@ -11,6 +11,7 @@ for easy access. :term:`Edi` is outputted  following the :term:`SEG` documentati
 from __future__ import annotations 
 import os
 import re
+import itertools
 import warnings
 import datetime
 import shutil
@@ -26,6 +27,7 @@ from .externals.z import Z, Tipper
 from .utils.funcutils import ( 
     cpath, 
     interp_import, 
+    run_parallel, 
     spi, 
     strip_item
     )
@@ -49,7 +51,7 @@ from .site import  Location
 
 _logger = watexlog.get_watex_logger(__name__)
 
-__all__=["Edi"]
+__all__=["Edi", "write_edis"]
 
 
 class Edi : 
@@ -145,6 +147,15 @@ class Edi :
         if edifile is not None :
             self.edifile = edifile 
         #---> read each section and populate attribute 
+        self._read_sections() 
+        #read data section 
+        self._get_specific_comp(edifile = self.edifile
+                                ) 
+        return self 
+    
+    def _read_sections (self ): 
+        """ Read the head, info, define measurement and MT/EMAP sections 
+        of the EDI-file and populate the attributes. """
         IsEdi._assert_edi(self.edifile) 
         self.Head = Head.get_header_list_from_edi(edi_fn=self.edifile )
         self.Info = Info.get_info_list_from_edi(edi_fn=self.edifile)   
@@ -154,9 +165,7 @@ class Edi :
         self.MTEMAP = MTEMAP.get_mtemap_section_list(edi_fn= self.edifile )
         
         self.edi_data_sectionline_ = MTEMAP.start_data_lines_num
-        #read data section 
-        self._get_specific_comp(edifile = self.edifile
-                                ) 
+        
         return self 
     
     def __repr__ (self ): 
@@ -201,41 +210,32 @@ class Edi :
         IsEdi._assert_edi(self.edifile, deep= False ) 
 
         with open (self.edifile, 'r', encoding ='utf8')  as fedi : 
-            edilines =fedi.readlines()
+            editext =fedi.read()
         #get all data section of edi     
-        edi_data_section =edilines [self.edi_data_sectionline_ :] 
+        edi_data_section =editext.split('\n', self.edi_data_sectionline_)[-1]
             
-        # read data section and and put data on list of dict. 
-        self.comp_dict , _flag={}, 0 
-        
-        for ii, datalines in enumerate (edi_data_section) : 
-            keylines =datalines.strip()
-            if '>!' not in keylines and '>' in keylines :
-                edi_lines = keylines[1:].strip().split() # out the '>
-                if edi_lines==[] or edi_lines[0] ==''or edi_lines[0] ==None :
-                    continue # these assement to be sure that we met a none line  
-                compkey =edi_lines[0].lower()
+        # split the data section at each '>' key then tokenize each 
+        # block at once rather than converting the values one by one. 
+        blocks , compkey ={}, None  
+        
+        for chunk in edi_data_section.split('>')[1:]: 
+            keyline, _, datalines = chunk.partition('\n')
+            keyline = keyline.strip() 
+            # comment line '>!' and empty key line '>' keep the current block
+            if not keyline.startswith('!') and keyline.split() !=[]:
+                compkey =keyline.split()[0].lower()
                 if compkey in self._z_comps or compkey in self._t_comps or\
                     compkey =='freq' or compkey in self._res_comps or\
                         compkey in self._phs_comps: 
-                    _flag =1                # turn on to find data 
-                    # create dict of key and ready to fill value on list
-                    self.comp_dict [compkey]=[]  
+                    # create dict of key and ready to collect the block data 
+                    blocks [compkey]=[]  
                 # turn off to find data     
-                else : _flag = 0             
+                else : compkey = None  
             
-            elif _flag ==1 and (keylines.find('>!') < 0 
-                                or keylines.find('>') < 0 ): 
-                data_lines =keylines.strip().split()
-                for jj, data in enumerate(data_lines): 
-                    try : 
-                        data_lines [jj]= float(data) 
-                        # be sure to set all none value of ** value to 0.0
-                        if data_lines [jj] == 1.0e32 : data_lines[jj] =.0 
-                    except:
-                        data_lines [jj] = 0.0 
-                self.comp_dict[compkey].extend(data_lines)
+            if compkey is not None : 
+                blocks[compkey].append(datalines)
                 
+        self.comp_dict = _parse_data_blocks (blocks )
         self._fill_data_array(data_dict=self.comp_dict)
                 
         
@@ -331,7 +331,7 @@ class Edi :
                 _flagTip =True 
                 break 
         if _flagTip ==True : 
-            tip_array =np.zeros ((freq_array.size, 1, 2), dtype =np.complex) 
+            tip_array =np.zeros ((freq_array.size, 1, 2), dtype =np.complex128) 
             tip_error_array =np.zeros ((freq_array.size , 1, 2), dtype =np.float64)
             
             if 'trot' in self.comp_dict.keys(): 
@@ -413,7 +413,53 @@ class Edi :
         >>> e=Edi().fit('data/edis/new_E1_1.edi').write_edifile () 
         
         """
+        new_edifilename, write_edilines = self._get_edilines (
+            edifile = edifile, 
+            new_edifilename = new_edifilename, 
+            datatype = datatype, 
+            savepath = savepath, 
+            filtered_array = filtered_array 
+            )
+        # write file in a single call: 
+        with open (new_edifilename , 'w+', encoding = 'utf8') as fw : 
+            fw.write(''.join (write_edilines ))
+            
+        self.savepath = cpath(self.savepath, '_outputEDI_')
+
+        try : 
+            shutil.move(new_edifilename, self.savepath )
+        except : 
+            pass 
 
+        write_edilines=[]
+        
+        if self.verbose >0 : 
+            print('-'*77)
+            print('---> EDI-file <{0}> wrote successfully to <{1}>'.
+                  format(os.path.basename(new_edifilename), self.savepath )
+                  )
+
+        return new_edifilename
+    
+    def _get_edilines (
+            self, 
+            edifile=None,  
+            new_edifilename=None, 
+            datatype =None , 
+            savepath =None, 
+            filtered_array =None 
+            ): 
+        """ Build the lines of the EDI-file written by :meth:`write_edifile`. 
+        
+        Parameters are the ones of :meth:`write_edifile`. 
+        
+        Returns 
+        -------
+        new_edifilename: str, 
+            name of the new edifile. 
+        write_edilines: list, 
+            lines of the new edifile. 
+        """
         f=0
         
         if edifile is not None : 
@@ -681,26 +727,8 @@ class Edi :
                 write_edilines +=ilines +['\n'] 
         
         write_edilines.append('>END')
-        # write file : 
-        with open (new_edifilename , 'w+', encoding = 'utf8') as fw : 
-            fw.writelines(write_edilines)
-            
-        self.savepath = cpath(self.savepath, '_outputEDI_')
-
-        try : 
-            shutil.move(new_edifilename, self.savepath )
-        except : 
-            pass 
-
-        write_edilines=[]
         
-        if self.verbose >0 : 
-            print('-'*77)
-            print('---> EDI-file <{0}> wrote successfully to <{1}>'.
-                  format(os.path.basename(new_edifilename), self.savepath )
-                  )
-
-        return new_edifilename
+        return new_edifilename, write_edilines 
             
     def _write_components_blocks (
             self, edi_datacomp , comp_key, datatype=None): 
@@ -778,22 +806,13 @@ class Edi :
                 'DataType <{0}> provided is wrong!'
                  ' please use "MT"or "EMAP".'.format(datatype))
         
-        #-- > read value form component edi_data_comp 
-        for index_data , datacomp in enumerate (edi_datacomp , 1) : 
- 
-            if datacomp == 0.0 and comp_key.lower() not in ['zrot', 'trot']: 
-                datacomp = 1.0E32          
-                # if datacomp.mean() == self.Head.empty :
-                    #continue  dont write this data when all are empty
-                # else : 
-            format_value ="{0:{1}}".format(datacomp, self._bloc_num_format) 
-            format_value =format_value.upper()          #   1.000000E+32
-            if index_data % self._block_size == 0 :
-                format_value =format_value + '\n'
-            # ---> when block is at the end 
-            if index_data == edi_datacomp.size : format_value +='\n' 
-            #join block value to its corresponding      
-            comp_block_line.append(format_value)  
+        #-- > format the values of component edi_data_comp at once 
+        comp_block_line.append(_format_block_values (
+            edi_datacomp, 
+            num_format = self._bloc_num_format, 
+            block_size = self._block_size, 
+            keep_zeros = comp_key.lower() in ['zrot', 'trot']
+            ))
             
         return comp_block_line
     
@@ -972,7 +991,7 @@ class Edi :
         if new_Z is not None:
             edi_obj.Z = new_Z
         else:
-            edi_obj.Z = self._Z
+            edi_obj.Z = self.Z
 
         # --> write edi file
         edi_fn = edi_obj.write_edifile(new_edifilename= new_edi_fn, **kws)
@@ -2571,6 +2590,170 @@ class Processing(object):
             setattr(self, key, kwargs[key])
 
 
+def write_edis (
+    edifiles, 
+    new_Z =None, 
+    savepath =None, 
+    n_jobs =None, 
+    backend ='process', 
+    **kws 
+    ): 
+    """ Write many new EDI-files concurrently. 
+    
+    Each EDI-file is read again, its impedance tensor is replaced by the new 
+    one and the file is written in a single call to `savepath` as 
+    :meth:`Edi.write_new_edifile` does. The files are byte-identical to the 
+    ones written station by station. 
+    
+    Parameters 
+    -----------
+    edifiles: list of str or :class:`Edi`, 
+        Full paths to the EDI-files or the objects read from files. 
+    new_Z: list of :class:`watex.externals.z.Z`, optional 
+        New impedance tensor of each EDI. ``None`` writes the tensor held by 
+        the :class:`Edi` object or, for a path, the tensor read from the 
+        file. 
+    savepath: str, optional 
+        Path to save the new EDI-files. If ``None``, outputs to `_outputEDI_`
+        folder. 
+    n_jobs: int, optional 
+        Number of concurrent workers. ``None`` or ``1`` writes the files 
+        one by one. Refer to :func:`watex.utils.funcutils.run_parallel`. 
+    backend: str, default='process' 
+        Pool of workers; ``process`` or ``thread``. 
+    kws: dict, 
+        Additional keywords arguments of :meth:`Edi.write_new_edifile` e.g. 
+        `new_edi_fn` and of :meth:`Edi.write_edifile`. 
+        
+    Returns 
+    --------
+    new_edifiles: list of str, 
+        full paths to the new EDI-files. 
+        
+    Examples 
+    ---------
+    >>> from watex.edi import write_edis 
+    >>> write_edis (['data/edis/new_e.E00.edi', 'data/edis/new_e.E01.edi'], 
+    ...             savepath ='/tmp/edis', n_jobs =2 )
+    ['/tmp/edis/new_new_e.E00.edi', '/tmp/edis/new_new_e.E01.edi']
+    """
+    edifiles = list (edifiles )
+    new_Z = [None ] * len(edifiles) if new_Z is None else new_Z 
+    # as `write_new_edifile`, the tensor of the object is written when no 
+    # new tensor is given so the edits in memory are kept. 
+    new_Z = [ e.Z if z is None and isinstance (e, Edi) else z 
+             for e, z in zip (edifiles, new_Z )]
+    edifiles = [ e.edifile if isinstance (e, Edi) else e for e in edifiles ]
+    savepath = cpath(savepath, '_outputEDI_')
+    
+    new_edifiles = run_parallel (
+        _write_new_edi, [ (edifile, z, savepath, kws) for edifile, z in zip (
+            edifiles, new_Z )], n_jobs = n_jobs, backend = backend )
+    for f in new_edifiles: 
+        if isinstance (f, Exception ): 
+            raise f 
+    return new_edifiles 
+
+def _write_new_edi (args ): 
+    """ Write a new EDI-file from a file and a new impedance tensor. Stays 
+    at the module level to be dispatched to the process workers of 
+    :func:`write_edis`."""
+    edifile, z, savepath, kws = args 
+    kws = dict (kws )
+    new_edi_fn = kws.pop ('new_edi_fn', None )
+    
+    edi_obj = Edi().fit(edifile = edifile ) 
+    if z is not None: 
+        edi_obj.Z = z 
+    new_edifilename, write_edilines = edi_obj._get_edilines (
+        new_edifilename = new_edi_fn, savepath = savepath, **kws ) 
+    new_edifile = os.path.join(savepath, os.path.basename (new_edifilename ))
+    with open (new_edifile, 'w', encoding = 'utf8') as fw : 
+        fw.write(''.join (write_edilines ))
+        
+    return new_edifile 
+
+def _format_block_values (
+    values, 
+    num_format =' 15.6e', 
+    block_size =6, 
+    keep_zeros =False 
+    ): 
+    """ Format the values of an EDI data block into a single string. 
+    
+    As :func:`numpy.savetxt` does for rows, the printf-style template of the 
+    whole block is built once and all the values are formatted in a single 
+    call, `block_size` values per line. Zeros are written as the empty value 
+    ``1.0E32`` unless `keep_zeros`. A format with no printf-style equivalent 
+    is applied value by value. 
+    
+    :param values: array-like 1d, values of the block. 
+    :param num_format: str, format of the values e.g. ``' 15.6e'``. 
+    :param block_size: int, number of values per line. 
+    :param keep_zeros: bool, write the zeros as they are, e.g. the rotation 
+        angles. 
+    :return: str, the block followed by an empty line when the last line 
+        is complete. 
+    
+    :Example: 
+        >>> from watex.edi import _format_block_values 
+        >>> _format_block_values ([150., 0.], block_size =6 ) 
+        '   1.500000E+02   1.000000E+32\\n'
+    """
+    values = np.asarray (values ).ravel() 
+    if values.size ==0: 
+        return ''
+    nlines, rest = divmod (values.size, block_size )
+    
+    m = re.match (r'^([ +#0]*\d*(?:\.\d+)?)([eEfFgG])$', num_format )
+    if m is None or values.dtype.kind not in 'iuf': 
+        fv = [ "{0:{1}}".format(1.0E32 if v == 0.0 and not keep_zeros else v, 
+                                num_format).upper() for v in values ]
+        return ''.join ( ''.join (fv [k: k + block_size ]) + '\n' 
+                         for k in range (0, values.size, block_size )
+                         ) + ('' if rest else '\n')
+    
+    if not keep_zeros: 
+        values = np.where (values == 0.0, 1.0E32, values )
+    fmt = '%' + m.group(1) + m.group(2).upper() 
+    template = (fmt * block_size + '\n') * nlines + (
+        fmt * rest + '\n' if rest else '\n')
+    
+    return template % tuple (values.tolist() )
+
+def _parse_data_blocks (blocks ): 
+    """ Convert the raw text of EDI data blocks into float arrays. 
+    
+    All the blocks are tokenized and converted in a single call then split 
+    back per component. Empty values flagged as ``1.0E32`` and the tokens 
+    that could not be converted are set to ``0.``. 
+    
+    :param blocks: dict of component key and list of the data texts of 
+        the block e.g. the lines following the ``>ZXXR`` or ``>FREQ`` keys. 
+    :return: dict of component key and array-like 1d of the block values. 
+    
+    :Example: 
+        >>> from watex.edi import _parse_data_blocks 
+        >>> _parse_data_blocks ({'freq': ['1.5E+02  1.0E+32', '**']}) 
+        {'freq': array([150.,   0.,   0.])}
+    """
+    tokens = { key: ' '.join(lines).split() for key, lines in blocks.items()}
+    try : 
+        values = np.array (list(itertools.chain(*tokens.values())), 
+                           dtype =np.float64 )
+    except ValueError: 
+        # malformed block: fall back to the token by token conversion 
+        values = np.zeros (sum(map(len, tokens.values())), dtype =np.float64)
+        for ii, tk in enumerate (itertools.chain(*tokens.values())): 
+            try : values [ii] = float(tk)
+            except : pass 
+    # be sure to set all none value of ** value to 0.0
+    values [values == 1.0e32 ] = 0. 
+    
+    sizes = np.cumsum ([ len(tk) for tk in tokens.values()])[:-1]
+    
+    return dict (zip (tokens.keys(), np.split(values, sizes) ))
+
 def minimum_parser_to_write_edi (edilines, parser =None ):
     """
     This function validates edifile for writing , string with egal. We assume 
@@ -9,12 +9,10 @@ import math
 import numpy as np
 
 from .zutils import ( 
-    rotatematrix_incl_errors,
     invertmatrix_incl_errors, 
     z_error2r_phi_error,
     propagate_error_rect2polar , 
     rotatevector_incl_errors, 
-    propagate_error_polar2rect
     )
 from .._watexlog import watexlog 
 from ..exceptions import ZError 
@@ -32,6 +30,7 @@ class ResPhase(object):
 
     def __init__(self, z_array=None, z_err_array=None, freq=None, **kwargs):
         self._logging = watexlog.get_watex_logger(self.__class__.__name__)
+        self._logger = self._logging 
         self._z = z_array
         self._z_err = z_err_array
 
@@ -96,28 +95,25 @@ class ResPhase(object):
         if self._z is None or self.freq is None:
             raise ZError('Values are None, check _z, _z_err, freq')
 
-        self._resistivity = np.apply_along_axis(lambda x: np.abs(x) ** 2 / self.freq * 0.2,
-                                                0, self._z)
+        self._resistivity = np.abs(self._z) ** 2 / np.asarray(
+            self.freq)[:, None, None] * 0.2
         self._phase = np.rad2deg(np.angle(self._z))
 
         self._resistivity_err = np.zeros_like(self._resistivity, dtype=np.float64)
         self._phase_err = np.zeros_like(self._phase, dtype=np.float64)
 
-        # calculate resistivity and phase
+        # calculate resistivity and phase errors at all frequencies and 
+        # components at once. 
         if self._z_err is not None:
-            for idx_f in range(self.freq.size):
-                for ii in range(2):
-                    for jj in range(2):
+            nf = self.freq.size 
+            with np.errstate(all='ignore'): 
+                r_err, phi_err = z_error2r_phi_error(
+                        np.real(self._z[:nf]),
+                        np.imag(self._z[:nf]),
+                        self._z_err[:nf])
+                self._resistivity_err[:nf] = self._resistivity[:nf] * r_err
 
-                        r_err, phi_err = z_error2r_phi_error(
-                                self._z[idx_f, ii, jj].real,
-                                self._z[idx_f, ii, jj].imag,
-                                self._z_err[idx_f, ii, jj])
-                        with np.errstate(all='ignore'): 
-                            self._resistivity_err[idx_f, ii, jj] = \
-                                self._resistivity[idx_f, ii, jj] * r_err
-
-                        self._phase_err[idx_f, ii, jj] = phi_err
+            self._phase_err[:nf] = phi_err
 
     def set_res_phase(self, res_array, phase_array, freq, res_err_array=None,
                       phase_err_array=None):
@@ -161,29 +157,23 @@ class ResPhase(object):
         abs_z = np.sqrt(5.0 * self.freq * (self.resistivity.T)).T
         self._z = abs_z * np.exp(1j * np.radians(self.phase))
 
-        self._z_err = np.zeros_like(self._z, dtype=np.float)
+        self._z_err = np.zeros_like(self._z, dtype=np.float64)
         # ---------------------------
         # error propagation:
         if self._resistivity_err is None or self._phase_err is None:
             return
 
-        for idx_f in range(self.freq.shape[0]):
-            for ii in range(2):
-                for jj in range(2):
-                    abs_z = np.sqrt(5 * self.freq[idx_f] * \
-                                    self.resistivity[idx_f, ii, jj])
-                    with np.errstate(all='ignore'): 
-                        rel_error_res = self.resistivity_err[idx_f, ii, jj] / \
-                                        self.resistivity[idx_f, ii, jj]
-                    # relative error varies by a factor of 0.5, which is the
-                    # exponent in the relation between them:
-                    abs_z_error = 0.5 * abs_z * rel_error_res
-
-                    self._z_err[idx_f, ii, jj] = max(propagate_error_polar2rect(
-                        abs_z,
-                        abs_z_error,
-                        self.phase[idx_f, ii, jj],
-                        self.phase_err[idx_f, ii, jj]))
+        nf = self.freq.shape[0]
+        abs_z = np.sqrt(5 * self.freq[:, None, None] * self.resistivity[:nf])
+        with np.errstate(all='ignore'): 
+            rel_error_res = self.resistivity_err[:nf] / self.resistivity[:nf]
+        # relative error varies by a factor of 0.5, which is the
+        # exponent in the relation between them:
+        abs_z_error = 0.5 * abs_z * rel_error_res
+
+        xerr, yerr = _propagate_error_polar2rect(
+            abs_z, abs_z_error, self.phase[:nf], self.phase_err[:nf])
+        self._z_err[:nf] = _pymax(xerr, yerr)
 
     @property
     def res_xx(self):
@@ -252,14 +242,16 @@ class ResPhase(object):
     # calculate determinant values
     @property
     def _zdet(self):
-        return np.array([np.linalg.det(zz) ** .5 for zz in self._z])
+        zdet = np.linalg.det(self._z)
+        return (np.power(zdet, .5) if np.iscomplexobj(zdet)
+                else np.float_power(zdet, .5))
 
     @property
     def _zdet_var(self):
         if self._z_err is not None:
-            return np.array([abs(np.linalg.det(zzv)) ** .5 for zzv in self._z_err])
+            return np.float_power(np.abs(np.linalg.det(self._z_err)), .5)
         else:
-            return np.ones_like(self._zdet, dtype=np.float)
+            return np.ones_like(self._zdet, dtype=np.float64)
 
     @property
     def phase_det(self):
@@ -520,12 +512,13 @@ class Z(ResPhase):
             return
 
         inverse = copy.copy(self.z)
-        for idx_f in range(len(inverse)):
-            try:
-                inverse[idx_f, :, :] = np.array((np.matrix(self.z[idx_f, :, :])).I)
-            except:
-                raise ZError('The {0}ith impedance'.format(idx_f + 1) + \
-                                       'tensor cannot be inverted')
+        try:
+            inverse[:] = np.linalg.inv(self.z)
+        except np.linalg.LinAlgError:
+            # find the first singular tensor 
+            idx_f = np.argmax(np.linalg.det(self.z) == 0)
+            raise ZError('The {0}ith impedance'.format(idx_f + 1) + \
+                                   'tensor cannot be inverted')
 
         return inverse
 
@@ -568,7 +561,7 @@ class Z(ResPhase):
         else:
             if len(alpha) == 1:
                 try:
-                    degreeangle = float(alpha % 360)
+                    degreeangle = float(alpha[0] % 360)
                 except ValueError:
                     self._logger.error('"Angle" must be a valid number (in degrees)')
                     return
@@ -592,21 +585,15 @@ class Z(ResPhase):
         z_rot = copy.copy(self.z)
         z_err_rot = copy.copy(self.z_err)
 
-        for idx_freq in range(len(self.z)):
-
-            angle = lo_angles[idx_freq]
-            if np.isnan(angle):
-                angle = 0.
-
-            if self.z_err is not None:
-                z_rot[idx_freq], z_err_rot[idx_freq] = \
-                    rotatematrix_incl_errors(self.z[idx_freq, :, :],
-                                                  angle,
-                                                  self.z_err[idx_freq, :, :])
-            else:
-                z_rot[idx_freq], z_err_rot = \
-                    rotatematrix_incl_errors(self.z[idx_freq, :, :],
-                                                  angle)
+        angles = np.array(lo_angles, dtype=np.float64)
+        angles[np.isnan(angles)] = 0.
+        # rotate the tensors of all frequencies at once
+        z_rot[:], errmat = _rotatematrices_incl_errors(
+            self.z, angles, self.z_err)
+        if self.z_err is not None:
+            z_err_rot[:] = errmat
+        else:
+            z_err_rot = None
 
         self.z = z_rot
         if self.z_err is not None:
@@ -843,14 +830,13 @@ class Z(ResPhase):
 
         z1d = copy.copy(self.z)
 
-        for ii in range(len(z1d)):
-            z1d[ii, 0, 0] = 0
-            z1d[ii, 1, 1] = 0
-            sign01 = np.sign(z1d[ii, 0, 1])
-            sign10 = np.sign(z1d[ii, 1, 0])
-            mean1d = 0.5 * (z1d[ii, 1, 0] + z1d[ii, 0, 1])
-            z1d[ii, 0, 1] = sign01 * mean1d
-            z1d[ii, 1, 0] = sign10 * mean1d
+        z1d[:, 0, 0] = 0
+        z1d[:, 1, 1] = 0
+        sign01 = np.sign(z1d[:, 0, 1])
+        sign10 = np.sign(z1d[:, 1, 0])
+        mean1d = 0.5 * (z1d[:, 1, 0] + z1d[:, 0, 1])
+        z1d[:, 0, 1] = sign01 * mean1d
+        z1d[:, 1, 0] = sign10 * mean1d
 
         return z1d
 
@@ -864,9 +850,8 @@ class Z(ResPhase):
 
         z2d = copy.copy(self.z)
 
-        for ii in range(len(z2d)):
-            z2d[ii, 0, 0] = 0
-            z2d[ii, 1, 1] = 0
+        z2d[:, 0, 0] = 0
+        z2d[:, 1, 1] = 0
 
         return z2d
 
@@ -880,7 +865,7 @@ class Z(ResPhase):
 
         """
 
-        tr = np.array([np.trace(ii) for ii in self.z])
+        tr = self.z[:, 0, 0] + self.z[:, 1, 1]
 
         return tr
 
@@ -896,7 +881,7 @@ class Z(ResPhase):
 
         tr_err = None
         if self.z_err is not None:
-            tr_err = np.zeros_like(self.trace, dtype=np.float)
+            tr_err = np.zeros_like(self.trace, dtype=np.float64)
             tr_err[:] = self.z_err[:, 0, 0] + self.z_err[:, 1, 1]
 
         return tr_err
@@ -913,7 +898,7 @@ class Z(ResPhase):
         :rtype: np.ndarray(nfreq, 2, 2)
         """
 
-        skew = np.array([ii[0, 1] - ii[1, 0] for ii in self.z])
+        skew = self.z[:, 0, 1] - self.z[:, 1, 0]
 
         return skew
 
@@ -930,7 +915,7 @@ class Z(ResPhase):
 
         skew_err = None
         if self.z_err is not None:
-            skew_err = np.zeros_like(self.skew, dtype=np.float)
+            skew_err = np.zeros_like(self.skew, dtype=np.float64)
             skew_err[:] = self.z_err[:, 0, 1] + self.z_err[:, 1, 0]
 
         return skew_err
@@ -944,7 +929,7 @@ class Z(ResPhase):
         :rtype: np.ndarray(nfreq)
         """
 
-        det_Z = np.array([np.linalg.det(ii) for ii in self.z])
+        det_Z = np.linalg.det(self.z)
 
         return det_Z
 
@@ -958,7 +943,7 @@ class Z(ResPhase):
         """
         det_Z_err = None
         if self.z_err is not None:
-            det_Z_err = np.zeros_like(self.det, dtype=np.float)
+            det_Z_err = np.zeros_like(self.det, dtype=np.float64)
             # components of the impedance tensor are not independent variables
             # so can't use standard error propagation
             # calculate manually:
@@ -981,7 +966,7 @@ class Z(ResPhase):
         :rtype: np.ndarray(nfreq)
         """
 
-        norm = np.array([np.linalg.norm(ii) for ii in self.z])
+        norm = _frobenius_norm(self.z)
 
         return norm
 
@@ -996,19 +981,17 @@ class Z(ResPhase):
         norm_err = None
 
         if self.z_err is not None:
-            norm_err = np.zeros_like(self.norm, dtype=np.float)
-            for idx, z_tmp in enumerate(self.z):
-                value = self.norm[idx]
-                error_matrix = self.z_err[idx]
-                radicand = 0.
-                for ii in range(2):
-                    for jj in range(2):
-                        radicand += (error_matrix[ii, jj] * \
-                                     np.real(z_tmp[ii, jj])) ** 2
-                        radicand += (error_matrix[ii, jj] * \
-                                     np.imag(z_tmp[ii, jj])) ** 2
-
-                norm_err[idx] = 1. / value * np.sqrt(radicand)
+            norm_err = np.zeros_like(self.norm, dtype=np.float64)
+            radicand = 0.
+            # keep the summation order of the components
+            for ii in range(2):
+                for jj in range(2):
+                    radicand += np.float_power(self.z_err[:, ii, jj] * \
+                                 np.real(self.z[:, ii, jj]), 2)
+                    radicand += np.float_power(self.z_err[:, ii, jj] * \
+                                 np.imag(self.z[:, ii, jj]), 2)
+
+            norm_err[:] = 1. / self.norm * np.sqrt(radicand)
 
         return norm_err
 
@@ -1037,10 +1020,10 @@ class Z(ResPhase):
 
         invariants_dict['det'] = self.det[0]
 
-        det_real = np.array([np.linalg.det(ii) for ii in np.real(self.z)])
+        det_real = np.linalg.det(np.real(self.z))
         invariants_dict['det_real'] = det_real
 
-        det_imag = np.array([np.linalg.det(ii) for ii in np.imag(self.z)])
+        det_imag = np.linalg.det(np.imag(self.z))
         invariants_dict['det_imag'] = det_imag
 
         invariants_dict['trace'] = self.trace
@@ -1643,3 +1626,123 @@ def correct4sensor_orientation(Z_prime, Bx=0, By=90, Ex=0, Ey=90,
     # TODO: calculate error propagation
 
     return z_arr, z_err_arr
+
+
+def _frobenius_norm(z_array):
+    """
+    Frobenius norm of a stack of matrices. 
+
+    Same summation as :func:`numpy.linalg.norm` applied on each matrix 
+    of the stack.
+
+    :param z_array: array of matrices 
+    :type z_array: np.ndarray(..., 2, 2)
+
+    :returns: norm of each matrix 
+    :rtype: np.ndarray(...)
+    """
+    x = np.asarray(z_array)
+    if not issubclass(x.dtype.type, np.inexact):
+        x = x.astype(float)
+    shape = x.shape[:-2]
+    x = x.reshape(-1, x.shape[-2] * x.shape[-1])
+    if np.iscomplexobj(x):
+        sqnorm = _rowdot(x.real) + _rowdot(x.imag)
+    else:
+        sqnorm = _rowdot(x)
+
+    return np.sqrt(sqnorm).reshape(shape)
+
+
+def _rowdot(x):
+    """ Dot product of each row of `x` by itself."""
+    return np.matmul(x[:, None, :], x[:, :, None])[:, 0, 0]
+
+
+def _pymax(a, b):
+    """
+    Element-wise counterpart of the builtin ``max(a, b)``, including the 
+    order dependency when NaN values are compared.
+    """
+    return np.where(b > a, b, a)
+
+
+def _rotatematrices_incl_errors(inmatrix, angles, inmatrix_err=None):
+    """
+    Rotate a stack of matrices including the propagation errors. 
+
+    Batched version of :func:`~.zutils.rotatematrix_incl_errors`. 
+
+    :param inmatrix: stack of matrices 
+    :type inmatrix: np.ndarray(..., 2, 2) e.g. (nfreq, 2, 2) or 
+        (nstations, nfreq, 2, 2)
+
+    :param angles: rotation angle of each matrix in degrees 
+    :type angles: np.ndarray(...)
+
+    :param inmatrix_err: stack of matrix errors 
+    :type inmatrix_err: np.ndarray(..., 2, 2)
+
+    :returns: rotated matrices and errors 
+    """
+    if (inmatrix_err is not None) and (inmatrix.shape != inmatrix_err.shape):
+        raise ZError('Matrix and err-matrix shapes do not match: %s - %s' % (
+            str(inmatrix.shape), str(inmatrix_err.shape)))
+
+    phi = np.radians(np.asarray(angles) % 360)
+
+    cphi = np.cos(phi)
+    sphi = np.sin(phi)
+
+    # counter clockwise rotation matrices, same as the rotation 
+    # of the single matrix
+    rotmat = np.ascontiguousarray(
+        np.moveaxis(np.array([[cphi, sphi], [-sphi, cphi]]), (0, 1), (-2, -1)))
+    rotated_matrix = np.matmul(np.matmul(rotmat, np.ascontiguousarray(inmatrix)),
+                               np.linalg.inv(rotmat))
+
+    errmat = None
+    if inmatrix_err is not None:
+        err_orig = np.real(inmatrix_err)
+        errmat = np.zeros_like(inmatrix_err)
+
+        # standard propagation of errors. float_power is the element-wise
+        # counterpart of the scalar power of the single matrix rotation.
+        c2, cs, s2 = np.float_power(cphi, 2), cphi * sphi, np.float_power(sphi, 2)
+        for (ii, jj), (kk, ll), (mm, nn), (pp, qq) in (
+                ((0, 0), (0, 1), (1, 0), (1, 1)),
+                ((0, 1), (1, 1), (0, 0), (1, 0)),
+                ((1, 0), (1, 1), (0, 0), (0, 1)),
+                ((1, 1), (0, 1), (1, 0), (0, 0))):
+            errmat[..., ii, jj] = np.sqrt(
+                np.float_power(c2 * err_orig[..., ii, jj], 2) + \
+                np.float_power(cs * err_orig[..., kk, ll], 2) + \
+                np.float_power(cs * err_orig[..., mm, nn], 2) + \
+                np.float_power(s2 * err_orig[..., pp, qq], 2))
+
+    return rotated_matrix, errmat
+
+
+def _propagate_error_polar2rect(r, r_error, phi, phi_error):
+    """
+    Element-wise version of :func:`~.zutils.propagate_error_polar2rect`.
+
+    :returns: xerr, yerr arrays 
+    """
+    def rect(r, phi):
+        return r * np.cos(phi), r * np.sin(phi)
+
+    corners = [rect(r - r_error, phi - phi_error),
+               rect(r + r_error, phi - phi_error),
+               rect(r + r_error, phi + phi_error),
+               rect(r - r_error, phi + phi_error),
+               rect(r + r_error, phi)]
+
+    point = rect(r, phi)
+    xerr = np.abs(point[0] - corners[0][0])
+    yerr = np.abs(point[1] - corners[0][1])
+    for x, y in corners[1:]:
+        xerr = _pymax(xerr, np.abs(point[0] - x))
+        yerr = _pymax(yerr, np.abs(point[1] - y))
+
+    return xerr, yerr
@@ -8,11 +8,14 @@ from .electrical import (
     VerticalSounding, 
     DCProfiling, 
     DCSounding,
+    ERPStore, 
 )
 
 from .em import ( 
     EM, 
     Processing, 
+    StationStack, 
+    StreamFilter, 
     )
 from .erp import ( 
     ERPCollection ,
@@ -32,7 +35,10 @@ __all__=[
     "VerticalSounding", 
     "DCProfiling", 
     "DCSounding",
+    "ERPStore", 
     "Processing", 
+    "StationStack", 
+    "StreamFilter", 
     "ERPCollection", 
     "ERP", 
     "Hydrogeology", 
@@ -36,6 +36,7 @@ from ..utils.funcutils import (
     smart_strobj_recognition , 
     make_ids, 
     show_stats,
+    run_parallel, 
     )
 from ..utils.coreutils import (
     _assert_station_positions,
@@ -45,7 +46,14 @@ from ..utils.coreutils import (
     vesSelector,
     parseDCArgs ,
     plotAnomaly, 
-    erpSmartDetector
+    erpSmartDetector, 
+    erpBatchFit, 
+    excel_cache_info, 
+    _get_excel_cachedir, 
+    _get_excel_cachefile, 
+    _read_excel, 
+    _count_excel_reads, 
+    _merge_excel_reads, 
 ) 
 from ..utils.exmath import (
     shape, 
@@ -54,6 +62,7 @@ from ..utils.exmath import (
     magnitude, 
     sfi,
     ohmicArea, 
+    ohmicAreaBatch, 
     invertVES,
     plotOhmicArea
     )
@@ -80,7 +89,7 @@ except ImportError:
 else: TQDM = True 
 
 __all__=['DCProfiling', 'DCSounding',
-         'ResistivityProfiling', 'VerticalSounding'
+         'ResistivityProfiling', 'VerticalSounding', 'ERPStore'
          ]
 
 class DCProfiling(ElectricalMethods)  : 
@@ -149,6 +158,22 @@ class DCProfiling(ElectricalMethods)  :
         `read_sheets` is set to ``True`` and the file is not in excell format, 
         a TypError will raise. 
         
+    n_jobs: int, optional 
+        Number of workers reading and fitting the survey lines concurrently. 
+        ``None`` fits the lines one after another and ``-1`` uses all the 
+        CPUs. The lines keep the order of the data whatever `n_jobs`. 
+        
+    backend: str, default='process' 
+        Pool of workers, ``process`` or ``thread``. The fitting is CPU-bound 
+        so the ``process`` pool is recommended. 
+        
+    cache: bool or str, default=False 
+        Read the excel files through the cache of converted sheets. The first 
+        `fit` stores each sheet in a binary file and the next ones load it 
+        instead of parsing the workbook. A string is used as the cache 
+        directory. The hits and misses of the last `fit` are set to 
+        ``cache_hits_`` and ``cache_misses_``. 
+        
     fit_params: dict 
          Additional |ERP| keywords arguments  
          
@@ -207,6 +232,14 @@ class DCProfiling(ElectricalMethods)  :
     >>> dcobjs.line3.sfi_ # => robj1.sfi_
     ... array([0.03592814]) # for line 3 
     
+    (4) -> Read a large collection of lines from an on-disk store 
+    
+    >>> from watex.methods.electrical import ERPStore 
+    >>> store = ERPStore.create ('erpstore', datapath, read_sheets =True )
+    >>> dcobjs = DCProfiling().fit(store) # no line is loaded 
+    >>> dcobjs.powers_ 
+    >>> dcobjs.line4.conductive_zone_ # only the line 4 is loaded and fitted 
+    
     """
     
     def __init__(
@@ -216,6 +249,8 @@ class DCProfiling(ElectricalMethods)  :
         auto: bool = False,
         keep_params:bool=False, 
         read_sheets:bool=False, 
+        n_jobs: int=None, 
+        backend: str='process', 
         **kws
         ):
         super().__init__(**kws)
@@ -227,6 +262,8 @@ class DCProfiling(ElectricalMethods)  :
         self.auto=auto 
         self.keep_params=keep_params
         self.read_sheets=read_sheets
+        self.n_jobs=n_jobs 
+        self.backend=backend 
         
         
         
@@ -239,7 +276,10 @@ class DCProfiling(ElectricalMethods)  :
         ----------
         **data**: List of path-like obj, or :class:`~.ResistivityProfiling`
             object. Data containing the collection of DC-resistivity values of 
-            of multiple survey areas. 
+            of multiple survey areas. It can also be an :class:`ERPStore` 
+            object or directory; the parameters are then read from the store 
+            columns and each line is loaded and fitted only when it is 
+            accessed e.g. ``<object>.line2``. 
                 
         **fit_params**: str, 
             Additional keyword from :func:watex.utils.coreutils.parseStations`.
@@ -270,6 +310,10 @@ class DCProfiling(ElectricalMethods)  :
         # - collected the unreadable data; readable data  
         self.isnotvalid_= list() ; self.data_= list() 
         
+        # a store keeps the lines on disk; they are fitted on access. 
+        if _readfromstore (self, data ): 
+            return self 
+        
         # check whether object is readable as ERP objs
         #  -> if not assume a path or file is given 
         
@@ -361,6 +405,11 @@ class DCProfiling(ElectricalMethods)  :
        
     
     def __getattr__(self, name):
+        if ( self.__dict__.get ('store_') is not None 
+            and name in self.__dict__.get ('ids_', ()) 
+            ): 
+            return _fit_store_line (self, name )
+        
         rv = smart_strobj_recognition(name, self.__dict__, deep =True)
         appender  = "" if rv is None else f'. Do you mean {rv!r}'
         
@@ -480,6 +529,18 @@ class DCSounding(ElectricalMethods) :
         If ``True`` , keeps only the predicted parameters in the summary table, 
         otherwise, returns the usefull details of the site like the depth 
         AB/2 where the DC predicted area parameter is computed. 
+        
+    n_jobs: int, optional 
+        Number of workers reading and fitting the sounding sites concurrently. 
+        ``None`` fits the sites one after another and ``-1`` uses all the 
+        CPUs. The sites keep the order of the data whatever `n_jobs`. 
+        
+    backend: str, default='process' 
+        Pool of workers, ``process`` or ``thread``. 
+        
+    cache: bool or str, default=False 
+        Read the excel files through the cache of converted sheets. Refer 
+        to :class:`DCProfiling`. 
          
     kws: dict 
         Additionnal keywords arguments from |VES| data operations. 
@@ -530,6 +591,8 @@ class DCSounding(ElectricalMethods) :
         typeofop:str='mean',
         objective: Optional[str] = 'coverall',
         keep_params:bool=False, 
+        n_jobs: int=None, 
+        backend: str='process', 
         **kws
         ): 
         super().__init__(**kws) 
@@ -544,6 +607,8 @@ class DCSounding(ElectricalMethods) :
         self.strategy=strategy 
         self.keep_params=keep_params
         self.read_sheets= read_sheets
+        self.n_jobs=n_jobs 
+        self.backend=backend 
         
         for key in list( kws.keys()): 
             setattr(self, key, kws[key])
@@ -823,7 +888,7 @@ class ResistivityProfiling(ElectricalMethods):
                                  f' got {type(data).__name__!r}'
                                  )
         
-        data = erpSelector(data, columns, force=force ) 
+        data = erpSelector(data, columns, force=force, cache = self.cache ) 
         if not _is_valid_erp(data): 
             raise ERPError("Invalid ERP data. Data must contain at least"
                            " 'resistivity' and 'station' position." )
@@ -1294,29 +1359,24 @@ class VerticalSounding (ElectricalMethods):
 
         """
         
-        def prettyprinter (n, r,v): 
-            """ Display some details when verbose is higher... 
-            
-            :param n: int : number of areas 
-            :param r: array-like. Pair values of integral bounds (-inf, +inf)
-            :param v: array-float - values of pseudo-areas computed.  """
-            print('=' * 73 )
-            print('| {0:^15} | {1:>15} | {2:>15} | {3:>15} |'.format(
-                'N-area', 'lb:-AB/2 (m)','ub:-AB/2(m)', 'ohmS (Ω.m^2)' ))
-            print('=' * 73 )
-            for ii in range (n): 
-                print('| {0:^15} | {1:>15} | {2:>15} | {3:>15} |'.format(
-                    ii+1, round(r[ii][0]), round(r[ii][1]), round(v[ii], 3)))
-                print('-'*73)
-        
         self._logging.info (f'`Fit` method from {self.__class__.__name__!r}'
                            ' is triggered')
         
+        return self._fit_data (data, **fit_params)._fit_areas () 
+    
+    def _fit_data (self, data: str | DataFrame, **fit_params 
+                   )-> "VerticalSounding": 
+        """ Read and check the sounding data. Isolated part of :meth:`fit`. 
+        
+        :param data: Path-like object or DataFrame of the sounding. 
+        :param fit_params: Additional keywords arguments of the readable files.
+        """
         if self.verbose >= 7 : 
             print(f'Range {str(self.vesorder)!r} of resistivity data '
                   'should be selected as the main sounding data. ')
         self.data_ = vesSelector(
-            data = data, index_rhoa= self.vesorder, **fit_params )
+            data = data, index_rhoa= self.vesorder, cache = self.cache, 
+            **fit_params )
         if not _is_valid_ves( self.data_): 
             raise VESError("Invalid VES data. Data must contain at least"
                            " 'resistivity' and 'AB/2' position." )
@@ -1341,9 +1401,35 @@ class VerticalSounding (ElectricalMethods):
             print("Pseudo-area should be computed from AB/2 ={str(self.search)}"
                   f" to {self.max_depth_} meters. "
                   )
-        r = ohmicArea( data = self.data_ , sum = False, search = self.search,  
-                    objective = self.objective , typeofop = self.typeofop, 
-                    )
+        return self 
+    
+    def _fit_areas (self, r: list = None )-> "VerticalSounding": 
+        """ Set the pseudo-areas and the fractured zone attributes. Isolated 
+        part of :meth:`fit`. 
+        
+        :param r: list - Outputs of :func:`~watex.utils.exmath.ohmicArea` on 
+            the sounding data. If ``None``, it is computed from the data read  
+            by :meth:`_fit_data`.
+        """
+        def prettyprinter (n, r,v): 
+            """ Display some details when verbose is higher... 
+            
+            :param n: int : number of areas 
+            :param r: array-like. Pair values of integral bounds (-inf, +inf)
+            :param v: array-float - values of pseudo-areas computed.  """
+            print('=' * 73 )
+            print('| {0:^15} | {1:>15} | {2:>15} | {3:>15} |'.format(
+                'N-area', 'lb:-AB/2 (m)','ub:-AB/2(m)', 'ohmS (Ω.m^2)' ))
+            print('=' * 73 )
+            for ii in range (n): 
+                print('| {0:^15} | {1:>15} | {2:>15} | {3:>15} |'.format(
+                    ii+1, round(r[ii][0]), round(r[ii][1]), round(v[ii], 3)))
+                print('-'*73)
+        
+        if r is None: 
+            r = ohmicArea( data = self.data_ , sum = False, search = self.search,  
+                        objective = self.objective , typeofop = self.typeofop, 
+                        )
         self._logging.info(f'Populating {self.__class__.__name__!r} property'
                            ' attributes.')
         oc, gc = r 
@@ -1511,6 +1597,296 @@ class VerticalSounding (ElectricalMethods):
             )
         return 1 
     
+class ERPStore: 
+    """ Columnar on-disk store of a collection of |ERP| lines. 
+    
+    The station, resistivity and coordinate values of all the lines are 
+    concatenated per column in raw binary files read as memory-mapped arrays 
+    and the lines are split back with an index of offsets. The DC-profiling 
+    parameters of each line are computed once at creation with 
+    :func:`~watex.utils.coreutils.erpBatchFit` and stored as columns of the 
+    index. A line is therefore loaded only when it is accessed and the 
+    collection parameters are read from the columns without reading or 
+    fitting any line. 
+    
+    The store is a directory holding:: 
+        
+        index.npz           line names, offsets and parameter columns 
+        station.bin         positions of the stations of all the lines 
+        resistivity.bin     resistivity values of all the lines 
+        longitude.bin, latitude.bin, easting.bin, northing.bin 
+    
+    Parameters 
+    -----------
+    path: str 
+        Directory of the store created by :meth:`ERPStore.create`. 
+        
+    Examples 
+    ---------
+    >>> from watex.datasets import make_erp 
+    >>> from watex.methods.electrical import ERPStore 
+    >>> erp_data = [ make_erp (n_stations =50, seed =s, as_frame =True ) 
+                    for s in range (3) ] 
+    >>> store = ERPStore.create ('erpstore', erp_data ) 
+    >>> store 
+    ERPStore(n_lines=3, n_stations=150)
+    >>> store.table [['station', 'power', 'shape', 'type']]
+          station  power shape type
+    line1    S047   50.0     C   NC
+    line2    S041   60.0     V   PC
+    line3    S005   60.0     H   PC
+    >>> store ['line2'].resistivity.min () 
+    1.0
+    >>> for name, frame in store.iterlines () : 
+    ...     pass # one line in memory at a time 
+    """
+    indexfile = 'index.npz'
+    columns = ('station', 'resistivity', 'longitude', 'latitude', 'easting', 
+               'northing')
+    
+    def __init__(self, path: str ): 
+        self.path = path 
+        indexfile = os.path.join (str(path), self.indexfile ) 
+        if not os.path.isfile (indexfile ): 
+            raise ERPError (f"No ERP store found in {path!r}. Use"
+                            " 'ERPStore.create' to make one.")
+        with np.load (indexfile, allow_pickle =False ) as npz : 
+            c = { k: npz[k] for k in npz.files }
+        self.names = c.pop ('names').astype (object )
+        self.offsets = c.pop ('offsets') 
+        # missing parameters are saved as empty strings 
+        for name in ('station', 'shape', 'type'): 
+            c [name] = np.where (c[name]=='', None, c[name].astype (object )) 
+        self.table = pd.DataFrame (c, index = self.names, columns = [
+            'station', 'dipole', 'longitude', 'latitude', 'easting', 
+            'northing', 'sves_resistivity', 'power', 'magnitude', 'shape', 
+            'type', 'sfi'])
+        self._mmaps = {} 
+        
+    @classmethod 
+    def create (
+        cls, 
+        path: str, 
+        data: List[str | DataFrame ], 
+        *, 
+        stations: List[str] =None, 
+        auto: bool =False, 
+        read_sheets: bool =False, 
+        chunksize: int =1000, 
+        force: bool =False, 
+        utm_zone: str =None, 
+        datum: str ='WGS84', 
+        epsg: int =None, 
+        verbose: int =0, 
+        )-> "ERPStore": 
+        """ Write a collection of |ERP| lines into a store. 
+        
+        The lines are read one after another and appended to the columns so 
+        that at most `chunksize` lines are held in memory. 
+        
+        :param path: str, directory of the store. It is created if it does 
+            not exist; an existing store is overwritten once all the lines 
+            are written and is left unchanged if the writing fails. 
+        :param data: path-like object, dataframe or list of them. Data of the 
+            lines as accepted by :meth:`ResistivityProfiling.fit`. A directory 
+            is replaced by its files. It can also be a generator of lines. 
+        :param stations: list of str, optional, stations expected to hold the 
+            drilling, one per line. ``None`` triggers the naive 
+            auto-detection. 
+        :param auto: bool, auto-detect the drilling point of every line. 
+        :param read_sheets: bool, read each sheet of the excel files as a 
+            line. 
+        :param chunksize: int, number of lines fitted together. 
+        :param force: bool, consider |VES| data as |ERP| data. Refer to 
+            :func:`~watex.utils.coreutils.erpSelector`. 
+        :param utm_zone, datum, epsg: coordinates arguments passed to 
+            :func:`~watex.utils.coreutils.fill_coordinates`. 
+        :param verbose: int, warn about the unreadable lines. 
+        :return: :class:`ERPStore` object. 
+        """
+        path = str(path) 
+        os.makedirs (path, exist_ok =True )
+        # the files are written to temporary names and replace the ones of 
+        # an existing store only once the whole store is written. 
+        fnames = [ os.path.join (path, f'{c}.bin') for c in cls.columns ] + [
+            os.path.join (path, cls.indexfile )]
+        try : 
+            cls._write (path, data, stations, auto, read_sheets, chunksize, 
+                        force, utm_zone, datum, epsg, verbose )
+        except BaseException : 
+            for fn in fnames: 
+                if os.path.isfile (fn + '.tmp'): 
+                    os.remove (fn + '.tmp')
+            raise 
+        # the index is removed first so that the store is never read with 
+        # the columns of another collection. 
+        if os.path.isfile (fnames [-1]): 
+            os.remove (fnames [-1])
+        for fn in fnames : 
+            os.replace (fn + '.tmp', fn )
+        
+        return cls (path ) 
+    
+    @classmethod 
+    def _write (cls, path, data, stations, auto, read_sheets, chunksize, 
+                force, utm_zone, datum, epsg, verbose ): 
+        """ Write the columns and the index of the store to temporary files 
+        suffixed with ``.tmp``. Refer to :meth:`ERPStore.create`."""
+        files = { c: open (os.path.join (path, f'{c}.bin.tmp'), 'wb') 
+                 for c in cls.columns } 
+        names, lengths, tables, isnotvalid = [], [], [], [] 
+        chunk, chunk_stations = [], [] 
+        
+        def _flush (): 
+            """ Fit the lines of the chunk together and release them. """
+            if len(chunk )!=0: 
+                tables.append (cls._fit_lines (chunk, chunk_stations, auto ))
+            chunk.clear () ; chunk_stations.clear ()
+            
+        try : 
+            for k, (name, d) in enumerate (_iter_erp_sources (
+                    data, read_sheets )): 
+                try : 
+                    d = erpSelector (d, force = force ) 
+                    if not _is_valid_erp(d): 
+                        raise ERPError ("Invalid ERP data.")
+                    d, utm_zone = fill_coordinates(
+                        d, utm_zone= utm_zone, datum = datum, epsg= epsg, 
+                        verbose = verbose ) 
+                except Exception : 
+                    isnotvalid.append (name )
+                    continue 
+                if stations is not None and k >= len(stations ): 
+                    raise StationError (f"Expect one station per line. Got"
+                                        f" {len(stations)} stations.")
+                for c in cls.columns : 
+                    np.asarray (d[c], dtype = np.float64 ).tofile (files [c])
+                names.append (name ); lengths.append (len(d))
+                chunk.append (d[list (cls.columns )]) 
+                chunk_stations.append (
+                    None if stations is None else stations [k])
+                if len(chunk ) >= chunksize: 
+                    _flush () 
+            _flush () 
+        finally : 
+            for f in files.values (): 
+                f.close () 
+                
+        if len(isnotvalid )!=0 and verbose: 
+            warnings.warn (f"Unable to read {len(isnotvalid)} line(s):"
+                           f" {smart_format(isnotvalid)}.")
+        if len(names )==0: 
+            raise ERPError("None ERP data detected. Please check your data.")
+            
+        table = pd.concat (tables ) 
+        params = { c: table[c].values.astype (np.float64 ) for c in (
+            'dipole', 'longitude', 'latitude', 'easting', 'northing', 
+            'sves_resistivity', 'power', 'magnitude', 'sfi') } 
+        params.update ({ c: np.array ([ '' if v is None else v 
+                                       for v in table[c]], dtype =str ) 
+                        for c in ('station', 'shape', 'type')}) 
+        with open (os.path.join (path, cls.indexfile + '.tmp'), 'wb') as f : 
+            np.savez (f, names = np.array (names, dtype =str ), 
+                      offsets = np.concatenate (([0], np.cumsum (lengths ))), 
+                      **params ) 
+    
+    @classmethod 
+    def _fit_lines (cls, lines, stations =None, auto =False ): 
+        """ Compute the DC-profiling parameters of a chunk of lines."""
+        with warnings.catch_warnings(): 
+            # unfitted lines are reported by their missing parameters. 
+            warnings.simplefilter ('ignore')
+            return erpBatchFit ( 
+                [ d.resistivity.values for d in lines ], stations = stations, 
+                auto = auto, positions = [ d.station.values for d in lines ], 
+                coordinates = { c: [ d[c].values for d in lines ] 
+                               for c in cls.columns [2:] } 
+                ) 
+        
+    def refit (
+        self, 
+        stations: List[str] =None, 
+        auto: bool =False, 
+        chunksize: int =1000 
+        )-> DataFrame: 
+        """ Recompute the DC-profiling parameters with other stations. 
+        
+        The lines are loaded by chunks of `chunksize` lines and the stored 
+        parameters are left unchanged. 
+        
+        :param stations: list of str, stations expected to hold the drilling, 
+            one per line. ``None`` triggers the naive auto-detection. 
+        :param auto: bool, auto-detect the drilling point of every line. 
+        :param chunksize: int, number of lines fitted together. 
+        :return: table of the parameters indexed by the line names. 
+        """
+        if stations is not None and len(stations ) != len(self ): 
+            raise StationError (f"Expect {len(self)} stations, one per line."
+                                f" Got {len(stations)}.")
+        tables = [] 
+        for k in range (0, len(self ), chunksize ): 
+            ks = range (k, min (k + chunksize, len(self )))
+            tables.append (self._fit_lines (
+                [ self [kk] for kk in ks ], None if stations is None else [
+                    stations [kk] for kk in ks ], auto )) 
+        table = pd.concat (tables ) 
+        table.index = self.names 
+        return table 
+    
+    @staticmethod 
+    def is_store (path: str )-> bool : 
+        """ Whether `path` is an :class:`ERPStore` object or directory."""
+        return isinstance (path, ERPStore ) or ( 
+            isinstance (path, str ) and os.path.isfile (
+                os.path.join (path, ERPStore.indexfile )))
+    
+    @property 
+    def lengths (self ): 
+        """ Number of stations of each line."""
+        return np.diff (self.offsets )
+    
+    def column (self, name: str )-> NDArray : 
+        """ Memory-mapped values of a column of all the lines. 
+        
+        :param name: str, column name in :attr:`ERPStore.columns`. 
+        :return: read-only array of shape (n_stations, ). Split it with 
+            :attr:`ERPStore.offsets`. 
+        """
+        if name not in self.columns: 
+            raise ValueError (f"Unknown column {name!r}. Expect"
+                              f" {smart_format(self.columns)}.")
+        if name not in self._mmaps: 
+            self._mmaps [name] = ( np.memmap (os.path.join (
+                self.path, f'{name}.bin'), dtype =np.float64, mode ='r') 
+                if self.offsets[-1] > 0 else np.empty (0) )
+        return self._mmaps [name] 
+    
+    def iterlines (self ): 
+        """ Iterate over the lines and yield their name and data."""
+        for k, name in enumerate (self.names ): 
+            yield name, self [k] 
+            
+    def __getitem__ (self, key: int | str )-> DataFrame : 
+        """ Load the data of a line from its index or name."""
+        if isinstance (key, str ): 
+            k, = np.where (self.names == key ) 
+            if len(k )==0: 
+                raise KeyError (f"Unknown line {key!r}.")
+            key = k[0] 
+        sl = slice (*self.offsets [[key, key +1 ]]) 
+        return pd.DataFrame ({ c: np.array (self.column (c)[sl]) 
+                              for c in self.columns })
+    
+    def __iter__ (self ): 
+        return (d for _, d in self.iterlines () )
+    
+    def __len__ (self ): 
+        return len(self.names )
+    
+    def __repr__ (self ): 
+        return ( f"{self.__class__.__name__}(n_lines={len(self)},"
+                f" n_stations={self.offsets[-1]})" )
+        
 def _readfromdcObjs(self, data: List[object ] ,
                      dcmethod:object=ResistivityProfiling ,  
                      exception: F = ERPError ): 
@@ -1627,16 +2003,23 @@ def _readfrompath (self, data: List[str | DataFrame ] ,
             data = [os.path.join( data[0], d ) for d in os.listdir(data[0])] 
         else : 
             raise FileNotFoundError("File not found")
-       
+        
+        if getattr (self, 'cache', False ): 
+            _count_cache_hits (self, data, **( dict (sheet_name =None ) 
+                                              if self.read_sheets else {}))
         if self.read_sheets: 
             _, ex = os.path.splitext( data[0])
             if ex != '.xlsx': 
                 raise TypeError ("Read multisheets expects an excel file "
                                  f" extension <'.xlsx'> not: {ex!r}")
-            for d in data : 
-                try: 
-                    ddict.update ( **pd.read_excel (d , sheet_name =None))
-                except : pass 
+            for sheets in _merge_excel_reads (run_parallel (
+                    _count_excel_reads, [ (_read_sheets, (
+                        d, getattr (self, 'cache', False ))) for d in data ], 
+                    n_jobs = getattr (self, 'n_jobs', None),
+                    backend = getattr (self, 'backend', 'process'))): 
+                # skip the unreadable files 
+                if not isinstance (sheets, Exception ): 
+                    ddict.update ( **sheets )
                     
                 #collect stations names
             if len(ddict)==0 : 
@@ -1674,48 +2057,57 @@ def _readfrompath (self, data: List[str | DataFrame ] ,
     # locate a drilling drilling i.e. sves
     _parse_dc_args(self, dcmethod,  **kws)
 
+    # -> make the dc Objs; each worker reads and fits its data 
+    items =[]
+    for kk,  o  in enumerate (data)  :
+        if dcmethod.__name__=='ResistivityProfiling':
+            dcObj = dcmethod( 
+                station = self.stations[kk] , 
+                dipole= self.dipole,
+                auto=True if self.stations[kk] is None else self.auto, 
+                utm_zone = self.utm_zone, 
+                cache = getattr (self, 'cache', False ), 
+                )
+            items.append ((dcObj, o, dict (force = force), self.keep_params))
+                
+        elif dcmethod.__name__ =='VerticalSounding': 
+            dcObj = dcmethod(
+                search=self.search[kk], 
+                vesorder=self.vesorder,
+                typeofop=self.typeofop,
+                objective=self.objective,
+                rho0=self.rho0, 
+                h0=self.h0,
+                strategy=self.strategy, 
+                cache = getattr (self, 'cache', False ), 
+                )
+            items.append ((dcObj, o, dict (), self.keep_params))
+            
     # show the progress bar
-    try: 
-        pbar = data if not TQDM else tqdm.tqdm(data ,ascii=True, unit='B',
-                     desc ="dc-erp" if dcmethod.__name__ =='ResistivityProfiling'\
-                         else'dc-ves',
-                     ncols =77)
-    except NameError: 
-        # force pbar to hold the data value
-        # if trouble occurs 
-        pbar =data 
-    # -> read the data and make dc Objs 
-    for kk,  o  in enumerate (pbar)  :
-        try :
-            if dcmethod.__name__=='ResistivityProfiling':
-                dcObj = dcmethod( 
-                    station = self.stations[kk] , 
-                    dipole= self.dipole,
-                    auto=True if self.stations[kk] is None else self.auto, 
-                    utm_zone = self.utm_zone, 
-                    )
-                self.data_.append (dcObj.fit(o, force = force).summary(
-                    keep_params=self.keep_params))
-                self.stations[kk] = dcObj.sves_ 
-                    
-            elif dcmethod.__name__ =='VerticalSounding': 
-                dcObj = dcmethod(
-                    search=self.search[kk], 
-                    vesorder=self.vesorder,
-                    typeofop=self.typeofop,
-                    objective=self.objective,
-                    rho0=self.rho0, 
-                    h0=self.h0,
-                    strategy=self.strategy
-                    )
-                self.data_.append (dcObj.fit(o).summary(
-                    keep_params=self.keep_params))
-   
-        except : 
+    pbar = None if not TQDM else tqdm.tqdm(total = len(items), ascii=True, 
+                 unit='B', desc ="dc-erp" if dcmethod.__name__ ==\
+                     'ResistivityProfiling' else'dc-ves', ncols =77)
+    
+    if dcmethod.__name__ =='VerticalSounding': 
+        results = _fit_ves_collection (
+            self, items, callback = None if pbar is None else pbar.update )
+    else: 
+        results = _merge_excel_reads (run_parallel (
+            _count_excel_reads, [ (_fit_dc_object, it) for it in items ], 
+            n_jobs = getattr (self, 'n_jobs', None), 
+            backend = getattr (self, 'backend', 'process'), 
+            callback = None if pbar is None else pbar.update 
+            ))
+    if pbar is not None: 
+        pbar.close() 
+    # collect in the data order 
+    for kk, (o, dcObj) in enumerate (zip (data, results )): 
+        if isinstance (dcObj, Exception ): 
             self.isnotvalid_.append(o)
-            
-    #     pbar.update(kk) if TQDM else ''
-    # (pbar.close (), print('-completed-') ) if TQDM else ''
+            continue 
+        self.data_.append (dcObj )
+        if dcmethod.__name__=='ResistivityProfiling':
+            self.stations[kk] = dcObj.sves_ 
     
     if self.verbose > 0:
         #show stats 
@@ -1730,6 +2122,208 @@ def _readfrompath (self, data: List[str | DataFrame ] ,
                   f" {len(self.isnotvalid_)}")
             
 
+def _fit_dc_object (args ): 
+    """ Fit a DC-resistivity object to its data and return the fitted object. 
+    
+    Module-level function so the process workers of :func:`_readfrompath`
+    can pickle it. 
+    
+    :param args: tuple of the DC object, its data, the fit keywords arguments 
+        and the `keep_params` argument of the summary. 
+    """
+    dcObj, o, fit_kws, keep_params = args 
+    return dcObj.fit(o, **fit_kws).summary(keep_params=keep_params)
+
+def _read_ves_object (args ): 
+    """ Read the data of a |VES| object and return the object. 
+    Module-level function picklable for the process workers. """
+    dcObj, o, fit_kws, _ = args 
+    return dcObj._fit_data (o, **fit_kws )
+
+def _fit_ves_areas (args ): 
+    """ Compute the pseudo-areas of a |VES| object whose data are read and 
+    return the summarized object. """
+    dcObj, keep_params = args 
+    return dcObj._fit_areas().summary(keep_params=keep_params)
+
+def _fit_ves_collection (self, items, callback = None ): 
+    """ Read and fit the |VES| objects of the collection. 
+    
+    When all the soundings share the same `AB/2` grid, the pseudo-areas are 
+    computed at once with :func:`~watex.utils.exmath.ohmicAreaBatch`, 
+    otherwise each sounding is fitted separately. 
+    
+    :param items: list of the DC objects, data, fit keywords arguments and
+        `keep_params` to fit. 
+    :param callback: callable, called each time a data is read. 
+    :return: list of the fitted objects or the exceptions in the data order. 
+    """
+    n_jobs = getattr (self, 'n_jobs', None)
+    backend = getattr (self, 'backend', 'process')
+    keep_params = self.keep_params 
+    
+    results = _merge_excel_reads (run_parallel (
+        _count_excel_reads, [ (_read_ves_object, it) for it in items ], 
+        n_jobs = n_jobs, backend = backend, callback = callback ))
+    ok = [ k for k, r in enumerate (results ) if not isinstance (
+        r, Exception )]
+    grids = [ np.asarray (results [k].data_.AB, dtype = float ) for k in ok ]
+    shared = len(ok) > 1 and all ( 
+        g.shape == grids[0].shape and (g == grids[0]).all() for g in grids )
+    
+    if not shared or str(self.objective).lower() not in ('coverall', 'full'): 
+        for k, r in zip (ok, run_parallel (
+                _fit_ves_areas, [ (results[k], keep_params) for k in ok ], 
+                n_jobs = n_jobs, backend = backend )): 
+            results [k] = r 
+        return results 
+    
+    (ohmS, err, roots), (X, Y, prho, p45, oix) = ohmicAreaBatch (
+        grids [0], np.vstack ([ results[k].data_.resistivity for k in ok ]), 
+        search = [ results[k].search for k in ok ], typeofop = self.typeofop, 
+        return_fit = True 
+        )
+    xn = np.linspace (X.min(), X.max(), 1000)
+    for ii, k in enumerate (ok ): 
+        nk = np.count_nonzero (~np.isnan (ohmS [ii]))
+        if nk ==0: 
+            results [k] = VESError ("No pseudo-area found.")
+            continue 
+        frho, f45 = np.poly1d (prho [ii]), np.poly1d (p45 [ii])
+        oB = X [oix [ii]:]
+        r = [ (ohmS [ii, :nk], err [ii, :nk], roots [ii, : 2 * nk ]), 
+             (np.hstack ((X[:, np.newaxis], Y[ii][:, np.newaxis])), 
+              np.hstack ((xn[:, np.newaxis], frho(xn)[:, np.newaxis])), 
+              np.hstack ((oB[:, np.newaxis], f45(oB)[:, np.newaxis]))
+              )
+            ]
+        try: 
+            results [k] = results [k]._fit_areas (r ).summary(
+                keep_params=keep_params)
+        except Exception as err_: 
+            results [k] = err_ 
+            
+    return results 
+
+def _read_sheets (args ): 
+    """ Read all the sheets of an excel file. Module-level function 
+    picklable for the process workers of :func:`_readfrompath`. 
+    
+    :param args: tuple of the excel file and the `cache` argument of 
+        :func:`watex.utils.coreutils._read_excel`. 
+    """
+    d, cache = args 
+    return _read_excel (d, cache, sheet_name =None)
+
+def _count_cache_hits (self, files, **kws ): 
+    """ Count the excel files already converted in the cache before they 
+    are read by the workers, and report the cache if verbose. 
+    
+    :param files: list of the path-like objects to read. 
+    :param kws: keywords arguments the files are read with. 
+    """
+    xlsx = [ f for f in files if str(f).lower().endswith ('.xlsx') ]
+    self.cachedir_ = _get_excel_cachedir (self.cache )
+    self.cache_hits_ = sum ( os.path.isfile (_get_excel_cachefile (
+        f, self.cache, **kws )) for f in xlsx )
+    self.cache_misses_ = len(xlsx ) - self.cache_hits_ 
+    if self.verbose > 0: 
+        info = excel_cache_info (self.cache )
+        print(f"Excel cache {self.cachedir_!r}: {self.cache_hits_} hit(s),"
+              f" {self.cache_misses_} miss(es); {info['files']} cached"
+              " workbook(s) in total.")
+
+def _iter_erp_sources (data, read_sheets =False ): 
+    """ Yield the name and the data of each line of a collection lazily. 
+    
+    The names are built as in :func:`_readfrompath`. 
+    
+    :param data: path-like object, dataframe, or list or generator of them. 
+    :param read_sheets: bool, yield each sheet of the excel files as a line. 
+    """
+    regex = re.compile (r'[$& #@%^!]', flags=re.IGNORECASE)
+    if isinstance(data, (str, pd.DataFrame) ): 
+        data = [data ]
+    for k, d in enumerate (data ): 
+        if isinstance (d, pd.DataFrame ): 
+            yield f'line{k+1}', d 
+        elif isinstance (d, str ) and os.path.isdir (d ): 
+            yield from _iter_erp_sources ([ os.path.join (d, f ) 
+                                           for f in os.listdir (d )], 
+                                          read_sheets )
+        elif isinstance (d, str ) and read_sheets: 
+            _, ex = os.path.splitext(d)
+            if ex != '.xlsx': 
+                raise TypeError ("Read multisheets expects an excel file "
+                                 f" extension <'.xlsx'> not: {ex!r}")
+            for name, sheet in _read_sheets ((d, False )).items (): 
+                yield regex.sub('_', name).lower().split('.')[0], sheet 
+        elif isinstance (d, str ): 
+            if not os.path.isfile (d ): 
+                raise FileNotFoundError(f"File not found: {d!r}")
+            yield regex.sub('_', os.path.basename(d)).split('.')[0], d 
+        else : 
+            raise TypeError("Unknow data type, Expect a path-like object "
+                            f" or a dataframe. Got {type(d).__name__!r}.")
+            
+def _readfromstore (self, data ): 
+    """ Read the lines of an :class:`ERPStore`. 
+    
+    The collection attributes are set from the parameter columns of the 
+    store and no line is loaded. The lines are fitted when they are accessed 
+    by their ids e.g. ``<object>.line2``. If `stations` or `auto` are given, 
+    the parameters are recomputed from the stored lines. 
+    
+    :param data: list-a single :class:`ERPStore` object or directory. 
+    :returns: bool- whether the data is a store or not. 
+    """
+    if len(data )!=1 or not ERPStore.is_store (data[0]): 
+        return False 
+    store = data[0] if isinstance (data[0], ERPStore ) else ERPStore (data[0])
+    
+    self.survey_names_ = list (store.names )
+    _parse_dc_args(self, ResistivityProfiling )
+    self.stations = list (self.stations ) 
+    table = store.table 
+    if self.auto or any ( s is not None for s in self.stations ): 
+        table = store.refit (self.stations, auto = self.auto )
+        
+    valid = table.station.notna().values 
+    self.isnotvalid_ = list (store.names [~valid ])
+    if not valid.any (): 
+        raise ERPError("None ERP data detected. Please check your data.")
+    for kk, st in enumerate (table.station ): 
+        self.stations[kk] = st 
+        
+    self.store_ = store ; self.data_ = store 
+    self._store_table = table [valid ]
+    self._store_ix = np.where (valid )[0] 
+    self.ids_ = np.array(make_ids (self._store_table.index, 'line', None, 
+                                   True)) 
+    self.nlines_ = len(self.ids_ )
+    
+    self.sves_ = self._store_table.station.values 
+    self.sves_resistivities_ = self._store_table.sves_resistivity.values 
+    for name, c in zip (('lat', 'lon', 'east','north'), ( 
+            'latitude', 'longitude', 'easting', 'northing')): 
+        setattr (self, f"sves_{name}s_", self._store_table[c].values )
+    for name in  ('power', 'magnitude', 'type','sfi', 'shape'): 
+        setattr (self, f"{name}s_", self._store_table[name].values )
+        
+    return True 
+
+def _fit_store_line (self, id_ ): 
+    """ Fit the line `id_` of the store, keep and return its object. """
+    kk = int (np.where (self.ids_ == id_ )[0][0]) 
+    dcObj = ResistivityProfiling(
+        station = self.sves_[kk], dipole = self.dipole, 
+        utm_zone = self.utm_zone ).fit (self.store_[self._store_ix [kk]] 
+                                        ).summary (keep_params=self.keep_params)
+    obj = type (f"{dcObj}", (ElectricalMethods,), dcObj.__dict__ )
+    setattr (self, id_, obj ) 
+    
+    return obj 
+
 def _parse_dc_args(self, dcmethod: object , **kws): 
     """ parse dc arguments to  fit the number of survey lines, populate
     and sanitize the attributes accordingly.
@@ -1799,6 +2393,15 @@ def _summary (self, return_table = True):
         instanciated object otherwise.
     
     """
+    if self.__dict__.get ('store_') is not None: 
+        # parameters of the store are read from its columns. 
+        table_ = self._store_table.drop (columns = ['station'] + ( 
+            ['dipole', 'sves_resistivity', 'latitude', 'longitude', 
+             'easting', 'northing'] if self.keep_params else []))
+        table_.index = self.ids_ 
+        self.table_ = table_ 
+        return self.table_ if return_table else self  
+    
     tables =[]
     vids_ =[]
     for sl in self.ids_: 
@@ -10,12 +10,13 @@ steps for EMAP data filtering and remove noises.
 from __future__ import annotations 
 import os
 import re
+import hashlib
 import functools 
 import warnings 
 import numpy as np 
 
 from .._watexlog import watexlog
-from ..edi import Edi 
+from ..edi import Edi, write_edis 
 from ..exceptions import ( 
     EDIError, 
     TopModuleError, 
@@ -36,7 +37,8 @@ from ..utils.funcutils import (
     smart_strobj_recognition, 
     repr_callable_obj,
     remove_outliers, 
-    normalizer
+    normalizer, 
+    run_parallel, 
     ) 
 from ..utils.exmath import ( 
     scalePosition, 
@@ -45,15 +47,23 @@ from ..utils.exmath import (
     betaj, 
     interpolate1d,
     interpolate2d, 
+    trimmed_moving_average, 
+    _trimmed_window_average, 
     get_full_frequency, 
     rhoa2z, 
     z2rhoa, 
     mu0, 
+    zcube_resphase, 
+    zcube_rotate, 
+    zcube_skew, 
+    zcube_interpolate, 
+    qc_report, 
     
     )
 from ..utils.coreutils import ( 
     makeCoords, 
     )
+from ..utils.box import Boxspace 
 from ..property import (
     IsEdi
     )
@@ -83,6 +93,8 @@ _logger = watexlog.get_watex_logger(__name__)
 
 __all__ =['EM',
           'Processing',
+          'StationStack', 
+          'StreamFilter', 
           ]
 
 class EM(IsEdi): 
@@ -100,6 +112,22 @@ class EM(IsEdi):
     survey_name: str 
         location name where the date where collected . If surveyname is None  
         can chech on edifiles. 
+        
+    n_jobs: int, optional 
+        Number of workers used to parse the EDI-files concurrently. Files are 
+        parsed in a process pool and fall back to a thread pool when the 
+        processes cannot be used. ``None`` or ``1`` reads the files serially 
+        and ``-1`` uses all the CPUs. The same workers write the EDI-files 
+        exported by :meth:`exportedis`. 
+        
+    cache: bool or str, default=False 
+        Keep the parsed impedance tensors, tippers and coordinates of the 
+        EDI-files in a binary ``.npz`` file so that refitting the same 
+        EDI-files skips the text parsing. If ``True``, the cache is stored 
+        in the ``edicache`` folder of the watex data directory (see 
+        :func:`watex.datasets.io.get_data`). A string is used as the cache 
+        directory. A file is parsed again whenever its path, modification  
+        time or size changes. 
 
     Attributes 
     -----------
@@ -108,6 +136,14 @@ class EM(IsEdi):
     data_: Array-like of shape (N, ) 
         array of all edifiles feed in the `EM` modules whatever sucessuffuly 
         read or not. 
+    isnotvalid_: list 
+        EDI-files or objects that failed to be read. 
+    cachefile_: str 
+        Path to the cache file of the collection. Only when `cache` is set.
+    cache_hits_: int 
+        Number of EDI-files restored from the cache at the last `fit`. 
+    cache_misses_: int 
+        Number of EDI-files parsed from the text at the last `fit`. 
     edinames_: array-like of shape (N,) 
         array of all edi-names sucessfully read 
     edifiles_: array of shape (N, ) 
@@ -130,12 +166,32 @@ class EM(IsEdi):
     elevation: array-like, shape (N,) 
         Elevation coordinates collected from EDIs 
         
+    stack_: :class:`StationStack` 
+        Impedance tensors of the collection stored in dense arrays of shape 
+        (N, nfreq, 2, 2). The 2D blocks of :meth:`make2d` are fetched from it.
+        
+    freq_index_: dict 
+        Index of each frequency of the complete frequency :attr:`freqs_`. 
+        
+    missing_mask_: array-like of shape (nfreq, N) 
+        Boolean mask of the frequencies missing at each station. 
+        
+    Note that the complete frequency, the reference frequency and the 
+    properties above are computed once and kept until the EDI objects, 
+    their frequencies, their tensors, errors, resistivities and phases or 
+    the coordinates are reassigned. Arrays edited in-place e.g. 
+    ``ediObjs_[0].Z.z_err[:] *= 10`` are not detected; call 
+    :meth:`clear_cache` afterwards. 
+        
     """
 
-    def __init__(self, survey_name:str  =None , verbose=0): 
+    def __init__(self, survey_name:str  =None , verbose=0, n_jobs=None, 
+                 cache=False): 
         self._logging = watexlog.get_watex_logger(self.__class__.__name__)
     
         self.survey_name =survey_name
+        self.n_jobs=n_jobs
+        self.cache=cache 
         self.Location_= Location()
         self.verbose=verbose
         self._latitude = None
@@ -187,6 +243,70 @@ class EM(IsEdi):
             
         if len(self._station_names) != len(self.ediObjs_): 
             self._station_names = self.id  
+            
+    def _cache_key (self ): 
+        """ Objects the cached quantities are computed from. They are 
+        compared by identity so any reassignment invalidates the cache."""
+        key = [self.ediObjs_] + [ getattr (self, attr, None ) for attr in (
+            '_latitude', '_longitude', '_elevation', '_station_names')]
+        for ediObj in self.ediObjs_: 
+            key += [ getattr (ediObj.Z, attr, None ) for attr in (
+                '_freq', '_z', '_z_err', '_resistivity', '_resistivity_err', 
+                '_phase', '_phase_err')]
+        return key 
+    
+    def clear_cache (self ): 
+        """ Drop the cached :attr:`stack_` and derived quantities. Needed 
+        after editing the EDI tensors in-place. """
+        for attr in ('_stack', '_stack_key', '_derived_cache', '_staged'): 
+            self.__dict__.pop (attr, None )
+        return self 
+    
+    @property 
+    def stack_ (self): 
+        """ Dense :class:`StationStack` of the collection. It is rebuilt  
+        only when the EDI objects, their tensors, errors, resistivities, 
+        phases, the coordinates or the complete frequency are reassigned. 
+        Call :meth:`clear_cache` after an in-place edit."""
+        self.inspect 
+        key = [self.freqs_] + self._cache_key () 
+        oldkey = getattr (self, '_stack_key', [] ) 
+        if ( len(key) != len(oldkey) 
+            or any ( a is not b for a, b in zip (key, oldkey))
+            ): 
+            self._stack = StationStack.from_edis (
+                self.ediObjs_, freq = self.freqs_, 
+                lat = self.latitude, lon = self.longitude, 
+                elev = self.elevation, stnames = self.stnames 
+                )
+            self._stack_key = key 
+        return self._stack 
+    
+    @property 
+    def freq_index_ (self): 
+        """ Index of each frequency in the complete frequency. """
+        return self._derived ('freq_index', lambda : { 
+            f: ii for ii, f in enumerate (self.getfullfrequency ())})
+    
+    @property 
+    def missing_mask_ (self): 
+        """ Mask of missing frequencies of shape (nfreq, n_stations). """
+        return self._derived ('missing_mask', lambda : ~self.stack_.mask.T )
+    
+    def _derived (self, name, func ): 
+        """ Memoize the quantity `name` computed by `func` from the EDI 
+        collection. The cache is cleared whenever the objects of 
+        :meth:`_cache_key` are reassigned or by :meth:`clear_cache`. """
+        self.inspect 
+        key = self._cache_key () 
+        cache = getattr (self, '_derived_cache', {'key': []} )
+        if ( len(key) != len(cache['key']) 
+            or any ( a is not b for a, b in zip (key, cache['key']))
+            ): 
+            cache = self._derived_cache = {'key': key }
+        if name not in cache: 
+            cache[name] = func () 
+        return cache[name]
     
     def is_valid (self, 
         obj: str | EDIO 
@@ -318,18 +438,73 @@ class EM(IsEdi):
     
         if not types: rf = self.data_ # if objects is set 
         
-        # read EDI objects 
-        try: 
-            self.ediObjs_ = list(map(lambda o: self.is_valid(o), self.data_))  
-        except EDIError: 
-            objn = type(self.ediObjs_[0]).__name__
-            raise EMError (f"Expect a list of EDI objects. Got {objn!r}") 
+        # read EDI objects and collect the failures per file 
+        # rather than aborting the whole collection. 
+        objs = self._read_edis_from_cache () if self.cache else run_parallel(
+            _read_edi, self.data_, n_jobs = self.n_jobs ) 
+        self.ediObjs_, self.isnotvalid_, errors = [], [], []
+        for o, obj in zip (self.data_, objs): 
+            if isinstance (obj, Exception ): 
+                self._logging.error (f"Unable to read {o!r}: {obj}")
+                self.isnotvalid_.append(o) ; errors.append (obj)
+            else: self.ediObjs_.append(obj)
+            
+        if len(self.ediObjs_)==0: 
+            if not isinstance (errors[0], EDIError): 
+                raise errors[0]
+            objn = type(self.data_[0]).__name__
+            raise EMError (f"Expect a list of EDI objects. Got {objn!r}"
+                           ) from errors[0]
+        if len(self.isnotvalid_)!=0: 
+            warnings.warn (f"Found {len(self.isnotvalid_)} invalid EDI data."
+                           " Check the attribute 'isnotvalid_' for details.")
         
         if self.verbose:
             try:show_stats(rf, self.ediObjs_)
             except: pass 
         
 
+    def _read_edis_from_cache (self ): 
+        """ Restore the EDI-files from the cache and parse only the files 
+        that are missing or changed since the cache was written. """
+        objs = list(self.data_) 
+        self.cache_hits_, self.cache_misses_ = 0, 0 
+        
+        if not all ([ isinstance (o, str) for o in objs ]): 
+            # EDI-objects are already parsed. 
+            return run_parallel(_read_edi, objs, n_jobs = self.n_jobs ) 
+        
+        cachedir = self.cache if isinstance (self.cache, str) else None 
+        stats = [_edi_stat (o) for o in objs ]
+        self.cachefile_ = _get_cachefile (
+            [ st[0] for st in stats], cachedir = cachedir )
+        cached = _load_edi_cache(self.cachefile_)
+        
+        misses = [ ii for ii, st in enumerate (stats) if cached.get (
+            st[0], {}).get('stat')!= st ]
+        self.cache_hits_ = len(objs) - len(misses) 
+        self.cache_misses_ = len(misses) 
+        
+        missed = set (misses )
+        for ii, o in enumerate (objs ): 
+            if ii not in missed: 
+                objs [ii] = _edi_from_cache(o, cached[stats[ii][0]])
+                
+        if misses: 
+            for ii, obj in zip (misses, run_parallel(
+                    _read_edi, [objs[ii] for ii in misses], 
+                    n_jobs = self.n_jobs)): 
+                objs[ii] = obj 
+            valid = [ ii for ii, obj in enumerate (objs) 
+                     if not isinstance (obj, Exception )]
+            try: 
+                _dump_edi_cache (self.cachefile_, [objs[ii] for ii in valid], 
+                                 [stats[ii] for ii in valid] )
+            except OSError as err : 
+                self._logging.warning (f"Unable to write the EDI cache: {err}")
+                
+        return objs 
+    
     def _get_tensor_and_err_values (self, attr ): 
         """ Get tensor with error and put in dictionnary 
         of station/tensor values.
@@ -621,6 +796,9 @@ class EM(IsEdi):
         cobjs = np.zeros_like (self.ediObjs_, dtype=object ) 
         
         for k, (obj, did) in enumerate(zip(self.ediObjs_, dataid)): 
+            if getattr (obj, '_from_cache', False ): 
+                # sections were not restored from the cache. 
+                obj._read_sections() ; obj._from_cache = False 
             obj.Head.edi_header = None  
             obj.Head.dataid = did 
             obj.Info.ediinfo = None 
@@ -690,14 +868,17 @@ class EM(IsEdi):
                2.15433266, 2.10202186, 2.04972182, 1.99743007])
 
         """
-        self.inspect 
-        return get_full_frequency (self.ediObjs_ , to_log10 = to_log10) 
+        f = self._derived ('freqs', lambda : get_full_frequency (
+            self.ediObjs_ ))
+        return np.log10(f) if to_log10 else f 
 
     def make2d (
         self,
         out:str = 'resxy',
         *, 
         kind:str = 'complex' , 
+        zcube: NDArray[DType[complex]] | "StationStack" =None, 
+        freqs: ArrayLike =None, 
         **kws 
         )-> NDArray[DType[float]]: 
         """ Out 2D resistivity, phase-error and tensor matrix from a collection
@@ -723,6 +904,16 @@ class EM(IsEdi):
             tensor should be outputted. If ``real`` or``imag``, it returns only
             the specific one. Default is ``complex``.
             
+        zcube: ndarray of shape (n_stations, n_freq, 2, 2) or \
+            :class:`StationStack`, optional 
+            Impedance tensors of the survey. If given, the 2D block is 
+            computed from it rather than the fitted EDI collection.
+            
+        freqs: array-like of shape (n_freq, ), optional 
+            Frequency of the impedance tensors `zcube`. If ``None``, the 
+            complete frequency of the fitted collection :attr:`freqs_` is 
+            used. Not needed when `zcube` is a :class:`StationStack`. 
+            
         kws: dict 
             Additional keywords arguments from :func:`~.getfullfrequency `. 
         
@@ -765,67 +956,25 @@ class EM(IsEdi):
         ... ((55, 3), (55, 3), (55, 3))
         
         """
-        self.inspect 
-        
-        def fit2dall(objs, attr, comp): 
-            """ Read all ediObjs and replace all missing data by NaN value. 
-            
-            This is useful to let the arrays at each station to  match the length 
-            of the complete frequency rather than shrunking  up some data. The 
-            missing data should be filled by NaN values. 
-            
-            """
-            zl = [getattr( ediObj.Z, f"{attr}")[tuple (_c.get(comp))]
-                  for ediObj in objs ]
-            
-            if name =='z': 
-                if kind =='modulus': 
-                    zl = [ np.abs (v) for v in zl]
-                    zl = [fittensor(self.freqs_, ediObj.Z._freq, v)
-                          for ediObj ,  v  in zip(objs, zl)]
-                if kind in ('real' , 'complex') : 
-                    zr = [fittensor(self.freqs_, ediObj.Z._freq, v.real)
-                          for ediObj ,  v  in zip(objs, zl)]
-                    
-                if kind in ('imag', 'complex'): 
-                    zi= [fittensor(self.freqs_, ediObj.Z._freq, v.imag)
-                          for ediObj ,  v  in zip(objs, zl)]
-                    
-                if kind =='complex': 
-                    zl = [ r + 1j * im for r, im in zip (zr, zi)]
-                    
-                    
-                zl = zl if kind in ('modulus', 'complex') else (
-                    zr if kind =='real' else zi )    
-            else : 
-                zl = [fittensor(self.freqs_, ediObj.Z._freq, v)
-                      for ediObj ,  v  in zip(objs, zl)]
-                
-            # stacked the z values alomx axis=1. 
-            return np.hstack ([ reshape (o, axis=0) for o in zl])
-           
-        # read/assert edis and get the complete frequency     
-        name , m2 = _validate_tensor(out = out , kind = kind, **kws )
-        
-        #=> slice index for component retreiving purpose 
-        _c= {
-              'xx': [slice (None, len(self.freqs_)), 0 , 0] , 
-              'xy': [slice (None, len(self.freqs_)), 0 , 1], 
-              'yx': [slice (None, len(self.freqs_)), 1 , 0], 
-              'yy': [slice (None, len(self.freqs_)), 1,  1] 
-        }
-        #==> returns mat2d freq 
-        # if m1 =='_freq': 
-        if name =='_freq': 
-            f2d  = [fittensor(self.freqs_, ediObj.Z._freq, ediObj.Z._freq)
-                  for ediObj in self.ediObjs_
-                  ]
-            return  np.hstack ([ reshape (o, axis=0) for o in f2d])
+        if zcube is not None: 
+            return self._to_stack(zcube, freqs).get2d (
+                out = out, kind = kind, **kws )
         
-        # # get the value for exportation (attribute name and components)
-        mat2d  = fit2dall(objs= self.ediObjs_, attr= name, comp= m2)
+        self.inspect 
         
-        return mat2d 
+        return self.stack_.get2d (out = out, kind = kind, **kws ) 
+    
+    def _to_stack (self, zcube, freqs =None ): 
+        """ Wrap the impedance tensors of the survey `zcube` into a 
+        :class:`StationStack` object."""
+        if isinstance (zcube, StationStack): 
+            return zcube 
+        if freqs is None: 
+            freqs = getattr (self, 'freqs_', None)
+        if freqs is None: 
+            raise EMError("Frequency of the impedance tensors is needed. Fit"
+                          " the EDI data or pass the 'freqs' argument.")
+        return StationStack (freqs, zcube )
  
     def getreferencefrequency (
         self,
@@ -862,25 +1011,23 @@ class EM(IsEdi):
         http://www.zonge.com/legacy/PDF_DatPro/Astatic.pdf
         
         """
-        self.inspect 
         self.freqs_= self.getfullfrequency ()
+        rf = self._derived ('refreq', self._getreferencefrequency )
+        
+        return  rf if not to_log10 else np.log10(rf)
+    
+    def _getreferencefrequency (self ): 
+        """ Compute the highest frequency with clean data. """
         # fit z and find all missing data from complete frequency f 
         # we take only the component xy for fitting.
-
-        zxy = [fittensor(self.freqs_, ediObj.Z._freq, ediObj.Z.z[:, 0, 1].real)
-              for ediObj in self.ediObjs_
-              ]
-        # stacked the z values alomx axis=1. 
-        arr2d = np.hstack ([ reshape (o, axis=0) for o in zxy])
-
+        arr2d = self.stack_.get2d ('zxy', kind ='real')
             
         ix_nan = reshape (np.argwhere(np.isnan(arr2d).any(axis =1) ))
             # create bool array and mask the row of NaN 
         mask = np.full_like (self.freqs_, fill_value = True , dtype=bool)
         mask[[*ix_nan] ] = False 
         # get the reference frequency and index 
-        return  self.freqs_ [mask].max() if not to_log10 else np.log10(
-            self.freqs_ [mask].max())
+        return  self.freqs_ [mask].max() 
     
     def _exportedi (self, ediObj: EDIO)-> "EDIO" :
         """Isolated part for validate EDI for multiple EDI exports 
@@ -926,6 +1073,11 @@ class EM(IsEdi):
            Path to save a new EDI file. If ``None``, outputs to `_outputEDI_`
            folder.
            
+        kws: dict, 
+            Additional keywords arguments of :func:`watex.edi.write_edis`. 
+            The files are formatted in memory and written concurrently 
+            with the :attr:`n_jobs` workers. 
+            
         Returns 
         --------
          ediObj from watex.edi.Edi 
@@ -947,13 +1099,14 @@ class EM(IsEdi):
             transform =True 
             )
         
-        for e, z  in zip (ediObjs, new_Z ): 
-            e= self._exportedi(e) 
-            e.write_new_edifile( 
-                new_Z=z,
-                savepath = savepath , 
-                **kws
-                )
+        ediObjs = [ self._exportedi(e) for e in ediObjs ]
+        write_edis (
+            ediObjs, 
+            new_Z = new_Z, 
+            savepath = savepath , 
+            n_jobs = self.n_jobs, 
+            **kws
+            )
         
     def __repr__(self):
         """ Pretty format for programmer guidance following the API... """
@@ -969,6 +1122,399 @@ class EM(IsEdi):
             f'{appender}{"" if rv is None else "?"}'
             )
 
+def _read_edi (obj: str | EDIO )-> Edi: 
+    """ Read and assert an EDI-file or object. Stays at the module level 
+    to be dispatched to the process workers of :meth:`EM._read_emo`."""
+    return EM().is_valid(obj )
+    
+def _edi_stat (edifile: str )-> Tuple[str, int, int]: 
+    """ Key of an EDI-file in the cache: absolute path, modification time 
+    in nanoseconds and size in bytes."""
+    st = os.stat (edifile ) 
+    return os.path.abspath (edifile ), int(st.st_mtime_ns), int(st.st_size )
+
+def _get_cachefile (
+    edifiles: List[str], 
+    cachedir: Optional[str] =None 
+    )-> str: 
+    """ Get the cache file path of a collection of EDI-files. 
+    
+    The name is the hash of the sorted absolute paths so each collection 
+    owns a single file. 
+    """
+    if cachedir is None: 
+        from ..datasets.io import get_data 
+        cachedir = os.path.join (get_data(), 'edicache') 
+    os.makedirs(cachedir, exist_ok =True )
+    key = hashlib.sha1 ('\n'.join(sorted (edifiles )).encode()).hexdigest()
+    
+    return os.path.join (cachedir , f'edis_{key[:20]}.npz')
+
+def _load_edi_cache (cachefile: str )-> Dict[str, dict]: 
+    """ Load the cache file and split the columnar arrays per EDI-file. 
+    
+    :return: dict of EDI absolute path and dict of its stored arrays. Empty 
+        dict if the cache does not exist or cannot be read. 
+    """
+    if not os.path.isfile (cachefile ): 
+        return {}
+    try : 
+        with np.load (cachefile, allow_pickle =False ) as npz : 
+            c = { k: npz[k] for k in npz.files }
+    except Exception as err : 
+        _logger.warning (f"Ignore the unreadable EDI cache {cachefile!r}:"
+                         f" {err}")
+        return {}
+    cached = {} 
+    for ii, (path, mtime, size) in enumerate (zip (
+            c['paths'], c['mtimes'], c['sizes'])): 
+        sl = slice (c['offsets'][ii], c['offsets'][ii+1]) 
+        cached [str(path)] = dict (
+            stat = (str(path), int(mtime), int(size)), 
+            dataid = str(c['dataids'][ii]), 
+            lat = str(c['lats'][ii]), lon = str(c['lons'][ii]), 
+            elev = str(c['elevs'][ii]), 
+            dataline = int(c['datalines'][ii]),
+            freq = c['freq'][sl], z = c['z'][sl], z_err = c['z_err'][sl], 
+            zrot = c['zrot'][sl], 
+            tipper = c['tipper'][sl] if c['has_tip'][ii] else None, 
+            tipper_err = c['tipper_err'][sl], trot = c['trot'][sl], 
+            )
+    return cached 
+
+def _dump_edi_cache (
+    cachefile: str , 
+    ediObjs: List[EDIO], 
+    stats: List[Tuple[str, int, int]] 
+    )-> None: 
+    """ Write the tensors and coordinates of a collection of EDI-objects 
+    into a single compressed ``.npz`` file. Arrays of all the stations are 
+    concatenated along the frequency axis and split back with `offsets`. 
+    """
+    def _rotation (angle, nfreq): 
+        return np.broadcast_to(np.asarray(
+            0. if angle is None else angle, dtype =np.float64 ), (nfreq,))
+    
+    zobjs = [ obj.Z for obj in ediObjs ]
+    nfreqs = [ len(zo._freq) for zo in zobjs ]
+    tips = [ obj.Tip._tipper for obj in ediObjs ]
+    
+    tipper = [ np.zeros ((nf, 1, 2), dtype =np.complex128 ) if t is None 
+              else t for t, nf in zip (tips, nfreqs) ]
+    tipper_err = [ np.zeros ((nf, 1, 2)) if t is None 
+                  or obj.Tip._tipper_err is None else obj.Tip._tipper_err 
+                  for t, nf, obj in zip (tips, nfreqs, ediObjs) ]
+    
+    np.savez_compressed (
+        cachefile, 
+        paths = np.array ([ st[0] for st in stats ], dtype =str ), 
+        mtimes = np.array ([ st[1] for st in stats ], dtype =np.int64 ), 
+        sizes = np.array ([ st[2] for st in stats ], dtype =np.int64 ), 
+        offsets = np.concatenate (([0], np.cumsum (nfreqs))), 
+        dataids = np.array ([ str(obj.Head.dataid) for obj in ediObjs], 
+                            dtype =str ), 
+        lats = np.array ([ str(obj.lat) for obj in ediObjs ], dtype =str), 
+        lons = np.array ([ str(obj.lon) for obj in ediObjs ], dtype =str), 
+        elevs = np.array ([ str(obj.elev) for obj in ediObjs ], dtype =str), 
+        datalines = np.array ([ obj.edi_data_sectionline_ 
+                               for obj in ediObjs ], dtype =np.int64 ), 
+        freq = np.concatenate ([ zo._freq for zo in zobjs ]), 
+        z = np.concatenate ([ zo._z for zo in zobjs ]), 
+        z_err = np.concatenate ([ zo._z_err for zo in zobjs ]), 
+        zrot = np.concatenate ([ _rotation(zo.rotation_angle, nf) 
+                               for zo, nf in zip (zobjs, nfreqs)]), 
+        has_tip = np.array ([ t is not None for t in tips ]), 
+        tipper = np.concatenate (tipper ), 
+        tipper_err = np.concatenate (tipper_err), 
+        trot = np.concatenate ([ _rotation(
+            obj.Tip.rotation_angle if t is not None else None, nf) 
+            for obj, t, nf in zip (ediObjs, tips, nfreqs)]), 
+        )
+    
+def _edi_from_cache (edifile: str , c: dict )-> Edi: 
+    """ Rebuild an EDI-object from its cached arrays without parsing the 
+    EDI-file. Only the location and station id are restored from the 
+    header; the other sections are read from the file on demand."""
+    obj = Edi () 
+    obj.edifile = edifile 
+    obj.edi_data_sectionline_ = c['dataline']
+    obj._from_cache = True 
+    obj.Head.dataid = c['dataid']
+    for attr in ('lat', 'lon', 'elev'): 
+        if c[attr]!='None': 
+            setattr (obj, attr, c[attr])
+            
+    obj.Z._freq, obj.Z._z_err, obj.Z._z = c['freq'], c['z_err'], c['z'] 
+    obj.Z.rotation_angle = c['zrot'] 
+    obj.Z.compute_resistivity_phase() 
+    
+    if c['tipper'] is not None: 
+        obj.Tip._freq , obj.Tip._tipper = c['freq'], c['tipper']
+        obj.Tip._tipper_err = c['tipper_err'] 
+        obj.Tip.rotation_angle = c['trot']
+        obj.Tip.compute_amp_phase (), obj.Tip.compute_mag_direction()
+        
+    return obj 
+
+class StationStack: 
+    """ Dense impedance tensor container of a collection of EDI/Z objects. 
+    
+    Hold the impedance tensors of the whole survey in contiguous arrays of 
+    shape (n_stations, n_freq, 2, 2) aligned on the complete frequency. 
+    Frequencies missing at a station are masked by NaN values, the same way 
+    :func:`~watex.utils.exmath.fittensor` does. The 2D blocks 
+    (n_freq, n_stations) expected by the |EMAP| filters are therefore 
+    simple views of the cubes and no longer rebuilt from the EDI objects.
+    
+    Parameters 
+    -----------
+    freq: array-like, shape (n_freq, )
+        Complete frequency of the survey in Hz. 
+        
+    z: ndarray of complex, shape (n_stations, n_freq, 2, 2) 
+        Impedance tensor cube. 
+        
+    z_err: ndarray, shape (n_stations, n_freq, 2, 2), optional 
+        Impedance tensor error cube. 
+        
+    resistivity, resistivity_err, phase, phase_err: ndarray, optional  
+        Apparent resistivity and phase cubes with their errors. When they are 
+        not given, they are computed from `z` and `z_err`. 
+        
+    lat, lon, elev: array-like, shape (n_stations, ), optional 
+        Coordinates of the stations. 
+        
+    stnames: list of str, optional 
+        Name of the stations. 
+        
+    Examples 
+    ---------
+    >>> import watex as wx 
+    >>> from watex.methods.em import StationStack 
+    >>> edi_data = wx.fetch_data ('huayuan', samples =7, return_data =True , 
+                                  key ='raw')
+    >>> stack = StationStack.from_edis (edi_data ) 
+    >>> stack.z.shape 
+    (7, 56, 2, 2)
+    >>> stack.get2d ('phaseyx').shape 
+    (56, 7)
+    >>> stack.mask.sum (axis =1 ) # number of valid frequencies per station 
+    array([52, 53, 53, 53, 56, 56, 56])
+    """
+    def __init__(
+        self, 
+        freq: ArrayLike, 
+        z: NDArray[DType[complex]], 
+        z_err: NDArray[DType[float]]=None, 
+        *, 
+        resistivity: NDArray[DType[float]]=None, 
+        resistivity_err: NDArray[DType[float]]=None, 
+        phase: NDArray[DType[float]]=None, 
+        phase_err: NDArray[DType[float]]=None, 
+        lat: ArrayLike =None, 
+        lon: ArrayLike =None, 
+        elev: ArrayLike =None, 
+        stnames: List[str] =None, 
+        ): 
+        self.freq = np.asarray (freq, dtype = np.float64 )
+        self.z = np.asarray (z, dtype = np.complex128 )
+        if self.z.ndim !=4 or self.z.shape[1:] != (len(self.freq), 2, 2): 
+            raise EMError("Impedance cube must be shaped as (n_stations,"
+                          f" n_freq={len(self.freq)}, 2, 2). Got"
+                          f" {self.z.shape}.")
+        self.z_err = ( np.full (self.z.shape, np.nan ) if z_err is None 
+                      else np.asarray (z_err, dtype = np.float64) ) 
+        
+        if resistivity is None or phase is None: 
+            resistivity, phase, resistivity_err, phase_err = zcube_resphase(
+                self.z, self.freq, self.z_err )
+            
+        self.resistivity = resistivity 
+        self.resistivity_err = resistivity_err 
+        self.phase = phase 
+        self.phase_err = phase_err 
+        
+        nsta = len(self.z )
+        self.lat = np.full ( nsta, np.nan) if lat is None else np.asarray(lat)
+        self.lon = np.full ( nsta, np.nan) if lon is None else np.asarray(lon)
+        self.elev = np.full (nsta, np.nan) if elev is None else np.asarray(
+            elev)
+        self.stnames = ( [f'S{k:02}' for k in range (nsta)] 
+                        if stnames is None else list(stnames) ) 
+        
+    @classmethod 
+    def from_edis (
+        cls, 
+        z_or_edis_obj_list: List [EDIO |ZO], 
+        /, 
+        freq: ArrayLike =None, 
+        **kws 
+        )-> "StationStack": 
+        """ Build the dense container from a collection of EDI or Z objects. 
+        
+        :param z_or_edis_obj_list: list of :class:`watex.edi.Edi` or 
+            :class:`watex.externals.z.Z` objects. 
+        :param freq: array-like, complete frequency used to align the 
+            tensors. If ``None``, it is fetched from the collection using 
+            :func:`~watex.utils.exmath.get_full_frequency`. 
+        :param kws: dict, additional keywords passed to the :class:`StationStack`
+            constructor such as the station names. 
+        :return: :class:`StationStack` object. 
+        """
+        obj_type  = _assert_z_or_edi_objs (z_or_edis_obj_list)
+        zobjs = [ o.Z if obj_type =='EDI' else o for o in z_or_edis_obj_list ]
+        freq = ( get_full_frequency (z_or_edis_obj_list) if freq is None 
+                else np.asarray (freq ) ) 
+        
+        shape = (len(zobjs), len(freq), 2, 2 ) 
+        z = np.full (shape, np.nan + 1j * np.nan , dtype = np.complex128 )
+        arrs = { attr : np.full (shape, np.nan ) for attr in (
+            'z_err', 'resistivity', 'resistivity_err', 'phase', 'phase_err')}
+        
+        for ii, zobj in enumerate (zobjs): 
+            # same alignment than fittensor: data are set where 
+            # the station frequencies are found in the complete frequency.
+            mask = np.isin (freq, zobj._freq ) 
+            z [ii, mask] = zobj.z 
+            for attr, arr in arrs.items (): 
+                v = getattr (zobj, attr )
+                if v is not None: 
+                    arr [ii, mask ] = v 
+                    
+        if obj_type =='EDI': 
+            for coord in ('lat', 'lon', 'elev'): 
+                kws.setdefault (coord, np.array ([ 
+                    getattr (o, coord, np.nan) for o in z_or_edis_obj_list]))
+                
+        return cls ( freq, z, **arrs, **kws ) 
+    
+    @property 
+    def mask (self): 
+        """ Boolean array of shape (n_stations, n_freq). ``True`` where the 
+        tensor is available at the station frequency."""
+        return ~np.isnan (self.z).all (axis =(2, 3))
+    
+    @property 
+    def shape (self): 
+        """ Shape of the impedance cube."""
+        return self.z.shape 
+    
+    def get2d (
+        self, 
+        out: str ='resxy', 
+        *, 
+        kind: str ='complex', 
+        **kws
+        )-> NDArray[DType[float]]: 
+        """ Get the 2D block (n_freq, n_stations) of a tensor component. 
+        
+        :param out: str, kind of data to output e.g. ``resxy``, ``phaseyx``, 
+            ``zxy_err`` or ``freq``. Refer to :meth:`EM.make2d`. 
+        :param kind: str, part of the impedance tensor to output. Can be 
+            ``modulus``, ``real``, ``imag`` or ``complex``. 
+        :param kws: dict, additional keywords passed to 
+            :func:`~watex.utils.validator._validate_tensor`. 
+        :return: ndarray of shape (n_freq, n_stations). Missing data are 
+            filled by NaN. 
+        """
+        name , m2 = _validate_tensor(out = out , kind = kind, **kws )
+        if name =='_freq': 
+            return np.where (self.mask.T, self.freq[:, None], np.nan )
+        
+        ii, jj = {'xx': (0, 0), 'xy': (0, 1), 'yx': (1, 0), 'yy': (1, 1)}[m2]
+        mat2d = getattr (self, name )[:, :, ii, jj].T 
+        
+        if name =='z': 
+            kind = str(kind).lower() 
+            kind = 'imag' if kind.find('imag') >=0 else kind 
+            mat2d = {'modulus': np.abs , 'real': np.real, 'imag': np.imag, 
+                     'complex': np.array }[kind] (mat2d)
+            
+        return np.array (mat2d ) 
+    
+    def rotate (self, angle: float | ArrayLike )-> "StationStack": 
+        """ Rotate the tensors of all the stations at once. 
+        
+        :param angle: float or array-like of shape (n_stations, ) or 
+            (n_stations, n_freq), rotation angle in degrees clockwise from 
+            the North. Refer to :func:`~watex.utils.exmath.zcube_rotate`. 
+        :return: New :class:`StationStack` with the rotated tensors. 
+        """
+        z, z_err = zcube_rotate (self.z, angle, self.z_err )
+        return self.__class__ (self.freq, z, z_err, lat = self.lat, 
+                               lon = self.lon, elev = self.elev, 
+                               stnames = self.stnames 
+                               )
+    
+    def interpolate (
+        self, 
+        new_freq: ArrayLike, 
+        **kws 
+        )-> "StationStack": 
+        """ Resample the tensors of all the stations onto a common frequency.
+        
+        Useful to make all the stations share the same frequency table 
+        before exporting the data for the 2D inversion. 
+        
+        :param new_freq: array-like, frequency in Hz to interpolate onto. 
+        :param kws: dict, additional keywords passed to 
+            :func:`~watex.utils.exmath.zcube_interpolate` such as the 
+            ``period_buffer`` or ``extrapolate``. 
+        :return: New :class:`StationStack` aligned on `new_freq`. 
+        
+        :example: 
+        >>> import numpy as np 
+        >>> import watex as wx 
+        >>> from watex.methods.em import StationStack 
+        >>> edi_data = wx.fetch_data ('huayuan', samples =7, return_data =True , 
+                                      key ='raw')
+        >>> stack = StationStack.from_edis (edi_data ) 
+        >>> stack.interpolate (np.logspace (4, 1, 20 ), 
+                               period_buffer =2. ).shape 
+        (7, 20, 2, 2)
+        """
+        z, z_err = zcube_interpolate (self.z, self.freq, new_freq, 
+                                      self.z_err, **kws )
+        return self.__class__ (new_freq, z, z_err, lat = self.lat, 
+                               lon = self.lon, elev = self.elev, 
+                               stnames = self.stnames 
+                               )
+    
+    def to_z (self )-> List[EMz]: 
+        """ Split the stack into :class:`watex.externals.z.Z` objects, one 
+        per station, e.g. to be written with :meth:`EM.exportedis`. 
+        Missing tensors are kept as NaN."""
+        zobjs =[] 
+        for z, z_err in zip (self.z, self.z_err ): 
+            zobj = EMz(z_array= z.copy (), z_err_array = z_err.copy (), 
+                       freq = self.freq.copy () )
+            with np.errstate (all ='ignore'): 
+                zobj.compute_resistivity_phase()
+            zobjs.append (zobj )
+        return zobjs 
+    
+    def __getitem__ (self, key ): 
+        """ Select a sub-collection of stations."""
+        key = np.arange (len(self))[key] 
+        return self.__class__ ( 
+            self.freq, self.z[key], self.z_err[key], 
+            resistivity = self.resistivity[key], 
+            resistivity_err= self.resistivity_err[key], 
+            phase = self.phase[key], 
+            phase_err= self.phase_err[key], 
+            lat = np.atleast_1d(self.lat[key]), 
+            lon = np.atleast_1d(self.lon[key]), 
+            elev = np.atleast_1d(self.elev[key]), 
+            stnames = np.atleast_1d(np.array (self.stnames, dtype =object)[key]), 
+            )
+        
+    def __len__ (self): 
+        return len(self.z )
+    
+    def __repr__(self): 
+        return ( f"{self.__class__.__name__}(n_stations={len(self)},"
+                f" n_freq={len(self.freq)})" ) 
+        
 class _zupdate(EM): 
     """ A decorator for impedance tensor updating. 
     
@@ -1117,6 +1663,40 @@ class Processing (EM) :
         adaptation process to control the roll-off characteristics
         of the applied Hanning window. It is recommended to select `c` between 
         ``1``  and ``4``.  Default is ``2``. 
+        
+    pad_mode: str, default='constant' 
+        How the |FLMA| and |AMA| filters extend the line beyond its first 
+        and last stations. Any mode of :func:`numpy.pad` e.g. ``edge`` or 
+        ``reflect``. ``constant`` pads with zeros as the former row by row 
+        convolution. 
+        
+    weights: dict, optional 
+        Precomputed Hanning weights of the |FLMA| and |AMA| filters keyed by 
+        window size. The weights never change, so the missing window sizes 
+        are computed once and added to the dict. ``None`` uses the cache 
+        shared by all the filters. 
+        
+    chunksize: int, optional 
+        Number of stations processed at once. When given, the reference 
+        frequency, the |EMAP| filters, the skew and the ``logf`` restoration 
+        read the tensors by blocks of stations, overlapped by the filter 
+        window, so the result is the same as when all the stations are 
+        processed in memory. The dense :attr:`stack_` and the whole 
+        :attr:`res2d_` and :attr:`phs2d_` are then never built. 
+        
+    memmap_dir: str, optional 
+        Directory where the arrays read by blocks are staged when `chunksize` 
+        is given. The resistivity and phase 2D arrays of the component and 
+        the impedance tensors are streamed block by block from the EDI 
+        objects into one memory-mapped ``.npy`` file each (e.g. 
+        ``resxy.npy``, ``phasexy.npy``, ``z.npy``) and the blocks are then 
+        sliced from these files. The files are written once and rewritten 
+        when the EDI collection changes. If ``None``, each block is built 
+        again from the EDI objects. 
+        
+    n_jobs: int, optional 
+        Number of workers used to parse the EDI-files concurrently. Refer 
+        to :class:`EM` documentation. 
 
     Examples 
     --------
@@ -1157,6 +1737,10 @@ class Processing (EM) :
         method:str ='slinear', 
         out:str  ='srho', 
         c: int =2, 
+        pad_mode:str ='constant', 
+        weights: dict =None, 
+        chunksize: int =None, 
+        memmap_dir: str =None, 
         **kws
         ): 
         super().__init__(**kws)
@@ -1168,10 +1752,15 @@ class Processing (EM) :
         self.method=method 
         self.out=out 
         self.c=c
+        self.pad_mode=pad_mode 
+        self.weights=weights 
+        self.chunksize=chunksize 
+        self.memmap_dir=memmap_dir 
         
 
     def tma (
         self,
+        axis: int = 1, 
     )-> NDArray[DType[float]] :
         
         """ A trimmed-moving-average filter to estimate average apparent
@@ -1186,6 +1775,10 @@ class Processing (EM) :
         ----------
         data: path-like object or list  of  pycsamt.core.edi.Edi 
             Collections of EDI-objects from `pycsamt`_ 
+            
+        axis: int, default=1 
+            Axis along which the trimmed average is computed. ``1`` filters 
+            along the stations and ``0`` along the frequencies. 
     
         Returns 
         -------
@@ -1200,78 +1793,146 @@ class Processing (EM) :
         """
         self.inspect
         # assert filter arguments 
-        self.res2d_ , self.phs2d_ , self.freqs_, self.c, self.window_size, \
+        _, _, self.freqs_, self.c, self.window_size, \
             self.component, self.out = self._make2dblobs ()
- 
+        # get the index of the reference frequency  and collect 
+        # the resistivity and phase at that frequency 
+        ix_rf = self.freq_index_[self.refreq_]
+        if self.chunksize is not None: 
+            # the trimmed window reaches window_size //2 stations 
+            return self._filter_by_blocks (
+                self._tma_block, 
+                halo = max (self.window_size //2, 1 ) if axis ==1 else 0, 
+                width = self.window_size if axis ==1 else 1, 
+                ix_rf = ix_rf, 
+                axis = axis 
+                )
         #  interpolate resistivity and phases 
         self.phs2d_= interpolate2d(
             self.phs2d_, method =self.method)
         self.res2d_= interpolate2d(
             self.res2d_, method =self.method)
-        # get the index of the reference frequency  and collect 
-        # the resistivity and phase at that frequency 
-        ix_rf = np.int(reshape (np.argwhere (self.freqs_==self.refreq_)))  
-        # normalize log frequency and take the normalize ref freq 
-        norm_f = (np.log10(self.freqs_) / np.linalg.norm(
-            np.log10(self.freqs_)))
-        # compute the slope at each normalize frequency 
-        slope2d = np.arctan( (np.deg2rad(self.phs2d_) / (
-            np.pi /4 )) -1 ) / (np.pi /2 )
-        log_rho2d = np.log10 (self.res2d_) + norm_f[:, None] * slope2d 
-        # extrapolate up 
-        # replace the up frequency thin the index of rf by interpolating up 
-        log_rho2d [:ix_rf, :] = np.log10 (
-            self.res2d_[:ix_rf, : ]) + np.log10(
-                np.sqrt(2)) * slope2d[:ix_rf, :]
-        
-        # make an array of weight factor wf 
-        wf = np.zeros_like(log_rho2d) # average logj 
+        
+        return self._tma_block (self.res2d_, self.phs2d_, ix_rf = ix_rf, 
+                                axis = axis )
+    
+    def _tma_block (self, res2d, phs2d, *, ix_rf, axis =1, first =True ): 
+        """ |TMA| filter of the interpolated 2D blocks of resistivity and 
+        phase. `first` is kept for a common signature with the |EMAP| 
+        filters blocks."""
+        log_rho2d = _tma_log_rho (res2d, phs2d, self.freqs_, ix_rf)
+        
         # For each station collect a group of window-size log(rj ), 
         # #i.e. for window size =5 station index j, i = j-2 to j+2. 
-        half_window = self.window_size //2 
-        for ii in range(log_rho2d.shape[1]):
-            
-            if ii ==0 or ii ==log_rho2d.shape[1] -1: 
-                w = (log_rho2d[ :, :ii + half_window +1] 
-                     if  ii - half_window < 0 else 
-                     log_rho2d[:, ii-half_window:] 
-                     ) if self.mode =='valid' else log_rho2d[:, ii][:, None]
-      
-            elif ii - half_window < 0: 
-                w= log_rho2d[ :, :ii + half_window +1]
-                
-            elif ii + half_window +1 > log_rho2d.shape[1]: 
-                w= log_rho2d[:, ii-half_window:]
-    
-            else : 
-                # Discard the lowest and highest valued log(rj ) 
-                # from the group of five and average the remaining
-                # three => avg_logj.
-                w= log_rho2d[:, ii-half_window : half_window + ii + 1 ]
-                try : 
-                    ls = [ np.delete (w[ii, :] , np.where (
-                        np.logical_or(w[ii, :] ==w[ii, :].max(),
-                                      w[ii, :] ==w[ii, :].min())
-                        )) for ii in range (len(w))]
-                    
-                    w = np.vstack (ls)
-                except : 
-                    # in the case the ls has some array with different length 
-                    # do the average manually and set as an array of axis 1.  
-                    ls = [np.sum(w[ii, :])/ len(w[ii, :]
-                                                ) for ii in range(len(w))]
-                    w = np.array(ls)[:, None] # make axis = 1
-                
-            wf[:, ii] = np.average (w, axis = 1)
+        # Discard the lowest and highest valued log(rj ) from the group 
+        # of five and average the remaining three => avg_logj.
+        wf = trimmed_moving_average(
+            log_rho2d, window_size = self.window_size, mode = self.mode, 
+            axis = axis )
             
         # compute the correction factor cf
         cf = np.power(10, wf, dtype =float)/ np. power(10, log_rho2d) 
         
-        rc = self.res2d_ * cf 
+        rc = res2d * cf 
         if self.out =='z': 
-            rc = rhoa2z(rc, self.phs2d_, self.freq_s)
+            rc = rhoa2z(rc, phs2d, self.freqs_)
 
         return   cf if self.out =='sf' else rc   
+    
+    def _filter_by_blocks (self, func, *, halo =0, width =1, **kws ): 
+        """ Run the filter `func` over overlapping blocks of stations. 
+        
+        Each block is extended by `halo` stations on both sides and holds at 
+        least `width` stations. Only the block core is kept so the stitched 
+        output is the same as the filter of the whole line. The blocks are 
+        read with :meth:`_station_block`.
+        """
+        n = len(self.ediObjs_ )
+        out = None 
+        for block, core, sl in _station_blocks (
+                n, self.chunksize, halo = halo, width = width ): 
+            res2d = interpolate2d(self._station_block (
+                f'res{self.component}', block ), method =self.method)
+            phs2d = interpolate2d(self._station_block (
+                f'phase{self.component}', block ), method =self.method)
+            rc = func (res2d, phs2d, first = block.start ==0, **kws )[:, core]
+            if out is None: 
+                out = np.empty ((len(rc), n ), dtype = rc.dtype )
+            out [:, sl] = rc 
+            
+        return out 
+    
+    def _station_block (self, name, sl ): 
+        """ Array `name` of the stations `sl`. 
+        
+        `name` is either a 2D array of :meth:`make2d` e.g. ``resxy`` of shape 
+        (n_freq, n_stations) or the ``z`` and ``z_err`` impedance cubes of 
+        shape (n_stations, n_freq, 2, 2). The block is sliced from the file 
+        staged in :attr:`memmap_dir` if set, otherwise it is built from the 
+        EDI objects of the stations. 
+        """
+        if self.memmap_dir is None: 
+            return self._edis_block (name, sl )
+        arr = self._stage (name ) 
+        return np.asarray (arr [sl] if name in ('z', 'z_err') else arr [:, sl])
+    
+    def _edis_block (self, name, sl ): 
+        """ Build the array `name` of the stations `sl` from their EDI 
+        objects. Refer to :meth:`_station_block`."""
+        stack = StationStack.from_edis (self.ediObjs_[sl], freq = self.freqs_)
+        return getattr (stack, name ) if name in ('z', 'z_err') else (
+            stack.get2d (name ))
+    
+    def _stage (self, name ): 
+        """ Memory-mapped array `name` of all the stations. 
+        
+        The array is streamed block by block from the EDI objects into the 
+        ``{name}.npy`` file of :attr:`memmap_dir` once, then reused until the 
+        EDI collection changes as :attr:`stack_` is. The array is opened in 
+        read-only mode. 
+        """
+        key = [self.freqs_] + self._cache_key () 
+        staged = getattr (self, '_staged', {'key': []} )
+        if ( len(key) != len(staged['key']) 
+            or any ( a is not b for a, b in zip (key, staged['key']))
+            ): 
+            staged = self._staged = {'key': key }
+        if name in staged: 
+            return staged [name] 
+        
+        os.makedirs (self.memmap_dir, exist_ok =True )
+        fn = os.path.join (self.memmap_dir, f'{name}.npy')
+        if os.path.isfile (fn ): 
+            # a new file keeps the data of the arrays mapped before. 
+            os.remove (fn )
+        n, mm = len(self.ediObjs_ ), None 
+        for _, _, sl in _station_blocks (n, self.chunksize ): 
+            v = self._edis_block (name, sl )
+            if mm is None: 
+                mm = np.lib.format.open_memmap (
+                    fn, mode ='w+', dtype = v.dtype, shape = (
+                        n, *v.shape [1:]) if name in ('z', 'z_err') else (
+                            len(v), n ))
+            if name in ('z', 'z_err'): 
+                mm [sl] = v 
+            else: 
+                mm [:, sl] = v 
+        mm.flush () 
+        del mm 
+        staged [name] = np.load (fn, mmap_mode ='r')
+        
+        return staged [name] 
+    
+    def _getreferencefrequency (self ): 
+        """ Compute the highest frequency with clean data. The stations are 
+        read by blocks when :attr:`chunksize` is set."""
+        if self.chunksize is None: 
+            return super ()._getreferencefrequency () 
+        missing = np.zeros (len(self.freqs_ ), dtype = bool )
+        for _, _, sl in _station_blocks (len(self.ediObjs_ ), self.chunksize): 
+            missing |= np.isnan (np.real (self._edis_block ('zxy', sl ))
+                                 ).any (axis =1 )
+        return self.freqs_ [~missing].max() 
 
     def _make2dblobs (
         self, 
@@ -1300,6 +1961,22 @@ class Processing (EM) :
             raise ValueError(f"Unacceptable component {self.component!r}. "
                              "Expect 'xx', 'xy', 'yx' or 'yy'")
         
+        try : 
+            self.window_size = int(self.window_size)
+        except ValueError : 
+            raise ValueError (
+                'Could not convert {type(self.window_size).__name__!r} '
+                 'to integer: {self.window_size!r}')
+        
+        n = len(self.ediObjs_ )
+        if self.window_size > n:
+            raise ValueError ("window size might not be less than"
+                              f" {str(n)!r}")
+        if self.chunksize is not None: 
+            # the 2D blocks are read by the filters. 
+            return (None, None, self.freqs_, self.c, self.window_size, 
+                    self.component, self.out )
+            
         self.res2d_= self.make2d(out=f'res{self.component}')
         self.phs2d_ = self.make2d(out=f'phase{self.component}')
         
@@ -1312,17 +1989,8 @@ class Processing (EM) :
             raise ValueError ("Resistivity and phase must have the same length."
                               f" But {len(self.res2d_)} & {len(self.phs2d_)} "
                               "were given.")
-        try : 
-            self.window_size = int(self.window_size)
-        except ValueError : 
-            raise ValueError (
-                'Could not convert {type(self.window_size).__name__!r} '
-                 'to integer: {self.window_size!r}')
      
         self.res2d_ = np.array (self.res2d_)
-        if self.window_size > self.res2d_.shape [1]:
-            raise ValueError ("window size might not be less than"
-                              f" {str(self.res2d_.shape [1])!r}")
         
         return (self.res2d_ , self.phs2d_ , self.freqs_, self.c,
                 self.window_size, self.component, self.out) 
@@ -1361,47 +2029,36 @@ class Processing (EM) :
         self.inspect 
 
         # assert filter arguments 
-        self.res2d_ , self.phs2d_ , self.freqs_, self.c, self.window_size, \
+        _, _, self.freqs_, self.c, self.window_size, \
             self.component, self.out = self._make2dblobs ()
+        # compute the weight factor for convoluting 
+        # L = dipole length = L : 1 is fixed dipole -length 
+        # with adpatavive W expanded to 1 to c 
+        w_exp = [ _emap_weights (k * self.window_size, self.weights ) 
+                 for k in range(1, self.c +1 )]
+        if self.chunksize is not None: 
+            return self._filter_by_blocks (
+                self._emap_block, halo = len(w_exp[-1]) //2, weights = w_exp )
         #  interpolate resistivity and phases 
         self.phs2d_= interpolate2d(self.phs2d_, method =self.method)
         self.res2d_= interpolate2d(self.res2d_, method =self.method,)
-        
+        # the average of the Zk(xk, w) is the convolution with the average 
+        # of the windows; all the frequencies are filtered at once. 
+        return self._emap_block (self.res2d_, self.phs2d_, weights = w_exp )
+    
+    def _emap_block (self, res2d, phs2d, *, weights, first =True ): 
+        """ Filter the interpolated 2D blocks of resistivity and phase with 
+        the |EMAP| `weights`. The first station is kept in ``same`` mode 
+        only if the block starts the line (`first`). """
         # convert app. resistivity and impedance phase  to 
         # impedance values, Zj, for each station
-        omega0 = 2 * np.pi * self.freqs_
-        zj = np.sqrt(self.res2d_ * omega0[:, None] * mu0 ) * (np.cos (
-            np.deg2rad(self.phs2d_)) + 1j * np.sin(np.deg2rad(self.phs2d_)))
-        
-        # compute the weight factor for convoluting 
-        # L = dipole length = L : 1 is fixed dipole -length 
-        w = np.array([betaj (xj = ii, L= 1 , W= self.window_size) 
-                      for ii in range(self.window_size)])
-        #print(w)
-        zjr = np.zeros_like(self.res2d_) 
-        zji = zjr.copy() 
-        
-        for ii in range (len(zj)): 
-            w_exp = [ k * self.window_size for k in range(1, self.c +1 )]
-            zcr=list(); zci = list()
-            # compute Zk(xk, w) iteratively
-            # with adpatavive W expanded to 1 to c 
-            for wind_k  in w_exp : 
-                w= np.array([betaj (xj = jj, L= 1, W= wind_k
-                                    ) for jj in range(wind_k)
-                             ])
-                # block mode to same to keep the same dimensions
-                zcr.append(np.convolve(zj[ii, :].real, w[::-1], 'same'))
-                zci.append(np.convolve(zj[ii, :].imag, w[::-1], 'same'))
-            # and take the average 
-            zjr [ii, :] = np.average (np.vstack (zcr), axis = 0)
-            zji[ii, :] = np.average (np.vstack (zci), axis = 0)
-               
-     
-        zjc = zjr + 1j * zji 
+        zj = _emap_impedance (res2d, phs2d, self.freqs_)
+        # filter all the frequencies at once and keep the same dimensions 
+        zjc = _emap_convolve (zj, weights, pad_mode = self.pad_mode )
+        # recover the static apparent resistivity from reference freq 
         rc = z2rhoa(zjc, self.freqs_)  
-        if self.mode =='same': 
-            rc[:, 0] = self.res2d_[:, 0]
+        if self.mode =='same' and first: 
+            rc[:, 0] = res2d[:, 0]
             zjc[:, 0] = zj [:, 0]
         
         return zjc if self.out =='z' else rc 
@@ -1437,44 +2094,26 @@ class Processing (EM) :
         self.inspect 
     
         # assert filter arguments 
-        self.res2d_ , self.phs2d_ , self.freqs_, self.c, self.window_size, \
+        _, _, self.freqs_, self.c, self.window_size, \
             self.component, self.out = self._make2dblobs ()
+        # compute the weight factor for convoluting 
+        # L = dipole length = L
+        w = _emap_weights (self.window_size, self.weights )
+        if self.chunksize is not None: 
+            return self._filter_by_blocks (
+                self._emap_block, halo = len(w) //2, weights = [w] )
         #  interpolate resistivity and phases 
         self.phs2d_= interpolate2d(self.phs2d_, method =self.method)
         self.res2d_= interpolate2d(self.res2d_, method =self.method)
         
-        # convert app. resistivity and impedance phase  to 
-        #impedance values, Zj, for each station
-        omega0 = 2 * np.pi * self.freqs_
-        zj = np.sqrt(self.res2d_ * omega0[:, None] * mu0 ) * (np.cos (
-            np.deg2rad(self.phs2d_)) + 1j * np.sin(np.deg2rad(self.phs2d_)))
-        
-        # compute the weight factor for convoluting 
-        # L = dipole length = L
-        w = np.array([betaj (xj = ii, L= 1 , W= self.window_size) 
-                      for ii in range(self.window_size)])
-        
-        zjr = np.zeros_like(self.res2d_) 
-        zji = zjr.copy() 
-        for ii in range(len(zjr)) :
-            # block mode to same to keep the same array dimensions
-            zjr[ii, :] = np.convolve(zj[ii, :].real, w[::-1], 'same')
-            zji[ii, :] = np.convolve(zj[ii, :].imag, w[::-1], 'same')
-        # recover the static apparent resistivity from reference freq 
-        zjc = zjr + 1j * zji 
-        rc = z2rhoa (zjc, self.freqs_) #np.abs(zjc)**2 / (omega0[:, None] * mu0 )
-        
-        if self.mode =='same': 
-            rc[:, 0]= self.res2d_[:, 0]
-            zjc[:, 0]= zj [:, 0]
-        
-        return zjc if self.out =='z' else rc 
+        return self._emap_block (self.res2d_, self.phs2d_, weights = [w] )
     
     def skew(
         self,
         method:str ='swift', 
         return_skewness:bool=False, 
         suppress_outliers:bool=False, 
+        zcube: NDArray[DType[complex]] | "StationStack" =None, 
         )-> NDArray[DType[float]]: 
         r"""
         The conventional asymmetry parameter based on the Z magnitude. 
@@ -1551,6 +2190,11 @@ class Processing (EM) :
            
            .. versionadded:: 0.1.6 
            
+        zcube: ndarray of shape (n_stations, n_freq, 2, 2) or \
+            :class:`StationStack`, optional 
+           Impedance tensors of the survey. If given, the skew is computed
+           from it rather than the fitted EDI collection. 
+           
         Returns 
         --------- 
         skw, mu : Tuple of ndarray-like , shape (N, M )
@@ -1595,7 +2239,8 @@ class Processing (EM) :
            
         """
 
-        self.inspect 
+        if zcube is None: 
+            self.inspect 
             
         self.method = str(method).lower()
         if self.method not in ('swift', 'bahr'): 
@@ -1610,20 +2255,23 @@ class Processing (EM) :
         elif 'skew' in return_skewness: 
             return_skewness ='skew'
             
-        Zxx= self.make2d('zxx')
-        Zxy = self.make2d('zxy')
-        Zyx = self.make2d('zyx')
-        Zyy= self.make2d('zyy')
-        
-        S1 =Zxx + Zyy; S2 = Zxy + Zyx; D1 =Zxx-Zyy ;  D2= Zxy-Zyx 
-        D1S2 = (S2 * np.conj(D1)).imag ; S1D2 = (D2 * np.conj(S1)).imag 
-        
-        if method =='swift': 
-            skw = np.abs ( S1  / D2 )  
-        else : 
-            skw = np.sqrt(np.abs( D1S2 - S1D2))/np.abs(D2)
-            
-        mu = np.sqrt(np.abs(D1S2) + np.abs (S1D2))/ np.abs(D2) 
+        z = ( np.asarray (getattr (zcube, 'z', zcube)) if zcube is not None 
+             else self.stack_.z if self.chunksize is None else None ) 
+        # compute at all stations at once and 
+        # transpose to (n_freq, n_stations)
+        if self.chunksize is None: 
+            skw, mu = zcube_skew (z, method = self.method )
+            skw, mu = skw.T, mu.T 
+        else: 
+            n = len(self.ediObjs_) if z is None else len(z )
+            for _, _, sl in _station_blocks (n, self.chunksize): 
+                sk, m = zcube_skew (self._station_block ('z', sl ) if z is None 
+                                    else np.asarray (z [sl]), 
+                                    method = self.method )
+                if sl.start ==0: 
+                    skw, mu = np.empty ((sk.shape [1], n)), np.empty (
+                        (sk.shape [1], n))
+                skw [:, sl], mu [:, sl] = sk.T, m.T 
         
         if suppress_outliers: 
             skw = remove_outliers(skw, fill_value= np.nan ) 
@@ -1693,7 +2341,12 @@ class Processing (EM) :
             interpolation `method` is set to ``pd``, function uses the pandas 
             interpolation but ended the interpolation with forward/backward 
             NaN filling since the interpolation with pandas does not deal with 
-            all NaN at the begining or at the end of the array. 
+            all NaN at the begining or at the end of the array. The ``logf``
+            method resamples the tensors of all the stations at once, linearly 
+            in log-frequency with :func:`~watex.utils.exmath.zcube_interpolate`. 
+            Frequencies out of the station range take the closest valid values. 
+            Use the keyword argument ``period_buffer`` to set to NaN the 
+            frequencies too far from the valid data. 
             
         fill_value: array-like, str, optional, default='extrapolate', 
             If a ndarray (or float), this value will be used to fill in for 
@@ -1783,6 +2436,19 @@ class Processing (EM) :
         slice_= slice (ix_s,  ix_end) 
         s_cfreq = cfreq [slice_] # slice frequency within the buffer 
         
+        if str(method).lower() =='logf': 
+            n = len(self.ediObjs_ )
+            new_zObjs = [] 
+            for _, _, sl in _station_blocks (n, self.chunksize or n ): 
+                stack = self.stack_ [sl] if self.chunksize is None else ( 
+                    StationStack (self.freqs_, self._station_block ('z', sl), 
+                                  self._station_block ('z_err', sl )))
+                new_zObjs += stack.interpolate (
+                    s_cfreq, extrapolate =True, 
+                    period_buffer = kws.get ('period_buffer')).to_z() 
+            new_zObjs = np.array (new_zObjs, dtype = object )
+            return self._zrestore_tensor (new_zObjs, tensor, component ) 
+        
         # --> make a new Z objects 
         # make a new object 
         new_zObjs =np.zeros_like (zObjs, dtype =object )
@@ -1804,6 +2470,10 @@ class Processing (EM) :
                 )
             new_zObjs[kk] = new_Z 
             
+        return self._zrestore_tensor (new_zObjs, tensor, component ) 
+    
+    def _zrestore_tensor (self, new_zObjs, tensor =None, component =None ): 
+        """ Return the restored Z objects or their 2D `tensor` if given."""
         if tensor: 
             tensor = str(tensor).lower() 
             tensor = 'res' if tensor =='true' else tensor 
@@ -2150,19 +2820,12 @@ class Processing (EM) :
                            name ='tolerance', as_percent =True )
         
         f=self.freqs_.copy() 
-     
-        try : 
-            # take a sample of collected edi 
-            # and make two day array
-            # all frequency at all stations 
-            ar = self.make2d ('freq') 
-        except : 
-            try : 
-                ar = self.make2d( 'zxy')
-            except: ar = self.make2d ('zyx')
+        # take the missing frequencies of collected edi 
+        # at all stations 
+        ar = self.missing_mask_ 
         # compute the ratio of NaN in axis =0 
         
-        nan_sum  =np.nansum(np.isnan(ar), axis =1) 
+        nan_sum  = ar.sum(axis =1) 
         rr= np.around ( nan_sum / ar.shape[1] , 2) 
         # compute the ratio ck
         # ck = 1. -    rr[np.nonzero(rr)[0]].sum() / (
@@ -2185,6 +2848,68 @@ class Processing (EM) :
             
         return np.around (ck, 2) if return_ratio else (
             np.around (ck, 2), new_f   if return_freq else index )   
+    
+    def qc_report (
+        self, 
+        tol: float = .5, 
+        *, 
+        tensor: str ='res', 
+        component: str =None, 
+        chunksize: int =None, 
+        **kws 
+        )-> Boxspace: 
+        """ Quality control report of the collected EDIs. 
+        
+        Compute in one pass from the dense :attr:`stack_` the completeness 
+        per station and per frequency, the 'dead-band' extent, the relative 
+        errors statistics and the outliers flags. Refer to 
+        :func:`~watex.utils.exmath.qc_report` for the report attributes. 
+        
+        :param tol: float, default=.5 
+            the tolerance parameter. A frequency is invalid when the ratio of 
+            the stations where it is missing is higher than `tol`. 
+        :param tensor: str, ['res'|'phase'|'z'], default='res' 
+            Tensor used for the errors and outliers analysis. 
+        :param component: str, ['xx'|'xy'|'yx'|'yy'], optional 
+            Tensor component. If ``None``, the component passed at 
+            initialization is used. 
+        :param chunksize: int, optional 
+            Number of stations processed at once. 
+        :param kws: dict, additional keywords passed to 
+            :func:`~watex.utils.exmath.qc_report` such as the outlier 
+            ``threshold``. 
+        :returns: :class:`watex.utils.box.Boxspace`, the report. 
+        
+        :Example: 
+            >>> from watex.methods.em import Processing
+            >>> pobj = Processing().fit('data/edis')
+            >>> report = pobj.qc_report ( tol = .4, chunksize =1000 )
+            >>> report.rate_, report.deadband_ 
+        """
+        self.inspect 
+        tensor = str(tensor).lower() 
+        name = ( 'phase' if tensor.find ('pha') >=0 else 'z' if tensor =='z'
+                else 'resistivity' ) 
+        component = str(component or self.component).lower ()  
+        try : 
+            ii, jj = {'xx': (0, 0), 'xy': (0, 1), 'yx': (1, 0), 'yy': (1, 1)
+                      }[component] 
+        except KeyError : 
+            raise ValueError ("Component expects ['xx'|'xy'|'yx'|'yy']."
+                              f" Got {component!r}")
+        stack = self.stack_ 
+        kws.setdefault ('log', name !='phase') 
+        report = qc_report (
+            getattr (stack, name)[..., ii, jj], stack.mask, 
+            freq = stack.freq, 
+            errors = getattr (stack, f'{name}_err')[..., ii, jj], 
+            tol = tol, 
+            chunksize = chunksize, 
+            **kws 
+            )
+        report.tensor = name 
+        report.component_ = component 
+        return report 
 
 
     @_zupdate(option = 'none')
@@ -2353,3 +3078,417 @@ class Processing (EM) :
   
     
   
+
+
+class StreamFilter: 
+    """ Incremental |EMAP| static-shift filter for live acquisition. 
+    
+    The filter receives the station columns of the apparent resistivity and 
+    phase as they come from the field, keeps only a window-size ring buffer 
+    of the collected data and emits the corrected values of each station 
+    once its window is complete. The right border of the line is emitted 
+    when the survey line is closed with :meth:`close`. Emitted values are 
+    identical to the batch filters :meth:`Processing.tma`, 
+    :meth:`Processing.ama` and :meth:`Processing.flma`. 
+    
+    Parameters 
+    -----------
+    freqs: array-like, shape (N, )
+        Frequency array of the survey line. Station columns must be 
+        collected at these frequencies. 
+        
+    kind: str, default='tma'
+        Filter to apply. Can be ``tma``, ``ama`` or ``flma`` for 
+        trimmed-moving-average, adaptive-moving-average and 
+        fixed-length-moving-average respectively. 
+        
+    window_size : int, default=5 
+        the length of the window. Must be greater than 1 and preferably
+        an odd integer number. 
+        
+    mode: str, default='same' 
+        mode of the border trimming. Refer to :class:`Processing`. 
+        
+    method: str, default ``slinear``
+        Interpolation technique to use for filling the missing data of 
+        each station. Refer to :func:`~.interpolate2d`. 
+        
+    out : str, default='srho' 
+        Value to export. Can be ``sfactor``, ``tensor`` for corrections factor 
+        and impedance tensor. Any other values will export the static 
+        corrected resistivity. 
+        
+    c : int, default=2 
+        A window-width expansion factor of the |AMA| filter. Refer to 
+        :class:`Processing`. 
+        
+    refreq: float, optional 
+        Static-correction reference frequency of the |TMA| filter. It must be 
+        the highest frequency with clean data of the line, which is not 
+        known until the line is completed. If ``None``, the highest 
+        frequency of `freqs` is used. 
+        
+    Attributes 
+    -----------
+    emitted_: ndarray, shape (N, K) 
+        Values of the stations emitted by the last call of 
+        :meth:`partial_fit` or :meth:`close`. 
+        
+    n_stations_: int 
+        Number of stations collected in the current line. 
+        
+    n_emitted_: int 
+        Number of stations already emitted in the current line. 
+        
+    Examples 
+    ---------
+    >>> from watex.datasets import load_edis 
+    >>> from watex.methods.em import Processing, StreamFilter 
+    >>> p = Processing ().fit(load_edis (samples =17, return_data =True ))
+    >>> res2d, phs2d = p.make2d ('resxy'), p.make2d ('phasexy')
+    >>> sf = StreamFilter (p.freqs_, refreq = p.refreq_ )
+    >>> sf.partial_fit (res2d[:, :6], phs2d[:, :6]).emitted_.shape 
+    (54, 4)
+    >>> sf.partial_fit (res2d[:, 6:], phs2d[:, 6:]).emitted_.shape 
+    (54, 11)
+    >>> sf.close ().emitted_.shape # emit the last two stations 
+    (54, 2)
+    """
+    def __init__(
+        self, 
+        freqs: ArrayLike, 
+        kind: str ='tma', 
+        window_size: int =5, 
+        mode: str ='same', 
+        method: str ='slinear', 
+        out: str ='srho', 
+        c: int =2, 
+        refreq: float =None, 
+        ): 
+        self._logging= watexlog.get_watex_logger(self.__class__.__name__)
+        self.freqs=freqs 
+        self.kind=kind 
+        self.window_size=window_size 
+        self.mode=mode 
+        self.method=method
+        self.out=out 
+        self.c=c 
+        self.refreq=refreq 
+        
+        self._rings =None 
+        
+    def _reset (self ): 
+        """ Assert the filter arguments and start a new survey line. """
+        self.freqs_ = np.array (self.freqs, dtype =float )
+        if self.freqs_.ndim !=1: 
+            raise FrequencyError ("Expect a one-dimensional frequency array."
+                                  f" Got {self.freqs_.ndim}D.")
+        self.kind = str(self.kind).lower().strip() 
+        if self.kind not in ('tma', 'ama', 'flma'): 
+            raise ValueError (f"Unknown filter {self.kind!r}. Expect 'tma',"
+                              " 'ama' or 'flma'.")
+        self.out= str(self.out).lower().strip() 
+        if self.out.find ('factor') >= 0 or self.out =='sf': 
+            self.out ='sf'
+        elif self.out in ('z', 'impedance', 'tensor'): self.out ='z'
+        try : 
+            self.c = int (self.c) 
+            self.window_size = int (self.window_size)
+        except : 
+            raise TypeError ("Window size and expansion factor c expect"
+                             " integer values.")
+        if self.window_size < 2 : 
+            raise ValueError ("Window size must be greater than 1. Got"
+                              f" {self.window_size}")
+            
+        if self.kind =='tma': 
+            refreq = (self.freqs_.max() if self.refreq is None 
+                      else self.refreq )
+            ix_rf = np.argwhere (self.freqs_ == refreq )
+            if len(ix_rf)==0: 
+                raise FrequencyError (f"Reference frequency {refreq} is"
+                                      " missing in the frequency array.")
+            self._ix_rf = int (ix_rf[0, 0])
+            # the trimmed window reaches half window on both sides.  
+            self._span = 2 * (self.window_size //2) + 1 
+            self._minsize = self.window_size 
+            names = ('res', 'phs', 'logrho')
+        else: 
+            self._weights = [ _emap_weights (k * self.window_size ) for k in (
+                range (1, self.c + 1 ) if self.kind =='ama' else [1] )]
+            self._span = len(self._weights [-1])
+            self._minsize = self._span  
+            names = ('res', 'phs', 'zj')
+            
+        self._rings = { name : np.empty (
+            (len(self.freqs_), self._span ), 
+            dtype = complex if name =='zj' else float ) for name in names }
+        self.n_stations_ = 0 
+        self.n_emitted_ = 0 
+        
+        return self 
+    
+    def partial_fit (
+        self, 
+        res: ArrayLike, 
+        phase: ArrayLike, 
+        / 
+        ): 
+        """ Collect new stations and emit the stations whose window is 
+        complete. 
+        
+        Parameters 
+        -----------
+        res: array-like, shape (N, ) or (N, K) 
+            Apparent resistivity of the new station(s) at frequencies `freqs`. 
+        phase: array-like, shape (N, ) or (N, K) 
+            Impedance phase in degrees of the new station(s). 
+            
+        Returns 
+        --------
+        self: :class:`StreamFilter` instance. The emitted stations are 
+            stored in attribute `emitted_`. 
+        """
+        if self._rings is None: 
+            self._reset () 
+            
+        res = np.array (res, dtype =float ) 
+        phase = np.array (phase, dtype =float ) 
+        if res.ndim ==1: res = res [:, None ]
+        if phase.ndim ==1: phase = phase [:, None ]
+        if res.shape != phase.shape or len(res) != len(self.freqs_): 
+            raise ValueError ("Resistivity and phase must have the same shape"
+                              f" with {len(self.freqs_)} frequencies. Got"
+                              f" {res.shape} and {phase.shape}.")
+        res = interpolate2d(res, method =self.method)
+        phase = interpolate2d(phase, method =self.method) 
+        
+        data = {'res': res, 'phs': phase }
+        if self.kind =='tma': 
+            data['logrho'] = _tma_log_rho (res, phase, self.freqs_, 
+                                           self._ix_rf )
+        else: 
+            data['zj'] = _emap_impedance (res, phase, self.freqs_)
+            
+        emitted =[]
+        for jj in range (res.shape [1]): 
+            for name, ring in self._rings.items (): 
+                ring[:, self.n_stations_ % self._span ] = data[name][:, jj]
+            self.n_stations_ +=1 
+            if self.n_stations_ < self._span : 
+                continue 
+            # emit the station whose window is completed by the new one. 
+            while self.n_emitted_ + (self._span -1) //2 < self.n_stations_: 
+                emitted.append (self._emit (self.n_emitted_ ))
+                self.n_emitted_ +=1 
+                
+        return self._set_emitted (emitted )
+    
+    def close (self ): 
+        """ Close the survey line and emit the remaining stations. 
+        
+        The filter is ready for collecting a new survey line afterwards. 
+        """
+        if self._rings is None: 
+            self._reset() 
+        if self.n_stations_ < self._minsize : 
+            raise ValueError (f"Expect at least {self._minsize} stations to"
+                              f" close the line. Got {self.n_stations_}.")
+        emitted = [ self._emit (jj, n = self.n_stations_ ) 
+                   for jj in range (self.n_emitted_, self.n_stations_ )]
+        self._rings = None 
+        
+        return self._set_emitted (emitted )
+    
+    def fit (
+        self, 
+        res2d: NDArray[DType[float]], 
+        phs2d: NDArray[DType[float]], 
+        /
+        ): 
+        """ Filter a whole survey line at once. 
+        
+        Parameters 
+        -----------
+        res2d, phs2d: ndarray, shape (N, M) 
+            Apparent resistivity and phase of M stations. 
+            
+        Returns 
+        --------
+        self: :class:`StreamFilter` instance with all the stations in 
+            attribute `emitted_`. 
+        """
+        self._reset() 
+        head = self.partial_fit (res2d, phs2d ).emitted_ 
+        self.emitted_ = np.hstack ((head, self.close().emitted_))
+        
+        return self 
+        
+    def _set_emitted (self, emitted ): 
+        """ Stack the emitted stations in attribute `emitted_`. """
+        self.emitted_ = np.stack (emitted, axis =1 ) if emitted else np.empty (
+            (len(self.freqs_), 0), 
+            dtype = complex if self.out =='z' else float )
+        return self 
+    
+    def _gather (self, name, start, stop ): 
+        """ Fetch the stations from `start` to `stop` in the ring buffer. """
+        return np.ascontiguousarray (
+            self._rings [name][:, np.arange (start, stop ) % self._span ])
+        
+    def _emit (self, j, n =None ): 
+        """ Filter the station `j` of a line of `n` stations. `n` is ``None``
+        until the line is closed. """
+        res = self._gather ('res', j, j + 1)[:, 0]
+        phs = self._gather ('phs', j, j + 1)[:, 0]
+        n = n or np.inf 
+        if self.kind =='tma': 
+            hw = self.window_size //2 
+            log_rho = self._gather ('logrho', j, j + 1 )[:, 0]
+            if j ==0 or j == n -1 : 
+                start, stop = (( 0, j + hw + 1 ) if j - hw < 0 else (j - hw, n)
+                               ) if self.mode =='valid' else (j, j + 1) 
+            elif j - hw < 0: 
+                start, stop = 0, j + hw + 1 
+            elif j + hw + 1 > n: 
+                start, stop = j - hw, n 
+            else: 
+                start, stop = None, None 
+                
+            if start is None: 
+                wf = _trimmed_window_average (self._gather (
+                    'logrho', j - hw, j + hw + 1 )[:, None, :])[:, 0]
+            else: 
+                wf = np.average (self._gather (
+                    'logrho', start, min (stop, n )), axis =1 )
+            cf = np.power(10, wf, dtype =float)/ np. power(10, log_rho) 
+            rc = res * cf 
+            if self.out =='z': 
+                rc = rhoa2z(rc[:, None], phs[:, None], self.freqs_)[:, 0]
+                
+            return cf if self.out =='sf' else rc 
+        
+        zj = self._gather ('zj', j, j + 1 )[:, 0]
+        if self.mode =='same' and j ==0: 
+            return zj if self.out =='z' else res 
+        
+        # same window and kernel as the convolution of the batch filter.
+        m = len(self._weights [-1])
+        start = max (j - m //2, 0 )
+        stop = min (j - m //2 + m, n )
+        zjc = _emap_convolve (self._gather ('zj', start, stop ), 
+                              self._weights )[:, j - start ]
+        
+        return zjc if self.out =='z' else z2rhoa (
+            zjc[:, None], self.freqs_)[:, 0]
+    
+    def __repr__(self): 
+        return (f"{self.__class__.__name__}(kind={self.kind!r}, "
+                f"window_size={self.window_size}, mode={self.mode!r})")
+    
+        
+def _tma_log_rho (
+    res2d: NDArray[DType[float]], 
+    phs2d: NDArray[DType[float]], 
+    freqs: ArrayLike, 
+    ix_rf: int 
+    )-> NDArray[DType[float]]: 
+    """ Log-resistivities shifted by the phase slope at each frequency for 
+    the |TMA| filter. `ix_rf` is the index of the reference frequency. """
+    # normalize log frequency and take the normalize ref freq 
+    norm_f = (np.log10(freqs) / np.linalg.norm(np.log10(freqs)))
+    # compute the slope at each normalize frequency 
+    slope2d = np.arctan( (np.deg2rad(phs2d) / (np.pi /4 )) -1 ) / (np.pi /2 )
+    log_rho2d = np.log10 (res2d) + norm_f[:, None] * slope2d 
+    # extrapolate up 
+    # replace the up frequency thin the index of rf by interpolating up 
+    log_rho2d [:ix_rf, :] = np.log10 (res2d[:ix_rf, : ]) + np.log10(
+            np.sqrt(2)) * slope2d[:ix_rf, :]
+    
+    return log_rho2d 
+
+def _emap_impedance (
+    res2d: NDArray[DType[float]], 
+    phs2d: NDArray[DType[float]], 
+    freqs: ArrayLike, 
+    )-> NDArray[DType[complex]]: 
+    """ Convert app. resistivity and impedance phase to impedance values, 
+    Zj, for each station. """
+    omega0 = 2 * np.pi * freqs
+    return np.sqrt(res2d * omega0[:, None] * mu0 ) * (np.cos (
+        np.deg2rad(phs2d)) + 1j * np.sin(np.deg2rad(phs2d)))
+
+def _emap_weights (
+    window_size: int, 
+    /, 
+    cache: Optional[dict] =None 
+    )-> ArrayLike[DType[float]]: 
+    """ Hanning weight factors of a window for convoluting. The dipole 
+    length L=1 is fixed. The weights are kept in `cache` keyed by the 
+    window size; ``None`` uses the cache shared by all the filters. """
+    cache = _EMAP_WEIGHTS if cache is None else cache 
+    w = cache.get (window_size )
+    if w is None: 
+        w = np.array([betaj (xj = ii, L= 1 , W= window_size) 
+                      for ii in range(window_size)])
+        w.flags.writeable = False 
+        cache [window_size] = w 
+    return w 
+
+_EMAP_WEIGHTS = {} 
+
+def _emap_convolve (
+    zj: NDArray[DType[complex]], 
+    weights: List[ArrayLike[DType[float]]], 
+    /, 
+    pad_mode: str ='constant', 
+    )-> NDArray[DType[complex]]: 
+    """ Filter all the rows of `zj` at once with the average of the `weights`.
+    
+    Each row is convoluted as :func:`numpy.convolve` does in ``same`` mode 
+    with the reversed weights: the windows are centered on the stations 
+    and the line is extended by `pad_mode` of :func:`numpy.pad`. The windows 
+    are averaged into a single kernel whose weights scale the shifted lines 
+    in turn, so a station sums its window in the same order whatever the 
+    number of stations. 
+    """
+    m = max (len(w) for w in weights ) 
+    kernel = np.zeros (m )
+    for w in weights: 
+        start = m //2 - len(w) //2 
+        kernel [start: start + len(w)] += w 
+    kernel /= len(weights )
+    
+    n = zj.shape [1]
+    zp = np.pad (zj, ((0, 0), (m //2, m - 1 - m //2 )), mode = pad_mode )
+    zc = np.zeros (zj.shape, dtype = np.result_type (zj, kernel ))
+    for k, wk in enumerate (kernel ): 
+        zc += wk * zp [:, k: k + n ]
+        
+    return zc
+
+def _station_blocks (
+    n: int, 
+    chunksize: int, 
+    /, 
+    halo: int =0, 
+    width: int =1, 
+    ): 
+    """ Split `n` stations into blocks of `chunksize` stations. 
+    
+    Yield the slices of the block extended by `halo` stations on both 
+    sides, of its core in the block and of the core in the line. Blocks at 
+    the line ends are extended inward so they hold at least `width` 
+    stations. 
+    """
+    chunksize = int (chunksize )
+    if chunksize < 1: 
+        raise ValueError ("Chunk size must be a positive integer."
+                          f" Got {chunksize}.")
+    for start in range (0, n, chunksize ): 
+        stop = min (start + chunksize, n )
+        bstart, bstop = max (start - halo, 0 ), min (stop + halo, n )
+        bstop = max (bstop, min (bstart + width, n ))
+        bstart = min (bstart, max (bstop - width, 0 ))
+        yield ( slice (bstart, bstop), slice (start - bstart, stop - bstart), 
+               slice (start, stop ) )
@@ -101,6 +101,7 @@ from ..utils.gistools import (
     project_point_ll2utm, 
     project_point_utm2ll 
     )
+from .electrical import ERPStore 
 
 _logger =watexlog.get_watex_logger(__name__)
 
@@ -115,8 +116,12 @@ class ERPCollection:
     
     Parameters 
     ------------
-    listOferpfn: list, ndarray
-        list of different `erp` files.
+    listOferpfn: list, ndarray, str or :class:`~.methods.ERPStore`
+        list of different `erp` files. It can also be a store of lines or its 
+        directory. In that case, no `erp` object is created: the properties 
+        are read from the parameter columns of the store, computed as with 
+        :class:`~.methods.ResistivityProfiling`, and the lines are loaded 
+        one at a time with :meth:`ERPCollection.iterlines`. 
             
     listOfposMinMax : list 
         collection of different selected anomaly boundaries. 
@@ -199,6 +204,16 @@ class ERPCollection:
     ... ['e2059734331848' 'e2059734099144' 'e2059734345608']
     
     """
+    _storeColumns = { 
+        'selected_best_point_': 'station', 
+        'best_power': 'power', 
+        'best_magnitude': 'magnitude', 
+        'best_shape': 'shape', 
+        'best_type': 'type', 
+        'best_sfi': 'sfi', 
+        'best_east': 'easting', 
+        'best_north': 'northing', 
+        }
     erpColums =['id', 
                 'east', 
                 'north', 
@@ -213,6 +228,7 @@ class ERPCollection:
         self._logging =watexlog().get_watex_logger(self.__class__.__name__)
         
         self.erpObjs = erpObjs 
+        self.store = None 
         self.anomBoundariesObj= listOfposMinMax
         self.dipoleLengthObjs= kws.pop('list_of_dipole_lengths', None)
         self.export_data =kws.pop('export', False)
@@ -253,6 +269,16 @@ class ERPCollection:
             self._logging.error('No ERP file nor ERP object detected.'
                                 'Please provide at least `ERP` file or '
                                 ' `erp` object.')
+            
+        if ERPStore.is_store (self.listOferpfn ): 
+            # properties come from the store columns; no line is loaded. 
+            self.store = ( self.listOferpfn if isinstance (
+                self.listOferpfn, ERPStore ) else ERPStore (self.listOferpfn))
+            self.erpObjs = [] 
+            self._logging.info (f'Read the ERP store {self.store!r}')
+            self._set_erpdf () 
+            return 
+        
         if self.listOferpfn is not None: 
             if isinstance(self.listOferpfn, str):
                 if os.path.isfile(self.listOferpfn): 
@@ -352,6 +378,10 @@ class ERPCollection:
         
         print('-'*70)  
         
+        self._set_erpdf () 
+        
+    def _set_erpdf (self ): 
+        """ Gather the properties of the lines into :attr:`erpdf`. """
         # collected the ERP filenames and generated the id from each object.
         self.fnames = self.get_property_infos('_name')
         self.id = np.array([id(obj) for obj in self.fnames])
@@ -372,11 +402,11 @@ class ERPCollection:
         self.erpdf =pd.DataFrame(data = self.erps_data, 
                                   columns=self.erpColums) 
                                   
-        self.erpdf=self.erpdf.astype( {'east':np.float, 
-                                        'north': np.float, 
-                                        'power': np.float, 
-                                        'magnitude':np.float, 
-                                        'sfi':np.float})
+        self.erpdf=self.erpdf.astype( {'east':float, 
+                                        'north': float, 
+                                        'power': float, 
+                                        'magnitude':float, 
+                                        'sfi':float})
         
         if self.export_data is True : 
             self.exportErp()
@@ -404,8 +434,25 @@ class ERPCollection:
         
         if objslist is not None : 
             self.erpObjs = objslist 
+            
+        if self.store is not None and objslist is None: 
+            # scan the parameter columns of the store
+            if attr_name =='_name': 
+                return np.array (self.store.names )
+            return self.store.table [self._storeColumns[attr_name]].values 
         
         return np.array([getattr(obj, attr_name) for obj in self.erpObjs ])
+    
+    def iterlines (self ): 
+        """ Iterate over the `erp` lines and yield their name and data. 
+        
+        The lines of a store are loaded one at a time. 
+        """
+        if self.store is not None: 
+            yield from self.store.iterlines () 
+        else : 
+            for obj in self.erpObjs: 
+                yield obj._name, obj.df 
         
     def exportErp(self, extension_file=None, savepath =None, **kwargs ):
         """
@@ -800,6 +800,10 @@ class ElectricalMethods (ABC) :
                                             http://spatialreference.org/ref/ 
                                             for moreinfo). Overrides utm_zone
                                             if both are provided.                           
+    cache                   bool, str       Read the excel files through the 
+                                            cache of converted sheets. A 
+                                            string is the cache directory. 
+                                            See :func:`excel_cache_info`. 
     ======================  ==============  ===================================
                
     
@@ -825,6 +829,7 @@ class ElectricalMethods (ABC) :
                 utm_zone: str = None,  
                 fromlog10:bool =False, 
                 verbose: int = 0, 
+                cache: bool | str =False, 
                 ) -> None:
         
         self.AB=AB 
@@ -837,6 +842,7 @@ class ElectricalMethods (ABC) :
         self.area=area 
         self.fromlog10=fromlog10 
         self.verbose=verbose 
+        self.cache=cache 
         
 
 
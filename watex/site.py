@@ -45,6 +45,7 @@ from .utils.gistools import (
     utm_to_ll, 
     project_points_ll2utm, 
     project_point_utm2ll,
+    project_points_utm2ll, 
     assert_xy_coordinate_system,
     convert_position_str2float, 
     convert_position_float2str, 
@@ -289,7 +290,7 @@ class Profile:
         
         if self.coordinate_system =='ll': 
             x , y = Location.to_utm_in(
-                lats= self.y, lons =self.y, 
+                lats= self.y, lons =self.x, 
                 epsg = self.epsg , 
                 datum = self.datum , 
                 reference_ellipsoid= self.reference_ellipsoid
@@ -766,7 +767,7 @@ Examples
 1  110.486153  26.051794 
 >>> pro= Profile ().fit( xy.longitude, xy.latitude) 
 >>> pro.distance ()
-62.890276656978244
+55.03122243950409
 >>> pro.bearing () 
 35.4252016495945
 >>> pro.make_xy_coordinates( ) 
@@ -1033,6 +1034,9 @@ class Location (object):
         (easts, norths): Iterable object composed of easting and northing 
            coordinates. 
            
+        Note that the points are projected at once rather than one 
+        :class:`Location` at a time. 
+           
         .. versionadded:: 0.1.8 
         
         See Also
@@ -1050,12 +1054,22 @@ class Location (object):
             raise TypeError (emsg) 
             
         _check_consistency_size(lats, lons)
-        lats = np.array(lats ) ; lons = np.array (lons )
-        easts = norths = np.zeros_like (lats , dtype = np.float64)
-        for ii, (lat, lon) in enumerate (zip (lats, lons )) : 
-            Loc = Location()
-            x, y  = Loc.to_utm (lat, lon , utm_zone= utm_zone , **kws )
-            easts[ii] = x ; norths [ii] =y 
+        lats = np.array(list (map (assert_lat_value, np.ravel (lats ))))
+        lons = np.array(list (map (assert_lon_value, np.ravel (lons )))) 
+        try : 
+            _, easts, norths = ll_to_utm(
+                reference_ellipsoid= kws.get ('reference_ellipsoid') or 23,
+                lat = lats, 
+                lon= lons
+                )
+        except : 
+            easts, norths, _ = project_points_ll2utm(
+                lat = lats ,
+                lon= lons,
+                datum = kws.get('datum') or datum or 'WGS84', 
+                utm_zone = utm_zone ,
+                epsg= kws.get ('epsg') 
+                ) 
     
         return  easts, norths 
     
@@ -1093,6 +1107,9 @@ class Location (object):
         -------
         (lats, lons): Iterable object composed of latitude and longitude 
            coordinates. 
+           
+        Note that the points are projected at once rather than one 
+        :class:`Location` at a time. 
           
         .. versionadded:: 0.1.8 
         
@@ -1111,15 +1128,25 @@ class Location (object):
             raise TypeError (emsg) 
             
         _check_consistency_size(easts, norths)
-        easts = np.array(easts ) ; norths = np.array (norths )
-        lats_lons =[]
-        for east, north in zip (easts, norths ) : 
-           Loc = Location()
-           lats_lons.append (
-               Loc.to_latlon(east, north , utm_zone= utm_zone , **kws )
-               )
+        easts = np.array(easts, dtype =float ) 
+        norths = np.array (norths, dtype =float )
+        try : 
+            lats, lons = utm_to_ll(
+                reference_ellipsoid= kws.get ('reference_ellipsoid') or 23, 
+                northing = norths , 
+                easting= easts, 
+                zone= utm_zone 
+                ) 
+        except : 
+            lats , lons, _ = project_points_utm2ll(
+                easting = easts,
+                northing= norths, 
+                utm_zone = utm_zone, 
+                datum= kws.get('datum') or datum or 'WGS84', 
+                epsg= kws.get ('epsg') 
+                )
            
-        return tuple (zip ( *lats_lons))  
+        return lats, lons 
                    
 Location.__doc__="""\
 Location class
@@ -14,9 +14,12 @@ from .coreutils import (
     vesSelector, 
     erpSelector, 
     defineConductiveZone,
+    erpBatchFit, 
+    rankConductiveZones, 
     makeCoords,
     read_data,
-    erpSmartDetector
+    erpSmartDetector, 
+    excel_cache_info, 
     )
 from .exmath import ( 
     type_,
@@ -24,7 +27,9 @@ from .exmath import (
     power, 
     magnitude, 
     sfi, 
+    sfiBatch, 
     ohmicArea, 
+    ohmicAreaBatch, 
     vesDataOperator, 
     scalePosition,
     rhoa2z, 
@@ -39,12 +44,17 @@ from .exmath import (
     get_profile_angle, 
     get_bearing, 
     moving_average, 
+    trimmed_moving_average, 
     linkage_matrix, 
     plotOhmicArea, 
     plot_confidence_in,
     plot_sfi, 
     get_distance,
     qc, 
+    zcube_resphase, 
+    zcube_rotate, 
+    zcube_det, 
+    zcube_skew, 
     )
 from .funcutils import ( 
     reshape, 
@@ -119,14 +129,19 @@ __all__=[
         'vesSelector', 
         'erpSelector', 
         'defineConductiveZone',
+        'erpBatchFit', 
+        'rankConductiveZones', 
         'erpSmartDetector', 
+        'excel_cache_info', 
         'makeCoords', 
         'type_',
         'shape', 
         'power', 
         'magnitude', 
         'sfi', 
+        'sfiBatch', 
         'ohmicArea', 
+        'ohmicAreaBatch', 
         'vesDataOperator', 
         'scalePosition',
         'rhoa2z', 
@@ -146,6 +161,7 @@ __all__=[
         'get_strike', 
         'get_profile_angle', 
         'moving_average', 
+        'trimmed_moving_average', 
         'linkage_matrix',
         'plotOhmicArea', 
         'reshape', 
@@ -201,7 +217,11 @@ __all__=[
         'get_target', 
         'get_distance',
         'get_bearing', 
-        'qc'
+        'qc', 
+        'zcube_resphase', 
+        'zcube_rotate', 
+        'zcube_det', 
+        'zcube_skew', 
         ]
 
 
@@ -17,9 +17,11 @@ import warnings
 import copy 
 import itertools
 import collections   
+import hashlib 
 
 import numpy as np 
 import pandas as pd 
+from numpy.lib.stride_tricks import sliding_window_view
 import matplotlib.pyplot as plt
  
 from .._docstring import refglossary 
@@ -57,16 +59,18 @@ from .funcutils import (
     read_from_excelsheets,
     reshape, 
     is_iterable, 
-    is_in_if
+    is_in_if, 
+    make_ids, 
     ) 
+from .exmath import sfiBatch 
 from .gistools import (
     assert_lat_value,
     assert_lon_value,
     convert_position_str2float,
     convert_position_float2str,
     utm_to_ll, 
-    project_point_ll2utm, 
-    project_point_utm2ll, 
+    project_points_ll2utm, 
+    project_points_utm2ll, 
     HAS_GDAL, 
     )
 from .validator import  (
@@ -87,8 +91,11 @@ __all__=[
     "makeCoords", 
     "parseDCArgs", 
     "defineConductiveZone", 
+    "erpBatchFit", 
+    "rankConductiveZones", 
     "read_data", 
     "_is_readable", 
+    "excel_cache_info", 
     "is_erp_series", 
     "is_erp_dataframe"
     ]
@@ -315,28 +322,23 @@ def fill_coordinates(
         return None, None 
     
     def _set_coordinate_values (x, y, *, func ): 
-        """ Iterate `x` and `y` and output new coordinates values computed 
-        from `func` . 
+        """ Project the arrays `x` and `y` at once and output new 
+        coordinates values computed from `func` . 
         param x: iterable values 
         :param y: iterabel values 
         :param func: function F 
             can be: 
-                - ``project_point_utm2ll`` for `UTM` to `latlon`` or 
-                - `` project_point_ll2utm`` for `latlon`` to `UTM` 
+                - ``project_points_utm2ll`` for `UTM` to `latlon`` or 
+                - `` project_points_ll2utm`` for `latlon`` to `UTM` 
         :retuns: 
             - xx new calculated 
             - yy new calculated 
             - utm zone 
         """
-        xx = np.zeros_like(x); 
-        yy = np.zeros_like(xx)
-        for ii, (la, lo) in enumerate (zip(x, y)):
-            e , n, uz  = func (
-                la, lo, utm_zone = utm_zone, datum = datum, epsg =epsg 
-                ) 
-            xx [ii] = e ; yy[ii] = n  
-                
-        return xx, yy , uz  
+        xx, yy, uz = func (
+            x, y, utm_zone = utm_zone, datum = datum, epsg =epsg 
+            ) 
+        return np.asarray (xx), np.asarray(yy) , uz  
     
     if data is None:  
 
@@ -366,7 +368,7 @@ def fill_coordinates(
     if lon_isvalid and lat_isvalid: 
         try : 
             east , north , uz = _set_coordinate_values(
-                lat.values, lon.values, func=project_point_ll2utm,
+                lat.values, lon.values, func=project_points_ll2utm,
                 )
         except :# pass if an error occurs 
             pass 
@@ -383,7 +385,7 @@ def fill_coordinates(
         try : 
             lat , lon, utm_zone = _set_coordinate_values(
                 east.values, north.values,
-                func = project_point_utm2ll,
+                func = project_points_utm2ll,
                 )
         except : pass 
         else : 
@@ -1210,6 +1212,7 @@ def erpSmartDetector(
         return_cz:bool=False, 
         view:bool=False, 
         raise_warn: bool=True, 
+        top_k: int=None, 
         **plot_kws
         ): 
     """ 
@@ -1257,6 +1260,13 @@ def erpSmartDetector(
          warn the user whether a suitable location is found or not. Returns 
          ``None`` otherwise. 
          
+    top_k: int, optional 
+        If given, the candidate zones are ranked with 
+        :func:`rankConductiveZones` and the `top_k` best stations are 
+        returned as a list instead of a single station. The ranked frame 
+        replaces the conductive zone when ``return_cz=True``. It is not 
+        applicable when the `station` is given. 
+        
     view: bool, default=False, 
         Plot the conductive zone and restricted stations.
     plot_kws:dict, 
@@ -1298,6 +1308,8 @@ def erpSmartDetector(
     >>> erpSmartDetector (['s12', 's40'], resistivity) 
     'S29'
     >>> # station 42 close s40 is rejected too.
+    >>> erpSmartDetector (['s42'], resistivity, top_k =3 )
+    ['S46', 'S05', 'S13']
   
     """   
     
@@ -1318,6 +1330,10 @@ def erpSmartDetector(
             raise StationError(f"Wrong station {station}. Station must contain"
                                " the position number. e.g., 'S07'")
         s = int (s[0])
+        
+    if top_k is not None and station is not None: 
+        raise ERPError("Ranking the stations with 'top_k' is not applicable"
+                       f" when the station {station!r} is explicitly given.")
     
     # assert erp 
     if ( 
@@ -1365,6 +1381,28 @@ def erpSmartDetector(
             warnings.warn(constr_msg)
         return 
     
+    if top_k is not None: 
+        # constraints are applied by discarding the zones that cover them 
+        ranks = rankConductiveZones (erp, top_k = top_k, constr = constr, 
+                                     raise_warn = False )
+        if len(ranks )==0: 
+            if raise_warn: 
+                warnings.warn(constr_msg)
+            return 
+        station = list (ranks.station )
+        if view: 
+            pos = int (station [0][1:])
+            ax = plotAnomaly(erp, station= station[0], cz = np.asarray (
+                erp)[max (pos -3, 0): pos + 4], **plot_kws) 
+            if cs is not None: 
+                ax.scatter (cs, erp [cs ], marker="s", s=70, color = 'red', 
+                            alpha = .5, label=f"Restricted station"
+                            f"{'s' if len(cs)>1 else ''}")
+                ax.legend ()
+            plt.show() 
+            
+        return (station, ranks, cs ) if return_cz else station 
+    
     if coerce and station is not None: 
         cz = _nan_constr(s, res_arr, return_indexed_arr=True )
         
@@ -1608,6 +1646,482 @@ def defineConductiveZone(
     pix = pix [0] if len(pix) > 1 else pix 
     return cz , pcz, int(pix), pos
 
+def erpBatchFit(
+    erps: ArrayLike | List[ArrayLike], 
+    lengths: ArrayLike =None, 
+    *, 
+    stations: List[str|int]=None, 
+    auto: bool =False, 
+    positions: ArrayLike | List[ArrayLike]= None, 
+    dipole: float | ArrayLike = 10., 
+    coordinates: Dict[str, ArrayLike] =None, 
+    return_zones: bool =False, 
+    n_jobs: int =None, 
+    backend: str =None, 
+) -> DataFrame | Tuple [DataFrame, NDArray, NDArray]: 
+    """ Compute the DC-profiling parameters of many |ERP| lines at once. 
+    
+    The lines are stacked in a padded array and each step of 
+    :meth:`watex.methods.ResistivityProfiling.fit` is applied to all the 
+    lines together: the conductive zone and the drilling point `sves`, the 
+    `power`, `magnitude`, `shape`, `type` and `sfi` are computed with array 
+    operations. The values are the same as the ones of fitting each line 
+    separately. 
+    
+    Parameters 
+    -----------
+    erps: array_like of shape (n_lines, n_stations) or list of arrays 
+        Apparent resistivities of the lines. A 2D array is padded beyond 
+        `lengths`; a list of 1D arrays is padded with NaN. 
+    lengths: array_like of shape (n_lines, ), optional 
+        Number of stations of each line. If not given, the stations of a 
+        padded line stop at its last non-NaN value. 
+    stations: list of str or int, optional 
+        Station expected to hold the drilling at each line e.g. ``'S13'``. 
+        ``None`` at a line triggers the naive auto-detection i.e. the station 
+        of the lowest resistivity. 
+    auto: bool, default=False 
+        Auto-detect the drilling point of every line and ignore `stations`. 
+    positions: array_like or list of arrays, optional 
+        Station positions of the lines, padded as `erps`. They must increase 
+        from the first to the last station and are renumbered from ``0`` with 
+        the dipole length recomputed as in 
+        :func:`_assert_station_positions`. 
+    dipole: float or array_like of shape (n_lines, ), default=10. 
+        Dipole length of the lines when `positions` is not given. 
+    coordinates: dict, optional 
+        Padded arrays of coordinates e.g. ``{'longitude': lon, 
+        'latitude': lat}``. Their values at the drilling points are added 
+        to the table. 
+    return_zones: bool, default=False 
+        Returns also the conductive zones and their positions as arrays of 
+        shape (n_lines, 7) padded with NaN. 
+    n_jobs, backend: optional 
+        Deprecated and have no effect. The `sfi` of all the lines are now 
+        computed at once by :func:`sfiBatch` rather than spread over 
+        workers. They will be removed in a future release. 
+        
+    Returns 
+    --------
+    table: pd.DataFrame 
+        One row per line (``line1``, ``line2``, ...) with the drilling 
+        station, the dipole length, the coordinates, the resistivity at the 
+        drilling point and the parameters `power`, `magnitude`, `shape`, 
+        `type` and `sfi`. The lines that cannot be fitted (NaN resistivity, 
+        wrong station or numbering, ...) have missing values. 
+    cz, pcz: ndarray of shape (n_lines, 7) 
+        Conductive zones and their positions if `return_zones` is ``True``. 
+        
+    Examples 
+    ---------
+    >>> import numpy as np 
+    >>> from watex.utils.coreutils import erpBatchFit 
+    >>> rng = np.random.RandomState (42) 
+    >>> erps = [ np.abs (rng.randn (n)) *1e3 for n in (20, 33, 41) ] 
+    >>> table = erpBatchFit (erps, stations =['S7', None, 'S30'])
+    >>> table [['station', 'power', 'shape', 'type']] 
+          station  power shape type
+    line1    S007   60.0     M   PC
+    line2    S012   60.0     K   PC
+    line3    S030   60.0     K   PC
+    """
+    if n_jobs is not None or backend is not None: 
+        warnings.warn("'n_jobs' and 'backend' have no effect since the sfi"
+                      " of all the lines are computed at once. They will be"
+                      " removed in a future release.", FutureWarning )
+    R, lengths = _pad_lines (erps, lengths )
+    n_lines, n = R.shape 
+    rows = np.arange (n_lines )
+    inline = np.arange (n ) < lengths [:, None]
+    # lines with missing resistivities are discarded. 
+    bad = ~np.isfinite (np.where (inline, R, 0.)).all(axis =1 ) | (lengths < 1)
+    
+    if positions is not None: 
+        P_, _ = _pad_lines (positions, lengths )
+        with np.errstate (all ='ignore'): 
+            # positions must be numbered from the first to the last station 
+            bad |= ( np.argmin (np.where (inline, P_, np.inf ), axis =1 ) !=0 
+                    ) | ( np.argmax (np.where (inline, P_, -np.inf ), axis =1) 
+                         != lengths -1 ) 
+            dl = np.trunc (np.abs (np.nanmin (np.where (inline, P_, np.nan), 
+                                              axis =1 ) - np.nanmax (
+                np.where (inline, P_, np.nan), axis =1 )) / (lengths -1 ))
+    else : 
+        dl = np.broadcast_to (np.asarray (dipole, dtype =float ), n_lines 
+                              ).copy() 
+    bad |= ~(dl > 0 ) 
+    
+    # drilling points: the naive auto-detection takes the lowest value. 
+    pos = np.argmin (np.where (inline, R, np.inf), axis =1 ) 
+    if stations is not None and not auto : 
+        if len(stations ) != n_lines: 
+            raise StationError (f"Expect {n_lines} stations, one per line."
+                                f" Got {len(stations)}.")
+        for k, st in enumerate (stations ) : 
+            if st is None: 
+                continue 
+            try : 
+                pos [k] = _assert_stations(st, index ='py')[1]
+            except (StationError, ValueError, TypeError): 
+                bad [k] = True 
+    bad |= pos >= lengths 
+    pos = np.where (bad, 0, pos )
+    
+    # frame the `sves` within 03 stations left/right 
+    start = np.maximum (pos - 3, 0 ) 
+    w = np.minimum (pos + 4 , lengths ) - start 
+    idx = start [:, None] + np.arange (7)
+    zmask = np.arange (7) < w [:, None]
+    cz = np.where (zmask, np.take_along_axis (
+        R, np.minimum (idx, n -1 ), axis =1 ), np.nan )
+    pcz = np.where (zmask, idx * dl [:, None], np.nan )
+    sres = R [rows, pos ]
+    ix = np.argmax (cz == sres [:, None], axis =1 ) 
+    
+    shapes = _batch_shape (cz, w, ix ) 
+    types = _batch_type (R, lengths ) 
+    
+    # zones at the same positions share the same polynomial fits. 
+    sfis = np.full (n_lines, np.nan )
+    zkeys = np.stack ((start, w, dl ), axis =1 )[~bad] 
+    for key in np.unique (zkeys, axis =0 ): 
+        g, = np.where (~bad & (start == key [0]) & (w == key [1]) & (
+            dl == key [2]))
+        wk = int (key [1])
+        sfis [g] = sfiBatch (cz [g, :wk], p = pcz [g [0], :wk], s = ix [g])
+        
+    table = dict (station = np.array ([f'S{p:03}' for p in pos ], 
+                                      dtype = object ), dipole = dl )
+    for name, c in (coordinates or {}).items (): 
+        C, _ = _pad_lines (c, lengths )
+        table [name] = C [rows, pos ]
+    table.update (
+        sves_resistivity = sres, power = (w -1 ) * dl, 
+        magnitude = np.abs (np.nanmax (cz, axis =1) - np.nanmin (cz, axis =1)),
+        shape = shapes.astype (object), type = types.astype (object ), 
+        sfi = sfis 
+        )
+    table = pd.DataFrame (table, index = make_ids (rows, 'line', None, True))
+    if bad.any(): 
+        for c in table.columns: 
+            table.loc [bad, c] = None if table[c].dtype == object else np.nan 
+        warnings.warn(f"Unable to fit {bad.sum()} line(s):"
+                      f" {smft(table.index[bad])}.")
+        cz [bad] = np.nan ; pcz [bad] = np.nan 
+        
+    return (table, cz, pcz ) if return_zones else table 
+
+def rankConductiveZones(
+    erp: ArrayLike | pd.Series | DataFrame, 
+    window: int = 7, 
+    top_k: int = 3, 
+    *, 
+    constr: List[str] | Dict[str, str] = None, 
+    dipole: float = 10., 
+    weights: Dict[str, float] = None, 
+    shape_order: str = 'VWKUHCM', 
+    type_order: List[str] = ('EC', 'CB2P', 'PC', 'NC'), 
+    raise_warn: bool = True, 
+) -> DataFrame : 
+    """ Rank the candidate drilling locations of an |ERP| line. 
+    
+    Every station of the line is framed by a conductive zone of `window` 
+    stations ( truncated at the ends of the line ) and all the zones are 
+    scored in a single vectorized pass: the zones are the sliding windows 
+    of the line and the restricted or missing stations they cover are 
+    counted with prefix sums. A station is a candidate when it holds the 
+    lowest resistivity of its zone, as the naive auto-detection of 
+    :func:`defineConductiveZone`, and its zone covers no restricted station. 
+    
+    The candidates are scored from the `power`, `magnitude`, `shape` and 
+    `type` of their zone and from their resistivity, each criterion being 
+    scaled between ``0`` (worst) and ``1`` (best):
+        
+    - `resistivity`: the lowest resistivity of the line scores ``1`` and 
+      the highest ``0``. 
+    - `power`: ratio of the zone width to the width of a full window. 
+    - `magnitude`: ratio of the zone magnitude to the resistivity range of 
+      the line. 
+    - `shape` and `type`: rank in `shape_order` and `type_order`. 
+    
+    The score is the weighted mean of the criteria. 
+    
+    Parameters 
+    -----------
+    erp: array-like 1d, pd.Series or pd.DataFrame 
+        DC profiling :term:`ERP` resistivity values. A frame must hold the 
+        ``resistivity`` column. 
+    window: int, default=7 
+        Number of stations of the conductive zone. It must be odd so the 
+        candidate station sits at the center of its zone. The default frames 
+        the station within 03 stations left/right. 
+    top_k: int, default=3 
+        Number of candidates to return. ``None`` returns all of them. 
+    constr: list, dict, optional 
+        Restricted stations e.g. ``['S02', 'S25']`` or a dictionnary of the 
+        stations and the reasons of the restriction as in 
+        :func:`erpSmartDetector`. The zones covering a restricted station 
+        are discarded. 
+    dipole: float, default=10. 
+        Dipole length used to compute the station positions and the power. 
+    weights: dict, optional 
+        Weight of the criteria ``'resistivity'``, ``'power'``, 
+        ``'magnitude'``, ``'shape'`` and ``'type'``. The missing criteria 
+        weigh ``1.``; the default gives the same weight to all of them. 
+    shape_order: str or list of str, default='VWKUHCM' 
+        Anomaly shapes from the most to the least suitable for drilling. The 
+        shapes out of the order score ``0``. 
+    type_order: list of str, default=('EC', 'CB2P', 'PC', 'NC')
+        Anomaly types from the most to the least suitable for drilling. 
+        The type of a zone is computed as :func:`watex.utils.exmath.type_` 
+        so it is ``'EC'``, ``'PC'`` or ``'NC'``. 
+    raise_warn: bool, default=True, 
+        Warn the user when a restricted station is out of the line or when 
+        no candidate is found. 
+        
+    Returns 
+    --------
+    ranks: pd.DataFrame 
+        One row per candidate sorted by decreasing score with the station, 
+        its position, its resistivity, the `power`, `magnitude`, `shape` 
+        and `type` of its zone and the `score`. 
+        
+    See Also 
+    ---------
+    erpSmartDetector: Detect the drilling location under constraints. 
+    erpBatchFit: Compute the DC-profiling parameters of many lines at once. 
+    
+    Examples 
+    ---------
+    >>> from watex.datasets import make_erp 
+    >>> from watex.utils.coreutils import rankConductiveZones 
+    >>> resistivity = make_erp (n_stations =50, as_frame=True, seed=125 
+                                ).resistivity 
+    >>> rankConductiveZones (resistivity )
+      station  position  sves_resistivity  power   magnitude shape type     score
+    1     S46     460.0         62.163265   60.0  815.510204     U   EC  0.851020
+    2     S05      50.0        164.102041   60.0  835.897959     U   EC  0.834694
+    3     S13     130.0         21.387755   60.0  897.061224     C   EC  0.808844
+    >>> # S42 holds the lowest resistivity of the line but it is discarded 
+    >>> # with the zones covering it. 
+    >>> rankConductiveZones (resistivity, constr =['S42'], top_k =None ).station
+    1    S46
+    2    S05
+    3    S13
+    4    S29
+    5    S20
+    6    S01
+    7    S34
+    Name: station, dtype: object
+    """
+    if ( 
+            hasattr (erp, 'columns')  
+            and hasattr(erp, 'resistivity')
+        ) : 
+        erp = erp.resistivity 
+    erp = check_y (erp, allow_nan=True, input_name="ERP data ")
+    R = np.array (erp, dtype = np.float64 ) 
+    n = len(R)
+    
+    window = int (window )
+    if window < 3 or window % 2 ==0: 
+        raise ValueError ("Window must be an odd number of stations greater"
+                          f" than 1. Got {window}.")
+    h = window //2 
+    weights_ = dict (resistivity =1., power =1., magnitude =1., shape =1., 
+                     type =1. )
+    if weights is not None: 
+        wrong = set (weights).difference (weights_)
+        if len(wrong )!=0: 
+            raise ValueError (f"Unknown criteria {smft(wrong)}. Expect"
+                              f" {smft(weights_)}.")
+        weights_.update (weights )
+    wsum = sum (weights_.values ())
+    if wsum <= 0 : 
+        raise ValueError ("Weights must sum to a positive value.")
+    
+    # restricted and missing stations 
+    masked = ~np.isfinite (R )
+    if constr is not None: 
+        constr = list (constr ) if isinstance (constr, dict ) else list (
+            is_iterable(constr, exclude_string=True, transform=True, 
+                        parse_string=True))
+        cs = np.array (_check_constr_eff (constr, raise_warn = raise_warn ), 
+                       dtype = int )
+        out = cs [cs >= n ]
+        if len(out )!=0 and raise_warn: 
+            warnings.warn(f"Station positions {smft(out)} are ignored. They"
+                          " are out of range of station number range"
+                          f" 'S00'--> 'S{n-1:02}'.")
+        masked [cs [cs < n ]] = True 
+    
+    # zones of all stations: NaN padded sliding windows and prefix sums of 
+    # the masked and of the inline stations. 
+    Rp = np.pad (np.where (masked, np.nan, R ), h, constant_values =np.nan )
+    W = sliding_window_view (Rp, window ) 
+    cmask = np.concatenate (([0], np.cumsum (np.pad (masked, h ))))
+    cline = np.concatenate (([0], np.cumsum (np.pad (np.ones (n, dtype=int), 
+                                                      h))))
+    nmasked = cmask [window:] - cmask [:-window] 
+    w = cline [window:] - cline [:-window] 
+    with np.errstate (invalid ='ignore'): 
+        wmin = np.min (np.where (np.isnan (W ), np.inf, W ), axis =1 )
+        # the first lowest value is the drilling point as `argmin`
+        first = np.argmin (np.where (np.isnan (W ), np.inf, W ), axis =1 )
+    cand, = np.where ((nmasked ==0) & (first == h ) & np.isfinite (wmin ))
+    
+    columns = ['station', 'position', 'sves_resistivity', 'power', 
+               'magnitude', 'shape', 'type', 'score']
+    if len(cand )==0: 
+        if raise_warn: 
+            warnings.warn("No suitable location for drilling operations is"
+                          " detected after applying the constraints.")
+        return pd.DataFrame (columns = columns )
+    
+    # left-aligned zones of the candidates as in `erpBatchFit` 
+    start = np.maximum (cand - h, 0 ) 
+    w = w [cand ] 
+    ix = cand - start 
+    idx = start [:, None] + np.arange (window ) 
+    cz = np.where (np.arange (window ) < w [:, None], R [np.minimum (
+        idx, n -1 )], np.nan )
+    
+    shapes = _batch_shape (cz, w, ix ) 
+    # types are computed on the windows as the scalar function. 
+    types = _batch_type (cz, w ) 
+    sres = R [cand ]
+    mag = np.nanmax (cz, axis =1 ) - sres 
+    
+    rmin, rmax = np.nanmin (np.where (masked, np.nan, R )), np.nanmax (
+        np.where (masked, np.nan, R ))
+    span = rmax - rmin if rmax > rmin else 1. 
+    shape_order, type_order = list (shape_order ), list (type_order )
+    rank = lambda v, order: np.select ([v == s for s in order ], [
+        1. - k / max (len(order ) -1, 1) for k in range (len(order ))], 0.)
+    criteria = dict (
+        resistivity = (rmax - sres ) / span, 
+        power = (w - 1 ) / (window - 1 ), 
+        magnitude = mag / span, 
+        shape = rank (shapes, shape_order ), 
+        type = rank (types, type_order ), 
+        )
+    score = sum (weights_ [k] * criteria [k] for k in criteria ) / wsum 
+    
+    ranks = pd.DataFrame (dict (
+        station = [f'S{p:02}' for p in cand ], position = cand * dipole, 
+        sves_resistivity = sres, power = (w -1 ) * dipole, magnitude = mag, 
+        shape = shapes.astype (object ), type = types.astype (object ), 
+        score = score ), columns = columns )
+    # stable sort keeps the station order for equal scores. 
+    ranks = ranks.iloc [np.argsort (-score, kind ='stable')] 
+    if top_k is not None: 
+        ranks = ranks.iloc [:int (top_k )]
+    ranks.index = np.arange (1, len(ranks ) + 1 ) 
+    
+    return ranks 
+
+def _pad_lines (lines, lengths =None ): 
+    """ Stack the lines in a float array padded with NaN and return the 
+    number of stations of each line. """
+    if isinstance (lines, np.ndarray ) and lines.ndim ==2 : 
+        R = lines.astype (float )
+    else : 
+        lines = [ np.asarray (li, dtype = float ).ravel () for li in lines ]
+        R = np.full ((len(lines), max (map (len, lines), default =0)), np.nan)
+        for k, li in enumerate (lines ): 
+            R [k, : len(li)] = li 
+        if lengths is None: 
+            lengths = list (map (len, lines ))
+    if lengths is None: 
+        # stop at the last non-NaN value. 
+        notnan = ~np.isnan (R) 
+        lengths = np.where (notnan.any (axis =1 ), R.shape [1] - np.argmax (
+            notnan [:, ::-1], axis =1 ), 0 )
+    lengths = np.asarray (lengths, dtype = int )
+    if lengths.shape != (len(R), ) or (lengths > R.shape [1]).any(): 
+        raise ValueError ("Lengths must give the number of stations of each"
+                          f" line and not exceed {R.shape[1]}.")
+    return R, lengths 
+
+def _batch_shape (cz, w, ix ): 
+    """ Vectorized :func:`watex.utils.exmath.shape` of conductive zones 
+    padded with NaN beyond `w` with the drilling point at `ix`. """
+    n_lines = len(cz) 
+    rows = np.arange (n_lines )
+    # strict local extrema of the interior points as `argrelextrema`. 
+    left, mid, right = cz [:, :-2], cz [:, 1:-1], cz [:, 2:]
+    jj = np.arange (1, cz.shape [1] -1 )
+    inner = jj < (w -1 ) [:, None]
+    with np.errstate (invalid ='ignore'): 
+        is_min = (mid < left ) & (mid < right ) & inner 
+        is_max = (mid > left ) & (mid > right ) & inner 
+    ls_, rs_ = jj < ix [:, None], jj > ix [:, None]
+    nminl, nminr = (is_min & ls_).sum (1), (is_min & rs_).sum (1) 
+    nmaxl, nmaxr = (is_max & ls_).sum (1), (is_max & rs_).sum (1) 
+    
+    ls, rs = cz [:, 0], cz [rows, np.maximum (w -1, 0) ] 
+    med = np.full (n_lines, np.nan )
+    for wk in np.unique (w ): 
+        g = w == wk 
+        med [g] = np.median (cz [g, :wk ], axis =1 )
+    
+    shapes = np.full (n_lines, 'V' )
+    with np.errstate (invalid ='ignore'): 
+        ca = ((ls >= med ) & (rs < med )) | ((ls < med ) & (rs >= med ))
+        # `(ls and rs) > med` as in the scalar function. 
+        cb = ~ca & (np.where (ls !=0, rs, ls ) > med )
+        cc = ~ca & ~cb & (ls < med ) & (rs < med ) 
+    none = (nminl ==0 ) & (nminr ==0 )
+    shapes [ca & none ] = 'C' 
+    shapes [ca & ((nminl ==0 ) != (nminr ==0 ))] = 'K' 
+    shapes [cb & none ] = 'U' 
+    shapes [cb & (((nminl ==0 ) & (nminr ==1 )) | ((nminr ==0 ) & (nminl ==1 )))
+            ] = 'H' 
+    shapes [cb & (nminl >=1 ) & (nminr >=1 )] = 'W' 
+    shapes [cc & ((nmaxl >=1 ) | (nmaxr >=1 ))] = 'M' 
+    
+    return shapes 
+
+def _batch_type (R, lengths ): 
+    """ Vectorized :func:`watex.utils.exmath.type_` of the padded lines. 
+    
+    The lines are split in sections as in the scalar function; lines of the 
+    same length share the same sections and are processed together. Lines 
+    shorter than 7 stations make a single section. 
+    """
+    types = np.full (len(R), 'PC', dtype ='<U4' )
+    for n in np.unique (lengths ): 
+        if n < 1 : 
+            continue 
+        g, = np.where (lengths ==n )
+        k = n // 7 
+        if k ==0 : 
+            bounds = [(0, n)] 
+        elif n % k ==0: 
+            bounds = [ (i * (n // k), (i + 1) * (n // k)) for i in range (k)]
+        else : 
+            bounds = [ (7 * i, 7 * (i + 1 )) for i in range (k -1) ] + [
+                (7 * (k -1), n )]
+        status = np.empty ((len(g), len(bounds)), dtype = bool )
+        for c, (a, b) in enumerate (bounds ): 
+            sub = R [g, a:b] 
+            jj = np.arange (b - a )
+            s = np.argmin (sub, axis =1 ) [:, None]
+            lc, rc = jj <= s , jj >= s 
+            lm = np.max (np.where (lc, sub, -np.inf ), axis =1, keepdims =True)
+            rm = np.max (np.where (rc, sub, -np.inf ), axis =1, keepdims =True)
+            # first index of the left max and last index of the right max 
+            ixl = np.argmax (lc & (sub == lm ), axis =1 )
+            ixr = b - a - 1 - np.argmax ((rc & (sub == rm )) [:, ::-1], axis =1)
+            status [:, c ] = (ixr - ixl ) > 4 
+        nyes = status.sum (axis =1 )
+        # a single change of status splits the line in two parts. 
+        nchanges = np.sum (status [:, 1:] != status [:, :-1], axis =1 )
+        types [g] = np.where (nyes == len(bounds), 'EC', np.where (
+            nyes ==0, 'NC', np.where (nchanges ==1, 'CB2P', 'PC')))
+        
+    return types 
+
 def _assert_stations(
     station:Any , 
     dipole:Any = None,
@@ -1914,7 +2428,7 @@ def makeCoords(
         Raises warnings if GDAL is not set or the coordinates accurately status.
     
     kws: dict, 
-        Additional keywords of :func:`.gistools.project_point_utm2ll`. 
+        Additional keywords of :func:`.gistools.project_points_utm2ll`. 
         
     Returns 
     -------
@@ -2006,18 +2520,15 @@ def makeCoords(
     if is_utm : 
         if utm_zone is None: 
             raise TypeError("Please provide your UTM zone e.g.'10S' or '03N' !")
-        lon = np.zeros_like(reflon_ar) 
-        lat = lon.copy() 
-        
-        for kk , (lo, la) in enumerate (zip( reflon_ar, reflat_ar)): 
-            try : 
-                with warnings.catch_warnings(): # ignore multiple warnings 
-                    warnings.simplefilter('ignore')
-                    lat[kk], lon[kk] = project_point_utm2ll(
-                        easting= lo, northing=la, utm_zone=utm_zone, **kws)
-            except : 
-                lat[kk], lon[kk] = utm_to_ll(
-                    23, northing=la, easting=lo, zone=utm_zone)
+        try : 
+            lat, lon = utm_to_ll(
+                23, northing=reflat_ar, easting=reflon_ar, zone=utm_zone)
+        except : 
+            with warnings.catch_warnings(): # ignore multiple warnings 
+                warnings.simplefilter('ignore')
+                lat, lon, _ = project_points_utm2ll(
+                    easting= reflon_ar, northing=reflat_ar, utm_zone=utm_zone,
+                    **kws)
                 
         if not HAS_GDAL : 
             if raise_warning:
@@ -2122,6 +2633,7 @@ def parseDCArgs(fn :str ,
 
 def read_data (
         f:str | pathlib.PurePath, 
+        cache: bool | str =False, 
         **read_kws
  ) -> DataFrame: 
     """ Assert and read specific files and url allowed by the package
@@ -2133,6 +2645,9 @@ def read_data (
     f : str, Path-like object 
         File path or Pathlib object. Must contain a valid file name  and 
         should be a readable file or url    
+    cache: bool or str, default=False 
+        Read the excel files through the cache of converted sheets. A string 
+        is used as the cache directory. Refer to :func:`excel_cache_info`. 
     read_kws: dict, 
         Additional keywords arguments passed to pandas readable file keywords. 
         
@@ -2151,7 +2666,8 @@ def read_data (
         raise TypeError(f"Can only parse the {smft(cpObj.keys(), 'or')} files"
                         )
     try : 
-        f = cpObj[ex](f, **read_kws)
+        f = _read_excel (f, cache, **read_kws) if ex.lower()=='.xlsx' else (
+            cpObj[ex](f, **read_kws))
     except FileNotFoundError:
         raise FileNotFoundError (
             f"No such file in directory: {os.path.basename (f)!r}")
@@ -2255,6 +2771,7 @@ def _is_readable (
         as_frame:bool=False, 
         columns:List[str]=None,
         input_name='f', 
+        cache: bool | str =False, 
         **kws
  ) -> DataFrame: 
     """ Assert and read specific files and url allowed by the package
@@ -2283,6 +2800,10 @@ def _is_readable (
         Force conversion array to a frame is columns is not supplied.
         Use the combinaison, `input_name` and `X.shape[1]` range.
         
+    cache: bool or str, default=False 
+        Read the excel files through the cache of converted sheets. A string 
+        is used as the cache directory. Refer to :func:`excel_cache_info`. 
+        
     kws: dict, 
         Pandas readableformats additional keywords arguments. 
     Returns
@@ -2310,7 +2831,8 @@ def _is_readable (
         raise TypeError(f"Can only parse the {smft(cpObj.keys(), 'or')} files"
                         f" not {ex!r}.")
     try : 
-        f = cpObj[ex](f, **kws)
+        f = _read_excel (f, cache, **kws) if ex.lower()=='.xlsx' else cpObj[
+            ex](f, **kws)
     except FileNotFoundError:
         raise FileNotFoundError (
             f"No such file in directory: {os.path.basename (f)!r}")
@@ -2320,6 +2842,197 @@ def _is_readable (
 
     return f 
     
+# hits and misses of the excel cache in the current process. The reads of 
+# the process workers are added by :func:`_merge_excel_reads`.
+_EXCEL_CACHE_STATS = dict (hits =0, misses =0 )
+
+def _count_excel_reads (args ): 
+    """ Call ``func (fargs)`` and return its result, or the exception it 
+    raised, with the process id and the excel cache hits and misses of 
+    the call. Module-level function picklable for the process workers. 
+    
+    :param args: tuple of the function and its argument. 
+    """
+    func, fargs = args 
+    before = dict (_EXCEL_CACHE_STATS )
+    try : 
+        r = func (fargs )
+    except Exception as err : 
+        r = err 
+    return r, os.getpid (), { k: _EXCEL_CACHE_STATS [k] - v 
+                             for k, v in before.items ()}
+
+def _merge_excel_reads (results ): 
+    """ Unwrap the results of :func:`_count_excel_reads` and add the reads 
+    made in the other processes to the counters of the current process. 
+    
+    :param results: list of the wrapped results or of the exceptions 
+        returned by :func:`~watex.utils.funcutils.run_parallel`. 
+    :return: list of the results or exceptions in the same order. 
+    """
+    out = [] 
+    for r in results : 
+        if not isinstance (r, Exception ): 
+            r, pid, reads = r 
+            if pid != os.getpid (): 
+                for k, v in reads.items (): 
+                    _EXCEL_CACHE_STATS [k] += v 
+        out.append (r )
+    return out 
+
+def _get_excel_cachedir (cache: bool | str =True )-> str: 
+    """ Directory of the excel cache. A string `cache` is used as the 
+    directory, otherwise the ``xlsxcache`` folder of the watex data 
+    directory is used (see :func:`watex.datasets.io.get_data`)."""
+    if isinstance (cache, str ): 
+        return cache 
+    from ..datasets.io import get_data 
+    return os.path.join (get_data(), 'xlsxcache') 
+    
+def _get_excel_cachefile (
+    f: str , 
+    cache: bool | str =True, 
+    **kws 
+    )-> str: 
+    """ Get the cache file path of an excel file read with `kws`. 
+    
+    The name is the hash of the file content and of the reading keywords so 
+    a workbook moved or renamed is still served from the cache whereas an 
+    edited one is parsed again. 
+    """
+    h = hashlib.sha1 () 
+    with open (f, 'rb') as fb : 
+        for block in iter (lambda: fb.read (1 << 20 ), b'' ): 
+            h.update (block )
+    h.update (repr (sorted (kws.items ())).encode ())
+    
+    return os.path.join (_get_excel_cachedir (cache ), 
+                         f'xlsx_{h.hexdigest()[:20]}.npz')
+
+def _read_excel (
+    f: str , 
+    cache: bool | str =False, 
+    **kws
+    )-> DataFrame | Dict[str, DataFrame]: 
+    """ Read an excel file with :func:`pandas.read_excel` through the cache. 
+    
+    The first time a file is read, its sheets are stored column by column 
+    in a ``.npz`` file of the cache. Later calls load the columns back 
+    instead of parsing the workbook. 
+    
+    :param f: str, path to the excel file. 
+    :param cache: bool or str, use the cache in the default directory if 
+        ``True`` or in the given directory. ``False`` reads the file only. 
+    :param kws: dict, keywords arguments passed to :func:`pandas.read_excel`. 
+    :return: the dataframe or the dict of dataframes of the sheets as 
+        :func:`pandas.read_excel`. 
+    """
+    if not cache: 
+        return pd.read_excel (f, **kws )
+    
+    cachefile = _get_excel_cachefile (f, cache, **kws )
+    if os.path.isfile (cachefile ): 
+        try : 
+            data = _load_excel_cache (cachefile )
+        except Exception as err : 
+            _logger.warning (f"Ignore the unreadable excel cache"
+                             f" {cachefile!r}: {err}")
+        else: 
+            _EXCEL_CACHE_STATS ['hits'] += 1 
+            return data 
+        
+    _EXCEL_CACHE_STATS ['misses'] += 1 
+    data = pd.read_excel (f, **kws )
+    try : 
+        os.makedirs(os.path.dirname (cachefile ), exist_ok =True )
+        _dump_excel_cache (cachefile, data )
+    except Exception as err : 
+        _logger.warning (f"Unable to write the excel cache: {err}")
+        
+    return data 
+
+def _dump_excel_cache (cachefile: str , data: DataFrame | Dict ) -> None: 
+    """ Write the sheets into a single ``.npz`` file, one array per column. 
+    
+    The column labels, the index and the object columns are pickled within 
+    the file since they may mix the types read from the sheets. 
+    """
+    single = isinstance (data, pd.DataFrame )
+    sheets = {None: data } if single else data 
+    arrs = dict (single = np.array (single ), 
+                 sheets = np.array (list (sheets ), dtype = object ))
+    for ii, df in enumerate (sheets.values ()): 
+        arrs [f's{ii}_columns'] = np.array (list (df.columns), dtype =object)
+        arrs [f's{ii}_index'] = np.asarray (df.index )
+        for jj in range (df.shape [1]): 
+            arrs [f's{ii}_c{jj}'] = np.asarray (df.iloc [:, jj] )
+    # write aside and move so a reader never meets a partial file. 
+    tmpfile = cachefile [:-4] + f'.{os.getpid()}.tmp.npz'
+    np.savez (tmpfile, **arrs )
+    os.replace (tmpfile, cachefile )
+
+def _load_excel_cache (cachefile: str ) -> DataFrame | Dict[str, DataFrame]: 
+    """ Load the sheets stored by :func:`_dump_excel_cache`. """
+    with np.load (cachefile, allow_pickle =True ) as npz : 
+        sheets = {} 
+        for ii, name in enumerate (npz['sheets']): 
+            columns = npz [f's{ii}_columns'] 
+            index = npz [f's{ii}_index'] 
+            df = pd.DataFrame ({ jj: npz [f's{ii}_c{jj}'] 
+                                for jj in range (len(columns ))}, 
+                               index = pd.RangeIndex (len(index )) if ( 
+                                   np.array_equal (index, np.arange (len(
+                                       index )))) else index )
+            df.columns = list (columns )
+            sheets [name] = df 
+        single = bool (npz['single']) 
+        
+    return sheets [None] if single else sheets 
+
+def excel_cache_info (cache: bool | str =True )-> Dict[str, Any]: 
+    """ Report the location, the size and the hit rate of the excel cache. 
+    
+    The DC-resistivity methods read the excel files through the cache when 
+    their `cache` parameter is set. The hits and misses are counted since 
+    the start of the current process, including the reads made by its 
+    process workers when `n_jobs` is set. 
+    
+    Parameters 
+    -----------
+    cache: bool or str, default=True 
+        Cache directory. ``True`` refers to the ``xlsxcache`` folder of the 
+        watex data directory. 
+        
+    Returns 
+    --------
+    info: dict 
+        ``location``, number of cached ``files`` and their ``size`` in bytes, 
+        ``hits``, ``misses`` and ``hit_rate`` of the reads. 
+        
+    Examples 
+    ---------
+    >>> from watex.datasets import make_erp 
+    >>> from watex.methods import ResistivityProfiling 
+    >>> from watex.utils.coreutils import excel_cache_info 
+    >>> make_erp (n_stations =50, seed =42, as_frame =True ).to_excel (
+    ...     'l1.xlsx', index =False )
+    >>> for _ in range (3): 
+    ...     ResistivityProfiling(auto =True, cache =True ).fit('l1.xlsx')
+    >>> info = excel_cache_info () 
+    >>> info ['hits'], info ['misses'], info ['hit_rate']
+    (2, 1, 0.6666666666666666)
+    """
+    location = _get_excel_cachedir (cache )
+    files = [ os.path.join (location, f ) for f in os.listdir (location ) 
+             if f.startswith ('xlsx_') ] if os.path.isdir (location ) else [] 
+    nreads = _EXCEL_CACHE_STATS ['hits'] + _EXCEL_CACHE_STATS ['misses']
+    
+    return dict (location = location, files = len(files ), 
+                 size = sum (os.path.getsize (f ) for f in files ), 
+                 hits = _EXCEL_CACHE_STATS ['hits'], 
+                 misses = _EXCEL_CACHE_STATS ['misses'], 
+                 hit_rate = _EXCEL_CACHE_STATS ['hits'] / nreads if nreads 
+                 else np.nan )
 
 
 
@@ -11,6 +11,7 @@ import warnings
 from math import factorial
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 import pandas as pd 
 from scipy.signal import argrelextrema 
 import scipy.integrate as integrate
@@ -82,6 +83,8 @@ from .funcutils import (
     spi, 
                    
 )
+from ..externals.zutils import z_error2r_phi_error
+from ..externals.z import _rotatematrices_incl_errors
 from .validator import ( 
     _is_arraylike_1d, 
     _validate_ves_operator, 
@@ -522,27 +525,42 @@ def savitzky_golay1d (
 def interpolate2d (
         arr2d: NDArray[float] , 
         method:str  = 'slinear', 
+        axis: int =0, 
         **kws): 
     """ Interpolate the data in 2D dimensional array. 
     
     If the data contains some missing values. It should be replaced by the 
-    interpolated values. 
+    interpolated values. The missing values of the whole array are filled 
+    at once along `axis` and the leading and trailing missing values are 
+    filled with the nearest valid value. 
     
     Parameters 
     -----------
-    arr2d : np.ndarray, shape  (N, M)
-        2D dimensional data 
+    arr2d : np.ndarray, shape  (N, M) or (N, M, K) 
+        2D dimensional data or 3D data such as station x frequency x 
+        component arrays. 
         
-    method: str, default ``linear``
-        Interpolation technique to use. Can be ``nearest``or ``pad``. 
+    method: str, default ``slinear``
+        Interpolation technique to use. Can be ``linear``, ``nearest``, 
+        ``cubic``, ``quadratic``, ``zero`` or ``pad``. Any other technique 
+        from :meth:`pandas.Series.interpolate` is applied column by column. 
+        
+    axis: int, default=0 
+        Axis along which the missing data are interpolated. 
     
     kws: dict 
-        Additional keywords. Refer to :func:`~.interpolate1d`. 
+        Additional keywords. Refer to :func:`~.interpolate1d`. If given, 
+        data are interpolated column by column. 
         
     Returns 
     -------
-    arr2d:  np.ndarray, shape  (N, M)
+    arr2d:  np.ndarray, shape  (N, M) or (N, M, K) 
         2D dimensional data interpolated 
+        
+    Notes 
+    ------
+    Columns with too few valid values for the ``cubic`` or ``quadratic``
+    spline are linearly interpolated. 
     
     Examples 
     ---------
@@ -578,18 +596,94 @@ def interpolate2d (
     
     if len(arr2d.shape) ==1: 
         arr2d = arr2d[:, None] # put on 
-    if arr2d.shape[0] ==1: 
+    if arr2d.ndim ==2 and arr2d.shape[0] ==1: 
         arr2d = reshape (arr2d, axis=0)
     arr2d = check_array(
         arr2d, 
         to_frame = False, 
         input_name ="arr2d",
-        force_all_finite="allow-nan" 
+        force_all_finite="allow-nan", 
+        allow_nd =True, 
         )
-    arr2d  = np.hstack ([ reshape (interpolate1d(arr2d[:, ii], kind=method, 
-                                        method ='pd', **kws), axis=0)
-                         for ii in  range (arr2d.shape[1])])
-    return arr2d 
+    method = str(method).lower().strip() 
+    # move the interpolation axis in front and flatten the other axes.
+    ar = np.moveaxis(arr2d, axis, 0 )
+    shape = ar.shape 
+    ar = ar.reshape (len(ar), -1 )
+    
+    if kws or method not in ('linear', 'slinear', 'nearest', 'cubic', 
+                             'quadratic', 'zero', 'pad', 'ffill'): 
+        ar = np.hstack ([ reshape (interpolate1d(ar[:, ii], kind=method, 
+                                            method ='pd', **kws), axis=0)
+                         for ii in  range (ar.shape[1])])
+    elif np.isnan (ar).any(): 
+        ar = _interpolate_nan (ar.astype (float), kind = method )
+        
+    return np.moveaxis (ar.reshape (shape ), 0, axis ) 
+
+def _interpolate_nan (
+        ar: NDArray[float], 
+        kind: str ='slinear' 
+        )-> NDArray[float]: 
+    """ Fill the missing values of each column of the 2D array `ar`. 
+    
+    Values are computed with the same arithmetic as the scipy and numpy 
+    interpolators used by :meth:`pandas.Series.interpolate`. 
+    """
+    n = len(ar) 
+    valid = ~np.isnan (ar )
+    ix = np.arange (n )[:, None]
+    # previous and next valid index of each value 
+    prev = np.where (valid, ix, -1 )
+    np.maximum.accumulate (prev, axis =0, out =prev )
+    nxt = np.where (valid, ix, n )
+    nxt = np.minimum.accumulate (nxt[::-1], axis =0 )[::-1]
+    
+    col = np.broadcast_to (np.arange (ar.shape [1]), ar.shape )
+    out = ar.copy() 
+    inner = ~valid & (prev >=0 ) & (nxt < n )
+    i, j = np.nonzero (inner )
+    x, xa, xb = [ v.astype (float) for v in (i, prev [inner], nxt [inner ])]
+    ya, yb = ar [prev [inner], j ], ar [nxt [inner], j ]
+    
+    if kind =='linear': 
+        # numpy.interp 
+        slope = (yb - ya ) / (xb - xa )
+        y = slope * (x - xa ) + ya 
+        y = np.where (np.isnan (y ), slope * (x - xb ) + yb, y )
+        out [inner] = np.where (np.isnan (y ) & (ya == yb ), ya, y )
+    elif kind in ('slinear', 'cubic', 'quadratic'): 
+        # de Boor evaluation of the linear B-spline 
+        w = 1. / (xb - xa ) 
+        out [inner] = 0. + ya * (w * (xb - x )) + yb * (w * (x - xa ))
+    elif kind =='nearest': 
+        out [inner] = np.where (x <= xa / 2. + xb / 2., ya, yb )
+    else: 
+        out [inner] = ya 
+        
+    if kind in ('cubic', 'quadratic'): 
+        # interpolate the columns sharing the same missing values at once.
+        k = 3 if kind =='cubic' else 2 
+        masks, groups = np.unique (valid.T, axis =0, return_inverse =True )
+        for g, mask in enumerate (masks ): 
+            if mask.sum() <= k or mask.all(): 
+                continue 
+            cols = np.nonzero (groups.ravel() == g )[0]
+            xv = np.nonzero (mask )[0]
+            xi = np.arange (xv[0] +1, xv[-1])
+            xi = xi [~mask [xi]].astype (float )
+            spl = spi.make_interp_spline (
+                xv.astype (float ), ar [xv][:, cols ], k = k, 
+                check_finite =False )
+            out [np.ix_(xi.astype (int), cols )] = spl (xi ) 
+    
+    # fill the borders with the nearest valid values. 
+    head = (prev < 0 ) & (nxt < n )
+    out [head] = ar [nxt [head], col [head]]
+    tail = (nxt ==n ) & (prev >=0 )
+    out [tail] = ar [prev [tail], col [tail]]
+    
+    return out 
 
 def dummy_basement_curve(
         func: F ,
@@ -822,8 +916,6 @@ def vesDataOperator(
     mask = np.zeros_like (AB_, dtype =bool) 
     mask[np.unique(AB_, return_index =True)[1]]=True 
     dup_values = AB_[~mask]
-    
-    indexes, = np.where(AB_==dup_values)
     #make a copy of unique values and filled the duplicated
     # values by their corresponding mean resistivity values 
     X, rindex  = np.unique (AB_, return_index=True); Y = rhoa_[rindex]
@@ -886,6 +978,7 @@ def ohmicArea(
         search: float = 45., 
         sum : bool = False, 
         objective: str = 'ohmS',
+        integration: str ='exact', 
         **kws
 ) -> float: 
     r""" 
@@ -912,6 +1005,12 @@ def ohmicArea(
         the X and Y values of the expected fractured zone. Where X is the AB dipole 
         spacing when imaging to the depth and Y is the apparent resistivity computed 
     
+    * integration: str, ['exact'|'quad'], default='exact' - Integration of the 
+        difference between the fitting and the basement curves. Both curves 
+        are polynomials, so ``exact`` evaluates the antiderivative at the 
+        roots and the `error` is the rounding error bound. ``quad`` uses the 
+        adaptive quadrature of :func:`scipy.integrate.quad`. 
+    
     kws: dict - Additionnal keywords arguments from |VES| data operations. 
         See :func:`watex.utils.exmath.vesDataOperator` for futher details. 
     
@@ -921,7 +1020,8 @@ def ohmicArea(
         
         - Tuple(ohmS, error, roots): 
             - `ohmS`is the pseudo-area computed expected to be a fractured zone 
-            - `error` is the integration error 
+            - `error` is the integration error, the rounding error bound for  
+                the exact integration. 
             - `roots` is the integration  boundaries of the expected fractured 
                 zone where the basement rocks is located above the resistivity  
                 transform function. At these points both curves values equal 
@@ -1038,17 +1138,15 @@ def ohmicArea(
                          " argument can only be 'ohmS' for pseudo-area"
                         " evaluation or 'graph' for visualization outputs."
                         )
+    integration = str(integration).lower().strip() 
+    if integration not in ('exact', 'quad'): 
+        raise ValueError ("Integration expects 'exact' or 'quad'. Got"
+                          f" {integration!r}")
 
     bound0=[]
     X, Y = vesDataOperator(data =data, **kws)
     
-    try : 
-       search = str(search).lower().replace('m', '')
-       if search.find('none')>=0 : 
-           search = X.max()/2 
-       search = float(search)
-    except: 
-        raise ValueError (f'Could not convert value {search!r} to float')
+    search = _get_search (search, X.max() )
         
     if search >= X.max(): 
         raise VESError(f"The startpoint 'search={search}m'is expected "
@@ -1103,9 +1201,17 @@ def ohmicArea(
         roots) > 2 else [np.array(roots)]
     ohmS = np.zeros((len(pairwise_r,)))
     err_ohmS = np.zeros((len(pairwise_r,)))
-
+    # f45 -f_rhotl is a polynomial: integrate with its antiderivative 
+    fint = np.polyint (ff) if ( 
+        integration =='exact' and isinstance (ff, np.poly1d)) else None 
+    
     for ii, (inf, sup) in enumerate(pairwise_r): 
-        values, err = integrate.quad(ff, a = inf, b = sup)
+        if fint is not None: 
+            fsup, finf = fint(sup), fint (inf)
+            values = fsup - finf 
+            err = np.finfo(float).eps * (abs(fsup) + abs(finf))
+        else: 
+            values, err = integrate.quad(ff, a = inf, b = sup)
         ohmS[ii] = np.zeros((1,)) if values < 0 else values 
         err_ohmS[ii] = err
         
@@ -1127,6 +1233,226 @@ def ohmicArea(
             break 
 
     return rv
+
+def ohmicAreaBatch (
+    AB: ArrayLike | List[ArrayLike], 
+    rhoa: NDArray | List[ArrayLike], 
+    search: float | ArrayLike = 45., 
+    sum: bool = False, 
+    typeofop: str = 'mean', 
+    grid: ArrayLike = None, 
+    return_fit: bool = False, 
+) -> Tuple[NDArray]: 
+    """ Compute the ohmic-area of many |VES| curves at once. 
+    
+    It gives the pseudo-areas, the errors and the roots of 
+    :func:`ohmicArea` for each sounding with array operations. The curves 
+    are regularized on a common `AB/2` grid; then the polynomial models of 
+    the same degree are fitted by a single least-squares solve, evaluated 
+    together on the search zone and integrated exactly. 
+    
+    Parameters 
+    -----------
+    AB: array-like 1d or list of array-like 
+        Spacing of the current electrodes `AB/2` in meters. A single array 
+        is the grid shared by all the soundings. Otherwise, gives the grid of 
+        each sounding. 
+    rhoa: ndarray of shape (n_soundings, n_AB) or list of array-like 
+        Apparent resistivity values of the soundings in :math:`\Omega.m`.
+    search: float or array-like of shape (n_soundings, ), default=45. 
+        Depth in meters from which the fractured zone is searched at each 
+        sounding. See :func:`ohmicArea`. 
+    sum: bool, default=False 
+        Sum the pseudo-areas of each sounding. 
+    typeofop: str, default='mean' 
+        Operation on the resistivity values of the duplicated `AB` points. 
+        See :func:`vesDataOperator`. 
+    grid: array-like 1d, optional 
+        Common grid of the soundings when they do not share the same `AB`. 
+        If ``None``, it is composed of all the `AB` points within the depth 
+        range covered by all the soundings. The curves are linearly 
+        interpolated on the grid. 
+    return_fit: bool, default=False 
+        Returns also the fitted models. 
+        
+    Returns 
+    --------
+    (ohmS, err, roots): Tuple of ndarray 
+        - `ohmS` of shape (n_soundings, n_areas) is the pseudo-areas padded 
+          with NaN, or their sum of shape (n_soundings, ) if `sum` is 
+          ``True``. 
+        - `err` of shape (n_soundings, n_areas) is the integration error. 
+        - `roots` of shape (n_soundings, 2 * n_areas) gives the integration 
+          bounds of each pseudo-area. 
+        The soundings where no pseudo-area can be computed, i.e. the invalid 
+        resistivity values or the `search` beyond the maximum depth, are 
+        filled with NaN. 
+    (X, Y, prho, p45, oix): Tuple of ndarray if `return_fit` is ``True`` 
+        - `X`, `Y` are the common grid and the operated resistivity values. 
+        - `prho`, `p45` are the coefficients of the fitting curves and of the  
+          dummy basement curves, padded with leading zeros. 
+        - `oix` is the index in `X` of the search depth of each sounding. 
+        
+    Examples 
+    ---------
+    >>> import numpy as np 
+    >>> from watex.datasets import make_ves 
+    >>> from watex.utils.exmath import ohmicAreaBatch 
+    >>> frames = [ make_ves (samples =50, max_depth =200, order ='+', 
+    ...                      max_rho =1e5, seed = s).frame for s in (1, 3, 6)]
+    >>> ohmS, err, roots = ohmicAreaBatch (
+    ...    frames[0].AB, np.vstack ([f.resistivity for f in frames]), sum =True)
+    >>> ohmS 
+    array([804526.99353977,  45680.33139764,  57110.58970769])
+    >>> roots # two pseudo-areas for the first and second soundings 
+    array([[ 46.3       ,  65.69179179, 157.29249249, 275.68448448],
+           [ 46.3       ,  89.42122122, 243.53493493, 301.2       ],
+           [178.72552553, 301.2       ,          nan,          nan]])
+    """
+    typeofop= str(typeofop).lower()
+    if typeofop not in ('none', 'mean', 'median', 'leaveoneout'):
+        raise ValueError(
+            f'Unacceptable argument {typeofop!r}. Use one of the following '
+            f'argument {smart_format([None,"mean", "median", "leaveOneOut"])}'
+            ' instead.')
+    typeofop ='mean' if typeofop =='none' else typeofop 
+    
+    X, Y = _regularize_ves (AB, rhoa, typeofop = typeofop, grid = grid )
+    m, n = Y.shape 
+    search = np.array ([ _get_search (sr, X.max() ) for sr in np.broadcast_to(
+        np.asarray (search, dtype = object ), m ) ]) 
+    
+    valid = np.isfinite (Y).all(axis =1 ) & (search < X.max() ) 
+    oix = np.argmin (np.abs (X - search [:, None]), axis =1 ) 
+    # coefficients padded with leading zeros, at most n for n points. 
+    prho = np.zeros ((m, n)) ; p45 = np.zeros ((m, n))
+    _polyfit_batch (X, Y, np.where (valid )[0], prho )
+    
+    ohmS = np.full ((m, n), np.nan ); err = np.full ((m, n), np.nan )
+    roots = np.full ((m, 2 * n), np.nan ) ; nareas = np.zeros (m, dtype =int )
+    for o in np.unique (oix [valid ]): 
+        rows, = np.where (valid & (oix ==o ))
+        if o ==0 : 
+            # same points, same fit 
+            p45 [rows] = prho [rows] 
+        else : 
+            _polyfit_batch (X [o:], Y [:, o:], rows, p45 )
+        # the difference f45 -f_rhotl evaluated on 1000 points 
+        xx = np.linspace (X [o], X.max(), 1000 )
+        cf = p45 [rows] - prho [rows] 
+        diff = _polyval_batch (cf, xx ) 
+        # pseudo-areas where the basement curve is above the fitting curve 
+        pos = ~(diff < 0 ) & (diff !=0 )
+        starts = pos & ~np.pad (pos [:, :-1], ((0, 0), (1, 0)))
+        ends = pos & ~np.pad (pos [:, 1:], ((0, 0), (0, 1)))
+        rs, cs = np.nonzero (starts ) ; _, ce = np.nonzero (ends )
+        # integrate with the antiderivative 
+        fint = np.hstack ((cf / np.arange (n, 0, -1), np.zeros ((len(rows), 1))))
+        finf = _polyval_batch (fint [rs], xx [cs], pairwise =True )
+        fsup = _polyval_batch (fint [rs], xx [ce], pairwise =True )
+        values = fsup - finf 
+        counts = np.bincount (rs, minlength = len(rows))
+        jj = np.arange (len(rs)) - np.repeat (np.cumsum (counts ) - counts, 
+                                              counts ) 
+        ohmS [rows [rs], jj] = np.where (values < 0, 0., values )
+        err [rows [rs], jj] = np.finfo(float).eps * (np.abs (fsup) + np.abs (
+            finf ))
+        roots [rows [rs], 2 * jj ] = xx [cs] ; roots [rows [rs], 2 * jj + 1] = xx[ce]
+        nareas [rows] = counts 
+    
+    failed = ~valid | (nareas ==0 )
+    if failed.any (): 
+        warnings.warn (f"Unable to compute the pseudo-area of {failed.sum()}"
+                       f" sounding(s) out of {m}.")
+    k = max (nareas.max(initial =0), 1 ) 
+    ohmS, err, roots = ohmS [:, :k], err [:, :k], roots [:, : 2 * k ]
+    if sum: 
+        ohmS = np.where (failed, np.nan, np.nansum (ohmS, axis =1 ))
+        
+    return ((ohmS, err, roots ), (X, Y, prho, p45, oix )
+            ) if return_fit else (ohmS, err, roots )
+
+def _get_search (search , max_depth ): 
+    """ Convert the `search` depth to float. ``None`` gives the half of 
+    `max_depth`. """
+    try : 
+       search = str(search).lower().replace('m', '')
+       if search.find('none')>=0 : 
+           search = max_depth/2 
+       search = float(search)
+    except: 
+        raise ValueError (f'Could not convert value {search!r} to float')
+    return search 
+
+def _regularize_ves (AB, rhoa, typeofop ='mean', grid = None ): 
+    """ Put the |VES| curves on a common grid of unique `AB` and apply the 
+    `typeofop` to the resistivity values of the duplicated `AB`. """
+    try : 
+        ab = np.asarray (AB, dtype = float )
+    except ValueError : 
+        ab = None # ragged grids 
+    if ab is not None and ab.ndim ==2 and (ab == ab[:1]).all(): 
+        ab = ab [0]
+        
+    if ab is not None and ab.ndim ==1 : 
+        R = np.asarray (rhoa, dtype = float )
+        if R.ndim ==1 : 
+            R = R [None, :]
+        if R.shape [1] != len(ab ): 
+            raise VESError ( f"Resistivity values of {R.shape[1]} points do"
+                            f" not fit the {len(ab)} AB points.")
+        X, first, inv, counts = np.unique (
+            ab, return_index =True, return_inverse =True, return_counts=True) 
+        Y = R [:, first ]
+        for k in np.where (counts > 1 )[0]: 
+            # duplicated points 
+            rk = R [:, inv == k ]
+            if typeofop =='mean': 
+                Y [:, k] = rk.mean (axis =1 )
+            elif typeofop =='median': 
+                Y [:, k] = np.median (rk, axis =1 )
+            elif typeofop =='leaveoneout': 
+                Y [:, k] = rk [np.arange (len(rk)), np.random.randint (
+                    rk.shape [1], size = len(rk))]
+        return X, Y 
+    
+    curves = [ vesDataOperator (a, r, typeofop = typeofop ) 
+              for a, r in zip (AB, rhoa ) ] 
+    if grid is None: 
+        lo = max ( x.min() for x, _ in curves ) 
+        hi = min ( x.max() for x, _ in curves ) 
+        grid = np.concatenate ([ x [(x >= lo ) & (x <= hi )] for x, _ in curves])
+    X = np.unique (np.asarray (grid, dtype = float ))
+    if len(X) < 2: 
+        raise VESError ("The soundings do not share a common depth range.")
+    Y = np.vstack ([ np.interp (X, x, y ) for x, y in curves ])
+    
+    return X, Y 
+
+def _polyfit_batch (x, Y, rows, coefs ): 
+    """ Fit the `rows` of `Y` as :func:`fitfunc`, one least-squares solve  
+    per polynomial degree, and write the coefficients at the end of the 
+    `coefs` rows. """
+    if len(rows)==0 : 
+        return coefs 
+    Yr = Y [rows ]
+    mid, left, right = Yr [:, 1:-1], Yr [:, :-2], Yr [:, 2:]
+    # number of extrema (strict, interior) as `argrelextrema` 
+    degree = ( ((mid < left ) & (mid < right )) | (
+        (mid > left ) & (mid > right ))).sum (axis =1 ) + 1 
+    for d in np.unique (degree ): 
+        g = degree ==d 
+        coefs [rows [g], coefs.shape [1] - d -1 : ] = np.polyfit (
+            x, Yr [g].T, d ).T 
+    return coefs 
+
+def _polyval_batch (coefs, x, pairwise =False ): 
+    """ Evaluate the polynomials `coefs` with the Horner scheme as 
+    :func:`np.polyval`, on all the `x` or on `x` pairwise. """
+    y = np.zeros (len(x)) if pairwise else np.zeros ((len(coefs), len(x)))
+    for c in coefs.T : 
+        y = y * x + (c if pairwise else c [:, None])
+    return y 
  
 
 def _type_mechanism (
@@ -1256,22 +1582,14 @@ def type_ (erp: ArrayLike[DType[float]] ) -> str:
     elif len(set(status)) ==2: 
         yes_ix , = np.where (np.array(status) =='yes') 
         # take the remain index 
-        no_ix = np.array (status)[len(yes_ix):]
-        
-        # check whether all indexes are sorted 
-        sort_ix_yes = all(yes_ix[i] < yes_ix[i+1]
-                      for i in range(len(yes_ix) - 1))
-        sort_ix_no = all(no_ix[i] < no_ix[i+1]
-                      for i in range(len(no_ix) - 1))
-        
-        # check whether their difference is 1 even sorted 
-        if sort_ix_no == sort_ix_yes == True: 
-            yes = set ([abs(yes_ix[i] -yes_ix[i+1])
-                        for i in range(len(yes_ix)-1)])
-            no = set ([abs(no_ix[i] -no_ix[i+1])
-                        for i in range(len(no_ix)-1)])
-            if yes == no == {1}: 
-                type_= 'CB2P'
+        no_ix , = np.where (np.array(status) =='no') 
+        
+        # check whether the 'yes' and the 'no' sections are each 
+        # contiguous i.e. the line is split in two parts. 
+        yes = set (np.diff (yes_ix )) or {1}
+        no = set (np.diff (no_ix )) or {1}
+        if yes == no == {1}: 
+            type_= 'CB2P'
                 
     return type_ 
         
@@ -1777,9 +2095,12 @@ def sfi (
     # for instance for degree =2 
     # model (f)= [coefs[2] + coefs[1] * x  +   coefs [0]* x**2  for x in xmod]
     # where x_new(xn ) = 1000 points generated 
-    # thus compute ynew (yn) from the poly function f
-    xn  = np.linspace (min(p), max(p), 1000) 
-    yn = f(xn)
+    # thus compute ynew (yn) from the poly function f. 
+    # The samples are only needed for visualization; sfi uses the roots.
+    xn = yn = None 
+    if view or return_components: 
+        xn  = np.linspace (min(p), max(p), 1000) 
+        yn = f(xn)
     
     # solve the system to find the different root 
     # from the min resistivity value bound. 
@@ -1825,6 +2146,121 @@ def sfi (
         
     return (sfi_ , components) if return_components else sfi_ 
 
+def sfiBatch (
+    czs: NDArray, 
+    p: ArrayLike | NDArray = None, 
+    s: ArrayLike = None, 
+    dipolelength: float = None, 
+) -> ArrayLike: 
+    """ Compute the pseudo-fracturing index *sfi* of many conductive zones. 
+    
+    Vectorized variant of :func:`sfi` for scoring candidate conductive zones 
+    of the same width at once. The polynomial models of the same degree are 
+    fitted together and the roots are the eigenvalues of their stacked 
+    companion matrices, as :func:`numpy.roots` does for each model. 
+    
+    Parameters 
+    -----------
+    czs: ndarray of shape (n_zones, n_stations) 
+        Resistivity values of the conductive zones. 
+    p: array-like of shape (n_stations, ) or (n_zones, n_stations), optional 
+        Station positions shared by the zones or of each zone. If ``None``, 
+        positions are built from the `dipolelength`. 
+    s: array-like of int of shape (n_zones, ), optional 
+        Index of the station of each zone expected to hold the drilling. If  
+        ``None``, the station of the minimum resistivity is used. 
+    dipolelength: float, default=10. 
+        Dipole length when `p` is not given. 
+        
+    Returns 
+    --------
+    sfi: ndarray of shape (n_zones, ) 
+        The pseudo-fracturing index of each zone. NaN when no root of the 
+        model is found beyond the station i.e. when :func:`sfi` returns an 
+        empty array. 
+        
+    Examples 
+    ---------
+    >>> import numpy as np 
+    >>> from watex.utils.exmath import sfi, sfiBatch 
+    >>> rang = np.random.RandomState (42) 
+    >>> czs = np.abs (rang.randn (3, 7)) * 1e2 
+    >>> sfiBatch (czs )
+    array([0.9606216 , 0.99839389, 0.09617282])
+    >>> sfi (czs [2])
+    0.09617282435965135
+    """
+    czs = np.asarray (czs, dtype = float )
+    if czs.ndim ==1 : 
+        czs = czs [None, :]
+    m, n = czs.shape 
+    if p is None :
+        dipolelength = 10. if dipolelength is  None else dipolelength  
+        p = np.arange (0, n * dipolelength, dipolelength)
+    p = np.asarray (p, dtype = float ) 
+    if p.shape [-1] != n: 
+        raise StationError (
+            'Array of position and conductive zone must have the same length:'
+            f' `{p.shape[-1]}` and `{n}` were given.')
+    P = np.broadcast_to (p, (m, n)) 
+    rows = np.arange (m )
+    s_ix = np.argmin (czs, axis =1 ) if s is None else np.asarray (
+        s, dtype = int )
+    spos = P [rows, s_ix ]
+    
+    # lower of the maximum resistivities of both sides (see `__sves__`)
+    jj = np.arange (n )
+    rho_side = np.minimum ( 
+        np.where (jj <= s_ix [:, None], czs, -np.inf ).max(axis =1 ), 
+        np.where (jj >= s_ix [:, None], czs, -np.inf ).max(axis =1 ) )
+    
+    mid, left, right = czs [:, 1:-1], czs [:, :-2], czs [:, 2:]
+    degree = ( ((mid < left ) & (mid < right )) | (
+        (mid > left ) & (mid > right ))).sum (axis =1 ) + 1 
+    
+    ppow = np.full (m, np.nan )
+    for d in np.unique (degree ): 
+        g, = np.where (degree ==d )
+        if p.ndim ==1: 
+            coefs = np.polyfit (p, czs [g].T, d ).T 
+        else : 
+            coefs = _polyfit_stacked (P [g], czs [g], d )
+        # roots of f -rho_side from the companion matrices 
+        coefs [:, -1] -= rho_side [g]
+        A = np.zeros ((len(g), d, d ))
+        A [:, np.arange (1, d), np.arange (d -1)] = 1. 
+        A [:, 0, :] = - coefs [:, 1:] / coefs [:, :1]
+        roots = np.abs (np.linalg.eigvals (A ))
+        # rare null leading or trailing coefficients: as np.roots 
+        for k in np.where ((coefs [:, 0] ==0 ) | (coefs [:, -1] ==0 ))[0]: 
+            r = np.abs (np.roots (coefs [k]))
+            roots [k] = np.nan ; roots [k, :len(r)] = r 
+        beyond = roots > spos [g, None]
+        ppow [g] = np.where (beyond.any (axis =1 ), roots [
+            np.arange (len(g)), np.argmax (beyond, axis =1 )], np.nan )
+        
+    pw = np.abs (P.min(axis =1 ) - P.max(axis =1 ))
+    ma = np.abs (czs.max(axis =1 ) - czs.min(axis =1 ))
+    pw_star = np.abs (P.min(axis =1 ) - ppow )
+    ma_star = np.abs (czs.min(axis =1 ) - rho_side )
+    with np.errstate(all='ignore'):
+        # $\sqrt2# is the threshold 
+        sfi_ = np.sqrt ( (pw_star/pw)**2 + (ma_star / ma )**2 ) % np.sqrt(2)
+        sfi_ = np.where (sfi_ == np.inf, np.sqrt ( 
+            (pw/pw_star)**2 + (ma / ma_star )**2 ) % np.sqrt(2), sfi_ )
+        
+    return sfi_ 
+
+def _polyfit_stacked (x, y, deg ): 
+    """ Least-squares polynomial fit of each row of `y` at the positions of 
+    the same row of `x`, as :func:`numpy.polyfit` with stacked solves. """
+    lhs = x [..., None] ** np.arange (deg, -1, -1)
+    scale = np.sqrt ((lhs * lhs ).sum (axis =1, keepdims =True ))
+    lhs = lhs / scale 
+    coefs = np.linalg.pinv (lhs, rcond = x.shape [1] * np.finfo(float).eps 
+                            ) @ y [..., None]
+    return coefs [..., 0] / scale [:, 0, :]
+
 
 def plot_sfi(
     cz: Sub[ArrayLike],
@@ -3967,6 +4403,124 @@ def moving_average (
     return ya 
 
 
+def trimmed_moving_average (
+    ar: NDArray[DType[float]], 
+    /, 
+    window_size: int =5 , 
+    mode: str ='same', 
+    axis: int =-1, 
+)-> NDArray[DType[float]]: 
+    """ Trimmed-moving-average of an array along an axis. 
+    
+    For each position `j` along `axis`, a group of ``2 * (window_size //2)+1``
+    values centered on `j` is collected, the lowest and highest values of 
+    the group are discarded and the remaining values are averaged. The 
+    filter is computed at once for the whole array from the sorted windows 
+    of :func:`numpy.lib.stride_tricks.sliding_window_view`. 
+    
+    Parameters 
+    -----------
+    ar: ndarray, shape (M, N) 
+        Two dimensional array to filter. 
+        
+    window_size : int
+        the length of the window. Must be greater than 1 and preferably
+        an odd integer number. Default is ``5``
+        
+    mode: str 
+        mode of the border trimming. Should be 'valid' or 'same'.'valid' 
+        averages the first and last values with their `window_size //2` 
+        neighbors whereas the 'same' keeps the first and last values unchanged. 
+        Any other argument except 'valid' should be considered as 'same' 
+        argument. Default is ``same``. 
+        
+    axis: int, default=-1 
+        Axis along which the window is slided. 
+        
+    Returns 
+    --------
+    avg: ndarray, shape (M, N) 
+        Trimmed averaged array. 
+        
+    Notes 
+    ------
+    Positions whose window overflows the array borders are averaged with 
+    their available neighbors without trimming. When the number of values 
+    equal to the lowest or highest value of a window differs from a 
+    group to another, the whole window is averaged instead. 
+    
+    Examples 
+    ---------
+    >>> import numpy as np 
+    >>> from watex.utils.exmath import trimmed_moving_average 
+    >>> ar = np.array ([[1., 5., 2., 8., 3., 4.], [2., 4., 6., 1., 7., 3.]])
+    >>> trimmed_moving_average (ar, window_size =3 )
+    array([[1., 2., 5., 3., 4., 4.],
+           [2., 4., 4., 6., 3., 3.]])
+    >>> trimmed_moving_average (ar, window_size =3, mode ='valid' )
+    array([[3. , 2. , 5. , 3. , 4. , 3.5],
+           [3. , 4. , 4. , 6. , 3. , 5. ]])
+    """
+    ar = np.asarray (ar, dtype = float )
+    if ar.ndim !=2: 
+        raise ValueError ("Expect a two dimensional array. Got"
+                          f" {ar.ndim}D array.")
+    window_size = int (window_size) 
+    x = np.ascontiguousarray (np.moveaxis (ar, axis, -1 ))
+    n = x.shape [-1]
+    if not 0 < window_size <= n : 
+        raise ValueError (f"window size must be in the range [1, {n}]."
+                          f" Got {window_size!r}")
+
+    hw = window_size //2 
+    # positions from start to stop are trimmed. 
+    start, stop = max (hw, 1), min (n - hw - 1, n - 2 ) 
+    avg = np.empty_like (x) 
+    # border positions whose window overflows the array 
+    for ii in np.r_[:start, max (stop + 1, start ):n ]: 
+        if ii ==0 or ii == n -1: 
+            w = ( x[:, :ii + hw + 1 ] if ii - hw < 0 else x[:, ii - hw:] 
+                 ) if mode =='valid' else x[:, ii][:, None]
+        elif ii - hw < 0: 
+            w = x[:, :ii + hw + 1]
+        else: 
+            w = x[:, ii - hw:]
+        avg [:, ii] = np.average (w, axis =1 )
+        
+    if start > stop: 
+        return np.moveaxis (avg, -1, axis ) 
+    
+    avg [:, start: stop +1 ] = _trimmed_window_average (
+        sliding_window_view (x, 2 * hw + 1, axis =-1)[
+            :, start - hw: stop - hw + 1])
+    
+    return np.moveaxis (avg, -1, axis ) 
+
+
+def _trimmed_window_average (win: NDArray [DType[float]], /
+                             )-> NDArray [DType[float]] : 
+    """ Average the windows of shape (M, K, W) without their lowest and 
+    highest values, and returns an array of shape (M, K)."""
+    win = np.ascontiguousarray(win )
+    # discard all the values equal to the lowest and highest of each window. 
+    keep = ~np.logical_or (win == win.max(-1, keepdims =True), 
+                           win == win.min(-1, keepdims =True))
+    count = keep.sum (-1 )
+    # windows must be trimmed identically along the other axis otherwise 
+    # fall back to the whole window average. 
+    valid = (count == count [:1]).all(0)
+    wavg = np.sum (win, axis =-1 ) / win.shape [-1]
+    # A stable sort of the discarded flags moves the kept values in front 
+    # of each window while preserving their order. 
+    win = np.take_along_axis (
+        win, np.argsort (~keep, axis =-1, kind ='stable'), axis =-1 )
+    for k in np.unique (count [0, valid]): 
+        ix = valid & (count [0] == k )
+        wavg [:, ix] = np.mean (win [:, ix, :k], axis =-1 ) if k else np.nan
+        
+    return wavg 
+
+
 def get_profile_angle (
         easting: float =None, northing: float =None, msg:str ="ignore" ): 
     """
@@ -4471,7 +5025,8 @@ def get2dtensor(
 
     z_or_edis_obj_list: list of :class:`watex.edi.Edi` or \
         :class:`watex.externals.z.Z` 
-        A collection of EDI- or Impedances tensors objects. 
+        A collection of EDI- or Impedances tensors objects. It can also be 
+        a :class:`watex.methods.em.StationStack` object. 
     
     tensor: str, default='z'  
         Tensor name. Can be [ resistivity|phase|z|frequency]
@@ -4522,6 +5077,12 @@ def get2dtensor(
     if z_or_edis_obj_list is None: 
         raise EMError(f"Cannot output {name!r} 2D block with missing a"
                       " collection of EDI or Z objects.")
+    from ..methods.em import StationStack 
+    if isinstance (z_or_edis_obj_list, StationStack): 
+        # tensors are already aligned on the complete frequency 
+        mat2d = z_or_edis_obj_list.get2d(name + m2, kind = kind ) 
+        return mat2d if not return_freqs else (
+            mat2d, z_or_edis_obj_list.freq  )
     # assert z and Edi objets 
     obj_type  = _assert_z_or_edi_objs (z_or_edis_obj_list)
     # get the frequency 
@@ -4559,6 +5120,319 @@ def get2dtensor(
         
     return mat2d if not return_freqs else (mat2d, freqs  )
 
+def zcube_resphase (
+    z: NDArray[DType[complex]], 
+    freq: ArrayLike[DType[float]], 
+    z_err: Optional[NDArray[DType[float]]]=None, 
+    )-> Tuple[NDArray[DType[float]]]: 
+    """ Apparent resistivity and phase of all the stations of a survey.
+    
+    Compute at once the apparent resistivity and the phase with their errors 
+    from the impedance tensors of all stations stacked in an array of shape 
+    (n_stations, n_freq, 2, 2). Values are the same as those computed 
+    station by station with 
+    :meth:`watex.externals.z.ResPhase.compute_resistivity_phase`. 
+    
+    Parameters 
+    -----------
+    z: ndarray of complex, shape (n_stations, n_freq, 2, 2) 
+        Impedance tensors of the survey. 
+        
+    freq: array-like, shape (n_freq, ) 
+        Frequency in Hertz. 
+        
+    z_err: ndarray, shape (n_stations, n_freq, 2, 2), optional 
+        Impedance tensor errors. If ``None``, the errors are set to ``0.``. 
+        
+    Returns 
+    --------
+    res, phase, res_err, phase_err: ndarray, shape (n_stations, n_freq, 2, 2) 
+        Apparent resistivity in :math:`\\Omega.m`, phase in degrees and 
+        their errors. 
+        
+    Examples 
+    ---------
+    >>> import numpy as np 
+    >>> from watex.utils.exmath import zcube_resphase 
+    >>> z = np.full ((3, 2, 2, 2), 2 + 3j ) # 3 stations and 2 frequencies 
+    >>> res, phase, *_ = zcube_resphase (z, np.array ([1014., 512.]))
+    >>> res [:, :, 0, 1]
+    array([[0.0025641 , 0.00507813],
+           [0.0025641 , 0.00507813],
+           [0.0025641 , 0.00507813]])
+    >>> phase [0, 0]
+    array([[56.30993247, 56.30993247],
+           [56.30993247, 56.30993247]])
+    """
+    z = _assert_zcube(z)
+    freq = np.asarray (freq ) 
+    if len(freq) != z.shape [1]: 
+        raise ValueError ("Frequency and tensor z must have the same length."
+                          f" {len(freq)} & {z.shape[1]} are given.")
+    res = np.abs(z) ** 2 / freq[:, None, None] * 0.2 
+    phase = np.rad2deg(np.angle(z))
+    res_err = np.zeros_like(res, dtype=np.float64)
+    phase_err = np.zeros_like(phase, dtype=np.float64)
+    
+    if z_err is not None: 
+        with np.errstate(all='ignore'): 
+            r_err, phase_err[:] = z_error2r_phi_error(
+                np.real(z), np.imag(z), np.asarray (z_err ))
+            res_err [:] = res * r_err 
+            
+    return res, phase, res_err, phase_err 
+
+def zcube_rotate (
+    z: NDArray[DType[complex]], 
+    angle: float | ArrayLike[DType[float]], 
+    z_err: Optional[NDArray[DType[float]]]=None, 
+    )-> Tuple[NDArray[DType[complex]], NDArray[DType[float]]]: 
+    """ Rotate the impedance tensors of all stations of a survey.
+    
+    Angle is given in degrees and positive clockwise from the geographic 
+    North like :meth:`watex.externals.z.Z.rotate`. The errors are propagated 
+    at the same time. 
+    
+    Parameters 
+    -----------
+    z: ndarray of complex, shape (n_stations, n_freq, 2, 2) 
+        Impedance tensors of the survey. 
+        
+    angle: float or array-like of shape (n_stations, ) or \
+        (n_stations, n_freq) 
+        Rotation angle in degrees. It can be a single angle for the whole  
+        survey, an angle per station or an angle per station and frequency. 
+        NaN angles are considered as ``0.``. 
+        
+    z_err: ndarray, shape (n_stations, n_freq, 2, 2), optional 
+        Impedance tensor errors. 
+        
+    Returns 
+    --------
+    z_rot, z_err_rot: ndarray of shape (n_stations, n_freq, 2, 2) 
+        Rotated impedance tensors and errors. `z_err_rot` is ``None`` if 
+        `z_err` is not given. 
+        
+    Examples 
+    ---------
+    >>> import numpy as np 
+    >>> from watex.utils.exmath import zcube_rotate 
+    >>> z = np.zeros ((2, 1, 2, 2), dtype =complex) ; z[..., 0, 1] = 1. 
+    >>> z_rot, _ = zcube_rotate (z, [0., 90.])
+    >>> np.abs (z_rot [1, 0]).round (2) # xy moved to yx at the 2nd station 
+    array([[0., 0.],
+           [1., 0.]])
+    """
+    z = _assert_zcube(z)
+    angle = np.array (angle, dtype = np.float64 )
+    if angle.ndim ==1 and len(angle) == len(z) and len(z) !=1: 
+        # one angle per station 
+        angle = angle [:, None]
+    try : 
+        angle = np.broadcast_to (angle, z.shape[:2]) % 360 
+    except ValueError: 
+        raise ValueError ("Angle must be a single value, an angle per station"
+                          f" {(len(z),)} or per station and frequency "
+                          f"{z.shape[:2]}. Got {angle.shape}.")
+    angle = np.where (np.isnan (angle), 0., angle )
+    if z_err is not None: 
+        z_err = np.asarray (z_err) 
+        
+    return _rotatematrices_incl_errors(z, angle, z_err ) 
+
+def zcube_det (
+    z: NDArray[DType[complex]], 
+    )-> NDArray[DType[complex]]: 
+    """ Determinant of the impedance tensors of all stations of a survey.
+    
+    :param z: ndarray of complex, shape (n_stations, n_freq, 2, 2) 
+        Impedance tensors of the survey. 
+    :return: ndarray of shape (n_stations, n_freq), determinant of the 
+        tensors. Same as :attr:`watex.externals.z.Z.det` at each station. 
+        
+    :example: 
+    >>> import numpy as np 
+    >>> from watex.utils.exmath import zcube_det 
+    >>> z = np.tile ([[1, 2 ], [ 3, 4]], (2, 3, 1, 1)).astype (complex)
+    >>> zcube_det (z).real 
+    array([[-2., -2., -2.],
+           [-2., -2., -2.]])
+    """
+    return np.linalg.det(_assert_zcube(z)) 
+
+def zcube_skew (
+    z: NDArray[DType[complex]], 
+    method: str ='swift', 
+    )-> Tuple[NDArray[DType[float]]]: 
+    """ Skew and rotational invariant of all the stations of a survey.
+    
+    Refer to :meth:`watex.methods.em.Processing.skew` for the definitions 
+    of the Swift (1967) and Bahr (1991) skews. Note that no normalization 
+    is performed here. 
+    
+    :param z: ndarray of complex, shape (n_stations, n_freq, 2, 2) 
+        Impedance tensors of the survey. 
+    :param method: str, ['swift', 'bahr'], default='swift' 
+        Kind of skew to compute. 
+    :return: skw, mu: ndarray of shape (n_stations, n_freq), the skew and 
+        the rotational invariant ``mu`` at each station and frequency. 
+        
+    :example: 
+    >>> import numpy as np 
+    >>> from watex.utils.exmath import zcube_skew
+    >>> z = np.tile ([[1, 2 + 1j ], [ -3, 1j]], (2, 3, 1, 1))
+    >>> skw, mu = zcube_skew (z, method ='bahr')
+    >>> skw.shape, mu.shape 
+    ((2, 3), (2, 3))
+    """
+    method = str(method).lower() 
+    if method not in ('swift', 'bahr'): 
+        raise ValueError(
+            f'Expected argument ``swift`` or ``bahr`` not: {method!r}')
+    z = _assert_zcube(z)
+    Zxx, Zxy, Zyx, Zyy = z[..., 0, 0], z[..., 0, 1], z[..., 1, 0], z[..., 1, 1]
+    
+    S1 =Zxx + Zyy; S2 = Zxy + Zyx; D1 =Zxx-Zyy ;  D2= Zxy-Zyx 
+    D1S2 = (S2 * np.conj(D1)).imag ; S1D2 = (D2 * np.conj(S1)).imag 
+    
+    if method =='swift': 
+        skw = np.abs ( S1  / D2 )  
+    else : 
+        skw = np.sqrt(np.abs( D1S2 - S1D2))/np.abs(D2)
+        
+    mu = np.sqrt(np.abs(D1S2) + np.abs (S1D2))/ np.abs(D2) 
+    
+    return skw, mu 
+
+def zcube_interpolate (
+    z: NDArray[DType[complex]], 
+    freq: ArrayLike[DType[float]], 
+    new_freq: ArrayLike[DType[float]], 
+    z_err: Optional[NDArray[DType[float]]]=None, 
+    *, 
+    period_buffer: Optional[float]=None, 
+    extrapolate: bool =False, 
+    )-> Tuple[NDArray[DType[complex]], NDArray[DType[float]]]: 
+    """ Resample the impedance tensors of all stations onto a new frequency.
+    
+    The tensors of the whole survey are interpolated at once, linearly in 
+    the base 10 logarithm of the frequency. Missing tensors, marked by NaN 
+    values as in :class:`watex.methods.em.StationStack`, are skipped so each 
+    new frequency is interpolated between the closest valid frequencies of 
+    the station component. 
+    
+    Parameters 
+    -----------
+    z: ndarray of complex, shape (n_stations, n_freq, 2, 2) 
+        Impedance tensors of the survey. 
+        
+    freq: array-like, shape (n_freq, ) 
+        Frequency of the tensors in Hertz. It does not need to be sorted. 
+        
+    new_freq: array-like, shape (n_new_freq, ) 
+        Frequency in Hertz to interpolate onto. The output keeps its order. 
+        
+    z_err: ndarray, shape (n_stations, n_freq, 2, 2), optional 
+        Impedance tensor errors. They are interpolated with the same 
+        weights as the tensors. 
+        
+    period_buffer: float, optional 
+        Maximum ratio between a new period and the closest valid data 
+        period. New frequencies farther than this ratio from the data are 
+        set to NaN. Like :meth:`watex.edi.Edi.interpolateZ`, it must be 
+        greater than ``1``. 
+        
+    extrapolate: bool, default=False 
+        If ``True``, new frequencies out of the valid range of a station 
+        component take the value of the closest valid frequency. Otherwise 
+        they are set to NaN. 
+        
+    Returns 
+    --------
+    z_new, z_err_new: ndarray of shape (n_stations, n_new_freq, 2, 2) 
+        Interpolated tensors and errors. `z_err_new` is ``None`` if `z_err` 
+        is not given. 
+        
+    Examples 
+    ---------
+    >>> import numpy as np 
+    >>> from watex.utils.exmath import zcube_interpolate 
+    >>> z = np.full ((2, 3, 2, 2), 1 + 1j ) 
+    >>> z[..., 0, 1] = [[1., 2., 3.], [1., np.nan, 3.]] 
+    >>> z_new, _ = zcube_interpolate (z, [1e3, 1e2, 1e1], [ 1e3, 10**1.5]) 
+    >>> z_new [..., 0, 1].real 
+    array([[1. , 2.5],
+           [1. , 2.5]])
+    """
+    z = _assert_zcube(z)
+    freq = np.asarray (freq, dtype = np.float64 ) 
+    new_freq = np.atleast_1d (np.asarray (new_freq, dtype = np.float64 )) 
+    if len(freq) != z.shape [1]: 
+        raise ValueError ("Frequency and tensor z must have the same length."
+                          f" {len(freq)} & {z.shape[1]} are given.")
+    if period_buffer is not None: 
+        period_buffer = float (period_buffer )
+        if period_buffer <=1.: 
+            raise ValueError ("Period buffer must be greater than 1."
+                              f" Got {period_buffer}.")
+    
+    nsta, nf = z.shape [:2]
+    order = np.argsort (freq )
+    x = np.log10 (freq [order]) ; xnew = np.log10 (new_freq )
+    # one series per station component with the frequency in the last axis
+    series = lambda a : np.moveaxis (
+        np.asarray(a)[:, order], 1, -1).reshape (-1, nf )
+    zs = series (z )
+    
+    # closest valid index at the left and the right of each frequency 
+    valid = ~np.isnan (zs )
+    pos = np.arange (nf )
+    prev = np.maximum.accumulate (np.where (valid, pos, -1 ), axis =1 )
+    nxt = np.minimum.accumulate (
+        np.where (valid, pos, nf )[:, ::-1], axis =1 )[:, ::-1]
+    # x[p-1] <= xnew and xnew <= x[q]
+    p = np.searchsorted (x, xnew, side ='right')
+    q = np.searchsorted (x, xnew, side ='left')
+    left = np.where (p > 0, prev [:, np.clip (p - 1, 0, nf -1 )], -1 )
+    right = np.where (q < nf, nxt [:, np.clip (q, 0, nf -1 )], nf )
+    has_l, has_r = left >=0 , right < nf 
+    il, ir = np.clip (left, 0, nf -1 ), np.clip (right, 0, nf -1 )
+    
+    ok = has_l & has_r 
+    if extrapolate: 
+        # hold the closest valid value 
+        il = np.where (has_l, il, ir ) ; ir = np.where (has_r, ir, il )
+        ok = has_l | has_r 
+    if period_buffer is not None: 
+        dist = np.minimum ( np.where (has_l, xnew - x[il], np.inf ), 
+                            np.where (has_r, x[ir] - xnew, np.inf ))
+        ok &= dist < np.log10 (period_buffer )
+        
+    xl, xr = x[il], x[ir] 
+    with np.errstate (all ='ignore'): 
+        w = np.where (xr > xl, (xnew - xl ) / (xr - xl ), 0. )
+    w [~ok] = np.nan 
+    
+    def _interp (a ): 
+        al = np.take_along_axis (a, il, axis =1 )
+        ar = np.take_along_axis (a, ir, axis =1 )
+        a = al + w * (ar - al ) 
+        return np.moveaxis (a.reshape (nsta, 2, 2, -1 ), -1, 1 )
+    
+    z_new = _interp (zs ) 
+    z_err_new = None if z_err is None else _interp (series (z_err ))
+    
+    return z_new, z_err_new 
+
+def _assert_zcube (z, /): 
+    """ Assert the impedance tensors of the survey are shaped as 
+    (n_stations, n_freq, 2, 2)."""
+    z = np.asarray (z )
+    if z.ndim !=4 or z.shape [2:] != (2, 2): 
+        raise EMError ("Expect impedance tensors of all stations with shape"
+                       f" (n_stations, n_freq, 2, 2). Got {z.shape}.")
+    return z 
+
 def get_full_frequency (
         z_or_edis_obj_list: List [EDIO |ZO], 
         /,
@@ -4607,6 +5481,11 @@ def get_full_frequency (
     >>> len(zobjs)
     56 
     """
+    from ..methods.em import StationStack 
+    if isinstance (z_or_edis_obj_list, StationStack): 
+        f = z_or_edis_obj_list.freq 
+        return np.log10(f) if to_log10 else f 
+    
     obj_type  = _assert_z_or_edi_objs (z_or_edis_obj_list)
     
     lenfs = np.array([len(ediObj.Z._freq if obj_type =='EDI' else ediObj.freq )
@@ -5140,6 +6019,192 @@ def qc(
             )
         )
     return data
+
+def qc_report (
+    values: NDArray, 
+    mask: Optional[NDArray[DType[bool]]]=None, 
+    /, 
+    freq: Optional[ArrayLike[DType[float]]]=None, 
+    errors: Optional[NDArray[DType[float]]]=None, 
+    *, 
+    tol: float =.5, 
+    threshold: float =3., 
+    window: int =5, 
+    log: bool =True, 
+    chunksize: Optional[int]=None, 
+    )-> Boxspace: 
+    """ Quality control report of the data of a large collection of stations.
+    
+    Unlike :func:`qc`, the report is computed directly from the data of all 
+    the stations stacked in an array of shape (n_stations, n_freq) with 
+    NumPy reductions, without rebuilding nor interpolating the 2D tensors. 
+    The stations can be processed by chunks to bound the memory when the 
+    data are memory-mapped. 
+    
+    Parameters 
+    -----------
+    values: ndarray of shape (n_stations, n_freq) 
+        Data of each station e.g. the resistivity, the phase or the 
+        impedance tensor of a component. Missing data are NaN. 
+        
+    mask: ndarray of bool, shape (n_stations, n_freq), optional 
+        ``True`` where the data is available. If ``None``, the non NaN 
+        `values` are considered as valid. 
+        
+    freq: array-like of shape (n_freq, ), optional 
+        Frequencies in Hz. If ``None``, the frequency indexes are used. 
+        
+    errors: ndarray of shape (n_stations, n_freq), optional 
+        Errors of `values`. When given, the relative errors statistics are 
+        added to the report. 
+        
+    tol: float, default=.5 
+        Tolerance parameter. A frequency is invalid when the ratio of the 
+        stations where its data is missing is higher than `tol`. Same as 
+        :func:`qc`. 
+        
+    threshold: float, default=3. 
+        Outlier threshold. A data is flagged as outlier when its deviation 
+        from the running median of the station curve is higher than 
+        `threshold` times the robust standard deviation (the scaled median 
+        absolute deviation) of the station residuals. The mean absolute 
+        deviation is used instead for flat curves. 
+        
+    window: int, default=5 
+        Odd number of frequencies of the running median. The median is 
+        computed over the neighbour frequencies only. 
+        
+    log: bool, default=True 
+        Compare the base 10 logarithm of the data modulus for outlier 
+        detection. Set it to ``False`` for the phase. 
+        
+    chunksize: int, optional 
+        Number of stations processed at once. If ``None``, all the stations 
+        are processed in one pass. 
+        
+    Returns 
+    --------
+    report: :class:`watex.utils.box.Boxspace` 
+        The report holds the following attributes: 
+            
+        - rate_: the rate of the available data in the whole collection. 
+        - station_completeness_: ratio of available frequencies per station. 
+        - freq_completeness_: ratio of available stations per frequency. 
+        - valid_freqs_, invalid_freqs_: frequencies kept and dropped 
+          according to `tol`. 
+        - deadband_: [max, min] frequencies of the widest continuous band 
+          of invalid frequencies or ``None`` if no frequency is invalid. 
+        - station_error_, freq_error_: mean relative errors per station and 
+          per frequency. ``None`` if `errors` is not given. 
+        - max_error_: maximum relative error per station or ``None``. 
+        - outliers_: boolean array of shape (n_stations, n_freq) flagging 
+          the outliers. 
+        - station_outliers_: number of outliers per station. 
+        
+    Examples 
+    ---------
+    >>> import numpy as np 
+    >>> from watex.utils.exmath import qc_report 
+    >>> res = np.full ((4, 10), 100. ) ; res [:, 4:6] = np.nan 
+    >>> res [0, :2] = np.nan ; res [1, 8] = 1e4 
+    >>> r = qc_report (res, freq = np.logspace (3, 0, 10 ), chunksize =2 ) 
+    >>> r.station_completeness_ 
+    array([0.6, 0.8, 0.8, 0.8])
+    >>> r.deadband_ 
+    array([46.41588834, 21.5443469 ])
+    >>> r.station_outliers_ 
+    array([0, 1, 0, 0])
+    """
+    values = np.asarray (values ) 
+    if values.ndim !=2: 
+        raise ValueError ("Expect data of shape (n_stations, n_freq). Got"
+                          f" {values.shape}.")
+    nsta, nf = values.shape 
+    tol = assert_ratio(tol , bounds =(0, 1), exclude_value ='use lower bound',
+                         name ='tolerance', as_percent =True )
+    window = int (window ) 
+    if window < 1 or window % 2 ==0: 
+        raise ValueError (f"Window must be a positive odd number. Got {window}.")
+    freq = np.arange (nf ) if freq is None else np.asarray (freq )
+    if len(freq) != nf: 
+        raise ValueError ("Frequency and data must have the same length."
+                          f" {len(freq)} & {nf} are given.")
+    chunksize = nsta if chunksize is None else max (int (chunksize), 1 )
+    
+    station_completeness = np.zeros (nsta )
+    freq_count = np.zeros (nf ) 
+    outliers = np.zeros ((nsta, nf ), dtype = bool )
+    if errors is not None: 
+        station_error, max_error = np.full (nsta, np.nan), np.full (
+            nsta, np.nan)
+        err_sum, err_count = np.zeros (nf ), np.zeros (nf ) 
+        
+    h = window //2 
+    for start in range (0, nsta, chunksize ): 
+        sl = slice (start, start + chunksize )
+        v = np.asarray (values [sl] ) 
+        m = ~np.isnan (v ) if mask is None else np.asarray (mask [sl], 
+                                                           dtype =bool )
+        station_completeness [sl] = m.mean (axis =1 ) 
+        freq_count += m.sum (axis =0 ) 
+        
+        with np.errstate (all ='ignore'), warnings.catch_warnings(): 
+            warnings.simplefilter('ignore', category = RuntimeWarning )
+            x = np.log10 (np.abs (v )) if log else np.real (v ).astype (float)
+            x = np.where (m & np.isfinite (x ), x, np.nan )
+            # residuals from the running median of the neighbour 
+            # frequencies 
+            xp = np.pad (x, ((0, 0), (h, h)), constant_values = np.nan )
+            xw = np.delete (sliding_window_view (xp, window, axis =1 ), 
+                            h, axis =-1 )
+            r = x - np.nanmedian (xw, axis =-1 )
+            scale = 1.4826 * np.nanmedian (np.abs (r ), axis =1 , 
+                                           keepdims =True )
+            # fall back to the mean absolute deviation for flat curves 
+            scale = np.where (scale > 0, scale, 1.2533 * np.nanmean (
+                np.abs (r ), axis =1 , keepdims =True ))
+            outliers [sl] = np.abs (r ) > threshold * scale 
+            
+            if errors is not None: 
+                e = np.abs (np.asarray (errors [sl]) / np.abs (v )) 
+                e = np.where (m & np.isfinite (e ), e, np.nan )
+                station_error [sl] = np.nanmean (e, axis =1 )
+                max_error [sl] = np.nanmax (e, axis =1 ) 
+                err_sum += np.nansum (e, axis =0 ) 
+                err_count += (~np.isnan (e )).sum (axis =0 )
+                
+    freq_completeness = freq_count / max (nsta, 1 ) 
+    invalid = ( 1 - freq_completeness ) > tol 
+    
+    # widest run of invalid frequencies 
+    deadband = None 
+    if invalid.any (): 
+        edges = np.diff (np.r_[0, invalid.astype (int), 0])
+        starts, ends = np.where (edges ==1 )[0], np.where (edges ==-1 )[0]
+        k = np.argmax (ends - starts )
+        band = freq [starts [k]: ends[k]]
+        deadband = np.array ([band.max (), band.min ()])
+    
+    freq_error = None 
+    if errors is not None: 
+        with np.errstate (all ='ignore'): 
+            freq_error = np.where (err_count > 0, err_sum / err_count, np.nan)
+    else : station_error = max_error = None 
+    
+    return Boxspace ( 
+        tol = tol, 
+        rate_ = float (freq_count.sum () / max (nsta * nf, 1 )), 
+        station_completeness_ = station_completeness, 
+        freq_completeness_ = freq_completeness, 
+        valid_freqs_ = freq [~invalid], 
+        invalid_freqs_ = freq [invalid], 
+        deadband_ = deadband, 
+        station_error_ = station_error, 
+        freq_error_ = freq_error, 
+        max_error_ = max_error, 
+        outliers_ = outliers, 
+        station_outliers_ = outliers.sum (axis =1 ), 
+        )
  
 def get_distance(
     x: ArrayLike, 
@@ -22,7 +22,9 @@ import inspect
 import datetime  
 import warnings
 import itertools
+import functools
 import subprocess 
+import concurrent.futures
 from zipfile import ZipFile
 from six.moves import urllib 
  
@@ -5211,4 +5213,153 @@ def interpolate_grid (
     
     
     
-        
\ No newline at end of file
+        
+
+def _call_and_catch (func, item ): 
+    """ Call `func` on `item` and return the raised exception instead of 
+    propagating it. Must stay at the module level to be picklable for the 
+    process workers of :func:`run_parallel`."""
+    try : 
+        return func (item )
+    except Exception as err : 
+        return err 
+    
+def _map_chunk (func, chunk ): 
+    """ Apply `func` to the items of `chunk` in a process worker of 
+    :func:`run_parallel`. Must stay at the module level to be picklable."""
+    return [ func (item ) for item in chunk ]
+    
+def get_n_jobs (n_jobs =None ): 
+    """ Convert `n_jobs` to the number of workers. 
+    
+    :param n_jobs: int, number of concurrent workers. ``None`` and ``1`` 
+        mean no parallelism. ``-1`` uses all the CPUs, and below ``-1``,  
+        ``(n_cpus + 1 + n_jobs)`` are used. 
+    :return: int, number of workers, at least ``1``. 
+    
+    :Example: 
+        >>> from watex.utils.funcutils import get_n_jobs 
+        >>> get_n_jobs (None) 
+        1 
+    """
+    if n_jobs is None : 
+        return 1 
+    try : 
+        n_jobs = int (n_jobs )
+    except : 
+        raise TypeError("'n_jobs' expects an integer value. Got"
+                        f" {type(n_jobs).__name__!r}")
+    if n_jobs ==0: 
+        raise ValueError ("'n_jobs' == 0 has no meaning.")
+        
+    n_cpus = os.cpu_count() or 1 
+    
+    return max ( n_cpus + 1 + n_jobs if n_jobs < 0 else n_jobs, 1 ) 
+    
+def run_parallel (
+    func: F, 
+    items: Iterable[Any], 
+    /, 
+    n_jobs: Optional[int] =None, 
+    backend: str ='process', 
+    *, 
+    callback: Optional[F] =None, 
+    )-> List[Any]: 
+    """ Apply `func` to each item concurrently and keep the items order. 
+    
+    Failure on an item does not abort the others: the raised exception is 
+    returned at the item position instead of the result. 
+    
+    Parameters 
+    -----------
+    func: callable, 
+        Function applied to each item. For the ``process`` backend, `func` 
+        and the items must be picklable i.e. `func` is defined at the module 
+        level. 
+    items: iterable, 
+        Objects passed to `func` one by one. 
+    n_jobs: int, optional 
+        Number of concurrent workers. ``None`` or ``1`` runs serially in the 
+        current process. ``-1`` uses all the CPUs. 
+    backend: str, default='process' 
+        Pool of workers. Can be ``process`` or ``thread``. When the process 
+        pool cannot be started or breaks down (e.g. unpicklable objects), 
+        only the items whose results were not collected are run again in 
+        the thread pool. 
+    callback: callable, optional 
+        Called without argument in the current process each time the result 
+        of an item is collected e.g. to update a progress bar. It is called 
+        once per item, even when the work falls back to the thread pool. 
+        
+    Returns 
+    --------
+    results: list 
+        Result of `func` or the exception raised for each item, in the  
+        order of `items`. 
+        
+    Examples 
+    ---------
+    >>> import math 
+    >>> from watex.utils.funcutils import run_parallel 
+    >>> run_parallel (math.sqrt, [4, 9, -1], n_jobs =2, backend ='thread') 
+    [2.0, 3.0, ValueError('math domain error')]
+    """
+    backend = str(backend).lower().strip() 
+    if backend not in ('process', 'thread'): 
+        raise ValueError ("Backend expects 'process' or 'thread'. Got"
+                          f" {backend!r}")
+    items = list(items) 
+    n_workers = min (get_n_jobs (n_jobs ), len(items) or 1 )
+    
+    cfunc = functools.partial (_call_and_catch, func ) 
+    collect = list if callback is None else functools.partial (
+        _collect, callback = callback )
+    if n_workers ==1 : 
+        return collect(map (cfunc, items ))
+    
+    if backend =='thread': 
+        with concurrent.futures.ThreadPoolExecutor(n_workers) as executor: 
+            return collect(executor.map(cfunc, items))
+    
+    # the items are sent by chunks; `func` errors are caught in the 
+    # workers, so a chunk that raises was lost by the pool itself. 
+    chunksize = max (len(items) // (4 * n_workers), 1)
+    starts = range (0, len(items), chunksize )
+    results, done, errors = [None] * len(items), [False] * len(items), [] 
+    try : 
+        with concurrent.futures.ProcessPoolExecutor(n_workers) as executor: 
+            futures = [ executor.submit (
+                _map_chunk, cfunc, items [k: k + chunksize]) for k in starts ]
+            for k, future in zip (starts, futures ): 
+                try : 
+                    chunk = future.result () 
+                except Exception as err : 
+                    errors.append (err ) 
+                    continue 
+                for j, r in enumerate (chunk, k ): 
+                    results [j], done [j] = r, True 
+                    if callback is not None: callback () 
+    except Exception as err : 
+        errors.append (err )
+        
+    missing = [ j for j, d in enumerate (done ) if not d ]
+    if missing: 
+        err = errors [0] if errors else None 
+        warnings.warn (f"Process pool failed: {err}. Fall back to"
+                       " the thread pool.")
+        _logger.warning (f"Process pool failed: {err}.")
+        with concurrent.futures.ThreadPoolExecutor(n_workers) as executor: 
+            for j, r in zip (missing, collect (executor.map (
+                    cfunc, [ items [j] for j in missing ]))): 
+                results [j] = r 
+                
+    return results 
+
+def _collect (results, callback ): 
+    """ Collect the `results` in a list and call `callback` after each. """
+    collected = [] 
+    for r in results : 
+        collected.append (r) 
+        callback () 
+    return collected 
+    
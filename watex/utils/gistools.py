@@ -12,6 +12,8 @@ pyproj is used. Main functions are:
         
     * project_point_ll2utm
     * project_point_utm2ll
+    * project_points_ll2utm
+    * project_points_utm2ll
     
 These can take in a point or an array or list of points to project.
 
@@ -430,9 +432,9 @@ def project_point_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
     # end if
 
     # return different results depending on if lat/lon are iterable
-    projected_point = np.zeros_like(lat, dtype=[('easting', np.float),
-                                                ('northing', np.float),
-                                                ('elev', np.float),
+    projected_point = np.zeros_like(lat, dtype=[('easting', float),
+                                                ('northing', float),
+                                                ('elev', float),
                                                 ('utm_zone', 'U4')])
 
     if(HAS_GDAL):
@@ -647,7 +649,7 @@ def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
         if utm_zone is not None:
             # get zone number and is_northern from utm_zone string
             zone_number = int(utm_zone[0:-1])
-            is_northern = True if utm_zone[-1].lower() > 'n' else False
+            is_northern = True if utm_zone[-1].lower() >= 'n' else False
         else:
             # get centre point and get zone from that
             latc = (np.nanmax(lat) + np.nanmin(lat)) / 2.
@@ -683,6 +685,107 @@ def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
     return projected_point
 # end func
 
+def project_points_utm2ll(easting, northing, utm_zone, datum='WGS84', epsg=None):
+    """
+    Project a list of points that is in UTM coordinates into Lat, Lon at 
+    once. This is the array counterpart of :func:`project_point_utm2ll`. 
+    
+    Parameters
+    ---------------
+    **easting** : array_like
+                easting coordinates in meters
+                
+    **northing** : array_like
+                northing coordinates in meters
+    
+    **utm_zone** : string (##N or ##S)
+                  utm zone in the form of number and North or South
+                  hemisphere, 10S or 03N
+    
+    **datum** : string
+                well known datum ex. WGS84, NAD27, etc.
+                
+    **epsg** : int
+               epsg number defining projection (see 
+               http://spatialreference.org/ref/ for moreinfo)
+               Overrides utm_zone if both are provided
+                    
+    Returns
+    --------------
+    **proj_point**: tuple(lat, lon, zone)
+                    projected points in lat and lon in Datum, as decimal
+                    degrees.
+                    
+    """
+    try:
+        easting = np.asarray(easting, dtype =float)
+    except ValueError:
+        raise GISError("easting is not a float")
+    try:
+        northing = np.asarray(northing, dtype =float)
+    except ValueError:
+        raise GISError("northing is not a float")
+        
+    if np.shape(easting) != np.shape(northing):
+        raise ValueError("easting and northing arrays are of different lengths")
+
+    if HAS_GDAL:
+        # set utm coordinate system
+        utm_cs = osr.SpatialReference()
+        utm_cs.SetWellKnownGeogCS(datum)
+    # end if
+
+    if epsg is not None:
+        if HAS_GDAL:
+            ogrerr = utm_cs.ImportFromEPSG(epsg)
+            if ogrerr != OGRERR_NONE:
+                raise Exception("GDAL/osgeo ogr error code: {}".format(ogrerr))
+        else:
+            import pyproj
+            pp = pyproj.Proj('+init=EPSG:%d'%(epsg))
+        # end if
+    elif isinstance(utm_zone, (str, np.bytes_)):
+        if isinstance(utm_zone, np.bytes_):
+            utm_zone = utm_zone.decode('UTF-8') 
+        try:
+            zone_number = int(utm_zone[0:-1]) 
+            zone_letter = utm_zone[-1]
+        except ValueError:
+            raise ValueError('Zone number {0} is not a number'.format(utm_zone[0:-1]))
+        is_northern = True if zone_letter.lower() >= 'n' else False
+    elif isinstance(utm_zone, int):
+        # std UTM code returned by gdal
+        is_northern = False if utm_zone < 0 else True
+        zone_number = abs(utm_zone)
+    else:
+        raise NotImplementedError(
+            "utm_zone type (%s, %s) not supported"%(type(utm_zone), str(utm_zone)))
+    
+    if epsg is None:
+        if HAS_GDAL:
+            utm_cs.SetUTM(zone_number, is_northern)
+        else:
+            import pyproj
+            projstring = '+proj=utm +zone=%d +%s +datum=%s' % \
+                         (zone_number, 'north' if is_northern else 'south', datum)
+            pp = pyproj.Proj(projstring)
+        # end if
+    # end if
+
+    if HAS_GDAL:
+        ll_cs = utm_cs.CloneGeogCS()
+        utm2ll = osr.CoordinateTransformation(utm_cs, ll_cs).TransformPoints
+        lon, lat, _ = np.array(utm2ll(np.array([easting.ravel(), northing.ravel(), 
+                                  np.zeros(easting.size)]).T)).T
+        lon = lon.reshape (easting.shape); lat = lat.reshape (easting.shape)
+    else:
+        lon, lat = pp(easting, northing, inverse=True)
+    # end if
+
+    # be sure to round out the numbers to remove computing with floats
+    return np.around(lat, 6), np.around(lon, 6), utm_zone 
+
+
 # =================================
 # functions from latlon_utm_conversion.py
 
@@ -741,47 +844,45 @@ def ll_to_utm(reference_ellipsoid, lat, lon):
     converts lat/long to UTM coords.  Equations from USGS Bulletin 1532
     East Longitudes are positive, West longitudes are negative.
     North latitudes are positive, South latitudes are negative
-    Lat and Long are in decimal degrees
+    Lat and Long are in decimal degrees. They can be scalars or arrays of 
+    the same shape, in which case all the points are projected at once. 
     Written by Chuck Gantz- chuck.gantz@globalstar.com
 
     Outputs:
-        UTMzone, easting, northing"""
+        UTMzone, easting, northing. Arrays when `lat` and `lon` are arrays. 
+    """
 
     a = _ellipsoid[reference_ellipsoid][_equatorial_radius]
     ecc_squared = _ellipsoid[reference_ellipsoid][_eccentricity_squared]
     k0 = 0.9996
-    if isinstance (lat, str): 
-        lat = convert_position_str2float(lat) 
-    if isinstance (lon, str): 
-        lon = convert_position_str2float(lon) 
-        
+    is_scalar = np.ndim (lat) ==0 and np.ndim (lon) ==0 
+    lat = _to_decimal_degrees (lat)
+    lon = _to_decimal_degrees (lon) 
+    
     # Make sure the longitude is between -180.00 .. 179.9
-    long_temp = (lon + 180) - int((lon + 180) / 360) * 360 - 180  # -180.00 .. 179.9
+    long_temp = (lon + 180) - np.trunc((lon + 180) / 360) * 360 - 180  # -180.00 .. 179.9
 
     lat_rad = lat * _deg2rad
     long_rad = long_temp * _deg2rad
 
-    zone_number = int((long_temp + 180) / 6) + 1
+    zone_number = np.trunc((long_temp + 180) / 6).astype(int) + 1
 
-    if 56.0 <= lat < 64.0 and 3.0 <= long_temp < 12.0:
-        zone_number = 32
+    zone_number = np.where ((56.0 <= lat) & (lat < 64.0) & (
+        3.0 <= long_temp) & (long_temp < 12.0), 32, zone_number )
 
     # Special zones for Svalbard
-    if 72.0 <= lat < 84.0:
-        if 0.0 <= long_temp < 9.0:
-            zone_number = 31
-        elif 9.0 <= long_temp < 21.0:
-            zone_number = 33
-        elif 21.0 <= long_temp < 33.0:
-            zone_number = 35
-        elif 33.0 <= long_temp < 42.0:
-            zone_number = 37
+    svalbard = (72.0 <= lat) & (lat < 84.0)
+    for lo_min, lo_max, zn in ((0., 9., 31), (9., 21., 33), 
+                               (21., 33., 35), (33., 42., 37)): 
+        zone_number = np.where (svalbard & (lo_min <= long_temp) & (
+            long_temp < lo_max), zn, zone_number )
 
     long_origin = (zone_number - 1) * 6 - 180 + 3  # +3 puts origin in middle of zone
     long_origin_rad = long_origin * _deg2rad
 
     # compute the UTM Zone from the latitude and longitude
-    utm_zone = "%d%c" % (zone_number, _utm_letter_designator(lat))
+    utm_zone = np.char.add (zone_number.astype (str), 
+                            _utm_letter_designators(lat))
 
     ecc_prime_squared = ecc_squared / (1 - ecc_squared)
     N = a / np.sqrt(1 - ecc_squared * np.sin(lat_rad) ** 2)
@@ -822,11 +923,25 @@ def ll_to_utm(reference_ellipsoid, lat, lon):
                                                       - 330 * ecc_prime_squared
                                                       ) * A ** 6 / 720)))
 
-    if lat < 0:
-        utm_northing = utm_northing + 10000000.0  # 10000000 meter offset for southern hemisphere
+    # 10000000 meter offset for southern hemisphere
+    utm_northing = np.where (lat < 0, utm_northing + 10000000.0, utm_northing)
+    
+    if is_scalar: 
+        return str(utm_zone), utm_easting[()], utm_northing[()]
+    
     return utm_zone, utm_easting, utm_northing
 
 
+def _to_decimal_degrees (coord): 
+    """ Convert coordinate(s) given in 'DD:MM:SS' to decimal degrees  array."""
+    coord = np.asarray (coord )
+    if coord.dtype.kind in 'USO': 
+        coord = np.array ([ convert_position_str2float(c) 
+                           if isinstance (c, str ) else c 
+                           for c in coord.ravel() ], dtype = float 
+                          ).reshape(coord.shape )
+    return coord.astype (float )
+
 def _utm_letter_designator(lat):
     # This routine determines the correct UTM letter designator for the given latitude
     # returns 'Z' if latitude is outside the UTM limits of 84N to 80S
@@ -876,12 +991,24 @@ def _utm_letter_designator(lat):
         return 'Z'  # if the Latitude is outside the UTM limits
 
 
+def _utm_letter_designators(lat):
+    # Vectorized version of :func:`_utm_letter_designator`. Returns an array 
+    # of letters with 'Z' where the latitude is outside the UTM limits.
+    lat = np.asarray (lat )
+    letters = np.array (list ('CDEFGHJKLMNPQRSTUVWX'))
+    ix = np.searchsorted (np.arange (-80, 80, 8), lat, side ='right') - 1 
+    return np.where ((lat >= -80) & (lat <= 84), 
+                     letters[np.clip (ix, 0, len(letters) -1 )], 'Z')
+
+
 def utm_to_ll(reference_ellipsoid, northing, easting, zone):
     """
     converts UTM coords to lat/long.  Equations from USGS Bulletin 1532
     East Longitudes are positive, West longitudes are negative.
     North latitudes are positive, South latitudes are negative
-    Lat and Long are in decimal degrees.
+    Lat and Long are in decimal degrees. Northing and easting can be scalars 
+    or arrays of the same shape projected at once, and `zone` a single zone 
+    or one zone per point.
     Written by Chuck Gantz- chuck.gantz@globalstar.com
     Converted to Python by Russ Nelson <nelson@crynwr.com>
 
@@ -893,18 +1020,20 @@ def utm_to_ll(reference_ellipsoid, northing, easting, zone):
     a = _ellipsoid[reference_ellipsoid][_equatorial_radius]
     ecc_squared = _ellipsoid[reference_ellipsoid][_eccentricity_squared]
     e1 = (1 - np.sqrt(1 - ecc_squared)) / (1 + np.sqrt(1 - ecc_squared))
+    is_scalar = np.ndim (northing) ==0 and np.ndim (easting) ==0 
+    
+    x = np.asarray (easting, dtype =float ) - 500000.0  # remove 500,000 meter offset for longitude
+    y = np.asarray (northing, dtype =float )
+    
+    # decode each distinct zone once then broadcast to the points. 
+    zones, inv = np.unique (np.asarray (zone, dtype =str ), return_inverse =True )
+    zone_number = np.array ([int(z[:-1]) for z in zones])[inv].reshape(
+        np.shape (zone))
     # NorthernHemisphere; //1 for northern hemispher, 0 for southern
-
-    x = easting - 500000.0  # remove 500,000 meter offset for longitude
-    y = northing
-
-    zone_letter = zone[-1]
-    zone_number = int(zone[:-1])
-    if zone_letter >= 'N':
-        NorthernHemisphere = 1  # point is in northern hemisphere
-    else:
-        NorthernHemisphere = 0  # point is in southern hemisphere
-        y -= 10000000.0  # remove 10,000,000 meter offset used for southern hemisphere
+    NorthernHemisphere = np.array ([z[-1] >= 'N' for z in zones])[inv].reshape(
+        np.shape (zone))
+    # remove 10,000,000 meter offset used for southern hemisphere
+    y = np.where (NorthernHemisphere, y , y - 10000000.0 )
 
     # +3 puts origin in middle of zone
     long_origin = (zone_number - 1) * 6 - 180 + 3
@@ -918,7 +1047,6 @@ def utm_to_ll(reference_ellipsoid, northing, easting, zone):
     phi1_rad = (mu + (3 * e1 / 2 - 27 * e1 ** 3 / 32) * np.sin(2 * mu)
                 + (21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32) * np.sin(4 * mu)
                 + (151 * e1 ** 3 / 96) * np.sin(6 * mu))
-    phi1 = phi1_rad * _rad2deg
 
     n1 = a / np.sqrt(1 - ecc_squared * np.sin(phi1_rad) ** 2)
     t1 = np.tan(phi1_rad) ** 2
@@ -937,6 +1065,10 @@ def utm_to_ll(reference_ellipsoid, northing, easting, zone):
         5 - 2 * c1 + 28 * t1 - 3 * c1 ** 2 + 8 * ecc_prime_squared + 24 * t1 ** 2)
            * d ** 5 / 120) / np.cos(phi1_rad)
     lon = long_origin + lon * _rad2deg
+    
+    if is_scalar: 
+        return lat[()], lon[()]
+    
     return lat, lon
 
 # http://spatialreference.org/ref/epsg/28350/proj4/
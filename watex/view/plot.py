@@ -440,6 +440,7 @@ class TPlot (BasePlot):
         tensor='res', 
         sites =None, 
         to_log10=False, 
+        zcube=None, 
         ): 
         """ Plot two dimensional tensor. 
          
@@ -460,6 +461,11 @@ class TPlot (BasePlot):
             List of stations/sites names. If given, it must have the same 
             length of the positions in of the EDI data. Must fit the number 
             of 'EDI' succesffully read. 
+            
+        zcube: ndarray of shape (n_stations, n_freq, 2, 2) or \
+            :class:`watex.methods.em.StationStack`, optional 
+            Impedance tensors of the survey to plot instead of the fitted 
+            EDI data. A raw array expects the fitted data frequency. 
 
         Returns 
         -------
@@ -493,15 +499,22 @@ class TPlot (BasePlot):
  
         """
         
-        self.inspect 
+        freqs = getattr (zcube, 'freq', None )
+        if freqs is None: 
+            self.inspect 
         
         assert  str(tensor).lower() in {"res", 'phase'}, (
             "Expect either a resistivity 'res' or 'phase'. Got {tensor!r}")
         tensor =str(tensor).lower() 
         
-        arr2d = self.p_.make2d (out = f'{tensor}{self.component}') 
+        # a StationStack carries its own frequency and 
+        # does not need the fitted data
+        arr2d = self.p_.make2d (out = f'{tensor}{self.component}', 
+                                zcube = zcube ) if freqs is None else (
+                                    zcube.get2d(f'{tensor}{self.component}'))
 
-        return self._make_tensor_utils (arr2d, sites , to_log10, tensor )  
+        return self._make_tensor_utils (arr2d, sites , to_log10, tensor, 
+                                        freqs = freqs )  
     
     @temp2d("Base template for 2D filtered tensors plot.")
     def plot_ctensor2d  (
@@ -578,7 +591,7 @@ class TPlot (BasePlot):
     
     
     def _make_tensor_utils (
-            self, arr2d, sites, to_log10= False, tensor=None ): 
+            self, arr2d, sites, to_log10= False, tensor=None, freqs =None ): 
         """ Make utilities for plotting tensors   
         
         Parameters 
@@ -593,6 +606,8 @@ class TPlot (BasePlot):
             of 'EDI' succesffully read. 
         to_log10: bool, defaut=False, 
             Convert the resistivity data and frequeny in log10.
+        freqs: array-like of shape (n_freq, ), optional 
+            Frequency of `arr2d`. Default is the fitted data frequency. 
             
         Returns 
         -------
@@ -612,7 +627,7 @@ class TPlot (BasePlot):
             raise TypeError (
                 f'Expect a float value not {type(self.distance).__name__!r}')
 
-        freqs = self.p_.freqs_ 
+        freqs = self.p_.freqs_ if freqs is None else freqs 
 
         positions = np.arange(arr2d.shape[1])  * distance
             